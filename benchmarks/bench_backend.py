@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Backend ``tokens_to_code`` with and without pre-rendered endpoint snippets.
+
+``render`` times a compile that renders every token again (what each compile
+cost before snippets were cached); ``cached`` times the same compile served
+from the compiler's snippet cache. Tokens cover the legacy snippets and every
+``sevdo_backend/endpoints/*.py`` module the endpoint registry loads.
+
+Usage:
+    python benchmarks/bench_backend.py [--number N] [--repeat N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Add the parent directory to Python path to import backend_compiler
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sevdo_backend import backend_compiler as bc  # noqa: E402
+
+
+def per_call_us(fn, number: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    compiler = bc.BackendCompiler()
+    tokens = sorted(compiler.mapping)
+    mapping = compiler.mapping
+
+    def render(subset):
+        parts = [bc.CORE_IMPORTS, compiler.registry().shared_code(subset)]
+        parts.extend(bc._render_item(t, mapping[t]) for t in subset)
+        return "".join(parts)
+
+    expected = render(tokens)
+    assert compiler.tokens_to_code(tokens) == expected
+
+    print(f"{len(tokens)} tokens, {len(expected)} characters per compile")
+    print(f"{'':8s} {'render us':>10s} {'cached us':>10s} {'saved':>7s}")
+    for label, subset in (("all", tokens), ("single", tokens[:1])):
+        before = per_call_us(lambda: render(subset), args.number, args.repeat)
+        after = per_call_us(
+            lambda: compiler.tokens_to_code(subset), args.number, args.repeat
+        )
+        print(f"{label:8s} {before:10.1f} {after:10.1f} {1 - after / before:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Import time of generated backends, default core vs lean core.
+
+Compiles the selected tokens (all of them by default) both ways and imports
+each result in fresh interpreters with ``profile_import``. The generated app
+needs its own dependencies (FastAPI, SQLAlchemy, passlib, python-dotenv)
+installed in this interpreter; a failed import is reported, not timed.
+
+Usage:
+    python benchmarks/bench_backend_import.py [TOKEN ...] [--runs N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to Python path to import backend_compiler
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sevdo_backend import backend_compiler as bc  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("tokens", nargs="*")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    compiler = bc.BackendCompiler()
+    tokens = args.tokens or sorted(compiler.mapping)
+    print(f"{len(tokens)} tokens: {' '.join(tokens)}")
+    print(f"{'':8s} {'bytes':>8s} {'wall ms':>9s} {'import ms':>10s}  slowest imports")
+    for label, lean in (("default", False), ("lean", True)):
+        code = compiler.tokens_to_code(tokens, lean=lean)
+        profile = bc.profile_import(code, runs=args.runs)
+        if not profile["ok"]:
+            print(f"{label:8s} {len(code):8d}  failed: {profile['error']}")
+            continue
+        slowest = ", ".join(
+            f"{item['module']} {item['ms']:.1f}" for item in profile["slowest"][:4]
+        )
+        print(
+            f"{label:8s} {len(code):8d} {profile['wall_ms']:9.1f} "
+            f"{profile['import_ms']:10.1f}  {slowest}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Batch compilation benchmark: thread pool vs process pool.
+
+Copies every templates/*/frontend/*.s page N times into a temp directory and
+compiles the whole catalogue through /api/fe-translate/to-s-batch with
+``executor="thread"`` and ``executor="process"``. Caches are bypassed so
+every job does the full parse and render. The process pool is warmed with
+one small batch first, as it would be in a long-running service.
+
+Usage:
+    python benchmarks/bench_batch.py [--copies N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the parent directory to Python path to import frontend_compiler
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import httpx  # noqa: E402
+
+from sevdo_frontend import frontend_compiler as fc  # noqa: E402
+
+
+def build_jobs(workdir: Path, copies: int):
+    jobs = []
+    for src in sorted(ROOT.glob("templates/*/frontend/*.s")):
+        content = src.read_text(encoding="utf-8")
+        try:
+            fc.dsl_to_jsx(content)
+        except fc.ParseError:
+            continue
+        for i in range(copies):
+            inp = workdir / f"{src.parent.parent.name}_{src.stem}_{i}.s"
+            inp.write_text(content, encoding="utf-8")
+            jobs.append(
+                {
+                    "input_path": str(inp),
+                    "output_path": str(inp.with_suffix(".jsx")),
+                    "use_cache": False,
+                }
+            )
+    return jobs
+
+
+async def run(jobs, executor: str) -> float:
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+        if executor == "process":
+            await client.post(
+                "/api/fe-translate/to-s-batch",
+                json={"jobs": jobs[: fc.BATCH_PROCESS_WORKERS], "executor": executor},
+            )
+        t0 = time.perf_counter()
+        resp = await client.post(
+            "/api/fe-translate/to-s-batch", json={"jobs": jobs, "executor": executor}
+        )
+        elapsed = time.perf_counter() - t0
+    totals = resp.json()["totals"]
+    assert totals["failed"] == 0, totals
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    fc.BATCH_PROCESS_WORKERS = args.workers
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = build_jobs(Path(tmp), args.copies)
+        print(f"{len(jobs)} jobs, {args.workers} process workers")
+        try:
+            for executor in ("thread", "process"):
+                elapsed = asyncio.run(run(jobs, executor))
+                print(
+                    f"{executor:8s} {elapsed * 1e3:9.1f} ms"
+                    f"  ({len(jobs) / elapsed:7.1f} jobs/s)"
+                )
+        finally:
+            fc.shutdown_batch_pool()
+
+
+if __name__ == "__main__":
+    main()
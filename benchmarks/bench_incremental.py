@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Incremental recompilation benchmark.
+
+Builds pages of N top-level statements, then simulates keystroke-level
+edits to one line and compares ``IncrementalCompiler.compile`` against a
+full ``dsl_to_jsx``. Two pages are measured: one made of the statements
+in templates/*/frontend/*.s (prefab heavy, ~1M characters of JSX for 500
+statements) and one of small built-in statements.
+
+Usage:
+    python benchmarks/bench_incremental.py [--statements N] [--edits N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the parent directory to Python path to import frontend_compiler
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sevdo_frontend.frontend_compiler import (  # noqa: E402
+    IncrementalCompiler,
+    dsl_to_jsx,
+    parse_dsl,
+)
+
+
+def template_statements():
+    """Source text of every top-level statement in templates/*/frontend/*.s."""
+    out = []
+    for page in sorted(ROOT.glob("templates/*/frontend/*.s")):
+        source = page.read_text(encoding="utf-8")
+        out.extend(source[n.start: n.end] for n in parse_dsl(source))
+    return out
+
+
+def builtin_statements():
+    return [
+        "t(Paragraph text for the page)",
+        "c(t(Item) f(i(name,label=Name) b(Save){onClick=save})){class=mt-2}",
+        "img(logo.png){alt=Logo}",
+        "sel(One,Two,Three)",
+        "n(Home,About,Contact)",
+    ]
+
+
+def build_page(statements: int, pool=None) -> list:
+    pool = pool or template_statements()
+    return [pool[i % len(pool)] for i in range(statements)]
+
+
+def run(title, lines, edits):
+    compiler = IncrementalCompiler(component_name="BenchPage")
+    compiler.compile("\n".join(lines))
+
+    incremental = []
+    full = []
+    for i in range(edits):
+        # Type one character into a heading somewhere in the page
+        idx = (i * 37) % len(lines)
+        lines[idx] = f"t(Edited paragraph {'x' * (i % 8)})"
+        source = "\n".join(lines)
+
+        t0 = time.perf_counter()
+        got = compiler.compile(source)
+        incremental.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        expected = dsl_to_jsx(source, component_name="BenchPage")
+        full.append(time.perf_counter() - t0)
+        assert got == expected
+
+    incremental.sort()
+    full.sort()
+    median = len(incremental) // 2
+    print(f"\n{title}: {len(lines)} statements, {len(got)} chars of JSX")
+    print(f"full compile   median {full[median] * 1e3:8.3f} ms")
+    print(f"incremental    median {incremental[median] * 1e3:8.3f} ms")
+    print(f"               p95    {incremental[int(len(incremental) * 0.95)] * 1e3:8.3f} ms")
+    print(f"compiler stats: {compiler.stats}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statements", type=int, default=500)
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    run("Template statements", build_page(args.statements), args.edits)
+    run(
+        "Built-in statements",
+        build_page(args.statements, builtin_statements()),
+        args.edits,
+    )
+
+
+if __name__ == "__main__":
+    main()
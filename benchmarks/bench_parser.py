@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Parser scaling benchmark for the frontend DSL.
+
+Times ``parse_dsl`` on synthetic pages that grow in nesting depth and in
+statement count, and prints the per-unit cost together with the fitted
+log-log slope. A slope close to 1.0 means linear scaling. Also reports the
+memory retained per AST node.
+
+Usage:
+    python benchmarks/bench_parser.py [--repeat N]
+"""
+
+import argparse
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add the parent directory to Python path to import frontend_compiler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sevdo_frontend.frontend_compiler import parse_dsl  # noqa: E402
+
+
+def nested_page(depth: int) -> str:
+    """A single statement nested ``depth`` containers deep."""
+    return "c(\n" * depth + "t(Deep text)\n" + ")\n" * depth
+
+
+def flat_page(statements: int) -> str:
+    """``statements`` top-level lines mixing leaves, props and small containers."""
+    lines = []
+    for i in range(statements):
+        if i % 3 == 0:
+            lines.append(f"h(Section {i})")
+        elif i % 3 == 1:
+            lines.append(f"b(Go {i}){{onClick=go{i},class=mt-2}}")
+        else:
+            lines.append(f"c(t(Item {i}) f(i(name,label=Name) b(Save)))")
+    return "\n".join(lines) + "\n"
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def slope(xs, ys) -> float:
+    lx = [math.log(x) for x in xs]
+    ly = [math.log(y) for y in ys]
+    mx = sum(lx) / len(lx)
+    my = sum(ly) / len(ly)
+    num = sum((a - mx) * (b - my) for a, b in zip(lx, ly))
+    den = sum((a - mx) ** 2 for a in lx)
+    return num / den
+
+
+def run_series(title, sizes, make_source, repeat):
+    print(f"\n{title}")
+    print(f"{'size':>8} {'bytes':>10} {'ms':>10} {'us/unit':>10}")
+    times = []
+    for n in sizes:
+        src = make_source(n)
+        elapsed = best_of(lambda: parse_dsl(src), repeat)
+        times.append(elapsed)
+        print(f"{n:>8} {len(src):>10} {elapsed * 1e3:>10.3f} {elapsed * 1e6 / n:>10.3f}")
+    print(f"log-log slope: {slope(sizes, times):.2f}")
+
+
+def count_nodes(nodes) -> int:
+    return sum(1 + count_nodes(n.children) for n in nodes)
+
+
+def memory_per_node(statements: int):
+    src = flat_page(statements)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = parse_dsl(src)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    total = count_nodes(nodes)
+    print("\nMemory")
+    print(f"nodes: {total}, retained: {retained} bytes, {retained / total:.1f} bytes/node")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Stay well under the interpreter recursion limit for the depth series
+    run_series(
+        "Nesting depth", [25, 50, 100, 200, 400], nested_page, args.repeat
+    )
+    run_series(
+        "Statement count", [250, 500, 1000, 2000, 4000], flat_page, args.repeat
+    )
+    memory_per_node(2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Frontend compiler benchmark suite.
+
+Compiles every ``templates/*/frontend/*.s`` page plus synthetic pages that
+grow in statement count and nesting depth, and reports per case:
+
+- ``parse_ms``   ``parse_dsl`` alone
+- ``render_ms``  rendering the parsed nodes, prefab memo cleared first
+- ``warm_ms``    rendering again with the prefab memo warm
+- ``hit_ms``     a ``dsl_to_jsx`` cache hit (key digest plus lookup)
+- ``peak_kib``   peak memory allocated by one cold ``dsl_to_jsx``
+
+Times are per call, the best of ``--repeat`` samples timed the way
+``timeit`` does. ``--save`` writes the results as
+JSON (by default to ``benchmarks/results/baseline.json``, which is not
+committed: timings only compare on the same machine). ``--compare`` checks a
+run against a saved baseline and exits with status 1 when any time or
+memory figure is more than ``--threshold`` times its baseline value. Times
+are compared relative to a fixed pure-Python calibration loop timed right
+before each case (``cal_ms``), so a machine that is slower right now (CPU
+throttling, a busy neighbour) does not read as a regression.
+
+Usage:
+    python benchmarks/bench_suite.py [--repeat N] [--filter TEXT]
+    python benchmarks/bench_suite.py --save
+    python benchmarks/bench_suite.py --compare [--threshold 1.25]
+
+The same cases run under pytest-benchmark with
+``pytest benchmarks/test_bench_suite.py``.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add the parent directory to Python path to import frontend_compiler
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sevdo_frontend import frontend_compiler as fc  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).parent / "results" / "baseline.json"
+BASELINE_FORMAT = 1
+# Metrics compared against the baseline; hit_ms is too small to be stable
+COMPARED = ("parse_ms", "render_ms", "warm_ms", "peak_kib")
+# Differences below this many ms (or KiB) are noise, whatever the ratio
+ABSOLUTE_SLACK = 0.05
+# Shortest timed sample; quick cases loop until a sample lasts this long
+MIN_SAMPLE_S = 0.02
+
+
+def flat_page(statements: int) -> str:
+    """``statements`` top-level lines mixing built-ins, prefabs and containers."""
+    lines = []
+    for i in range(statements):
+        kind = i % 4
+        if kind == 0:
+            lines.append(f"h(Section {i})")
+        elif kind == 1:
+            lines.append(f"t(Paragraph {i} with some text)")
+        elif kind == 2:
+            lines.append(f"c(t(Item {i}) f(i(name,label=Name) b(Save){{onClick=save{i}}}))")
+        else:
+            lines.append(f"n(Home,Blog,About {i})")
+    return "\n".join(lines) + "\n"
+
+
+def nested_page(depth: int) -> str:
+    """A single statement nested ``depth`` containers deep."""
+    return "c(\n" * depth + "t(Deep text)\n" + ")\n" * depth
+
+
+def cases() -> List[Tuple[str, str]]:
+    """(name, DSL source) for every benchmark case."""
+    found = []
+    for path in sorted(ROOT.glob("templates/*/frontend/*.s")):
+        source = path.read_text(encoding="utf-8")
+        try:
+            fc.check_tokens(fc.parse_dsl(source))
+        except fc.ParseError:
+            # Pages using tokens that no longer exist are not benchmarks
+            continue
+        found.append((f"template/{path.parent.parent.name}/{path.stem}", source))
+    for n in (250, 1000, 4000):
+        found.append((f"flat/{n}", flat_page(n)))
+    # Stay well under the parser's recursion limit
+    for depth in (50, 200, 800):
+        found.append((f"nested/{depth}", nested_page(depth)))
+    return found
+
+
+def render(nodes) -> str:
+    return "".join(fc._iter_component(nodes, True, "Bench"))
+
+
+def best_of(
+    fn: Callable[[], object], repeat: int, setup: Optional[Callable[[], object]] = None
+) -> float:
+    """Best per-call wall time of ``fn`` in ms.
+
+    Like ``timeit``, each sample loops enough calls to last at least
+    ``MIN_SAMPLE_S`` and the garbage collector is paused. ``setup`` runs
+    before every call and is timed with it.
+    """
+
+    def sample(number: int) -> float:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            if setup is not None:
+                setup()
+            fn()
+        return time.perf_counter() - t0
+
+    gc.collect()
+    gc.disable()
+    try:
+        number = 1
+        while (elapsed := sample(number)) < MIN_SAMPLE_S:
+            number *= 2 if elapsed * 10 > MIN_SAMPLE_S else 10
+        best = min([elapsed] + [sample(number) for _ in range(repeat - 1)])
+    finally:
+        gc.enable()
+    return best / number * 1e3
+
+
+def peak_kib(fn: Callable[[], object]) -> float:
+    """Peak memory allocated while ``fn`` runs, in KiB."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(source: str, repeat: int) -> Dict[str, float]:
+    nodes = fc.parse_dsl(source)
+    key = fc.dsl_cache_key(source, True, "Bench")
+    jsx = render(nodes)
+    cache = fc._LRUCache(1, 3600, fc.CACHE_MAX_BYTES)
+    cache.set(key, jsx)
+
+    def hit():
+        return cache.get(fc.dsl_cache_key(source, True, "Bench"))
+
+    def cold():
+        fc.PREFAB_MEMO.clear()
+        return fc.dsl_to_jsx(source, True, "Bench")
+
+    return {
+        "bytes": len(source),
+        "cal_ms": calibration_ms(),
+        "parse_ms": best_of(lambda: fc.parse_dsl(source), repeat),
+        "render_ms": best_of(lambda: render(nodes), repeat, fc.PREFAB_MEMO.clear),
+        "warm_ms": best_of(lambda: render(nodes), repeat),
+        "hit_ms": best_of(hit, repeat),
+        "peak_kib": peak_kib(cold),
+    }
+
+
+def calibration_ms() -> float:
+    """Time of a fixed workload, used to normalise times across runs."""
+
+    def work():
+        parts = []
+        for i in range(20000):
+            parts.append(f"<p>{i}</p>".strip())
+        return "".join(parts)
+
+    return best_of(work, 5)
+
+
+def environment() -> Dict[str, object]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "registry_version": fc.PREFAB_REGISTRY_VERSION,
+    }
+
+
+def regressions(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float):
+    """(case, metric, baseline value, new value) for every regression.
+
+    Baseline times are first scaled by how much slower the calibration loop
+    ran next to this case now than it did for the baseline.
+    """
+    found = []
+    for name, metrics in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        speed = metrics["cal_ms"] / old["cal_ms"]
+        for metric in COMPARED:
+            before, after = old.get(metric), metrics.get(metric)
+            if before is None or after is None:
+                continue
+            if metric.endswith("_ms"):
+                before *= speed
+            if after > before * threshold and after - before > ABSOLUTE_SLACK:
+                found.append((name, metric, before, after))
+    return found
+
+
+def print_table(results: Dict[str, dict]):
+    header = (
+        f"{'case':40s} {'bytes':>8s} {'parse ms':>9s} {'render ms':>10s} "
+        f"{'warm ms':>8s} {'hit ms':>7s} {'peak KiB':>9s}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, m in results.items():
+        print(
+            f"{name:40s} {m['bytes']:>8d} {m['parse_ms']:>9.3f} {m['render_ms']:>10.3f} "
+            f"{m['warm_ms']:>8.3f} {m['hit_ms']:>7.3f} {m['peak_kib']:>9.1f}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only cases containing TEXT")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, type=Path)
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, type=Path)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    env = environment()
+    results = {
+        name: measure(source, args.repeat)
+        for name, source in cases()
+        if args.filter in name
+    }
+    print_table(results)
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("format") != BASELINE_FORMAT:
+            print(f"\n{args.compare}: unknown baseline format, re-save it")
+            return 2
+        found = regressions(results, baseline["cases"], args.threshold)
+        print(f"\nCompared with {args.compare} (threshold x{args.threshold}):")
+        for name, metric, before, after in found:
+            print(f"  REGRESSION {name} {metric}: {before:.3f} -> {after:.3f}")
+        if not found:
+            print("  no regressions")
+        status = 1 if found else 0
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"format": BASELINE_FORMAT, "env": env, "cases": results}
+        args.save.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        print(f"\nSaved {len(results)} cases to {args.save}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
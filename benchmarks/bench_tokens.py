@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Per-node render cost of every frontend token.
+
+For built-in tokens, times ``BuiltinRenderer.render`` on args the parser has
+already parsed (what rendering a parsed page costs per node) next to parsing
+and rendering on every call (what ``_jsx_for_token`` does for raw args).
+Built-ins are timed directly, even where a prefab overrides the token.
+Prefab tokens are timed through ``_jsx_for_node`` with their default props,
+cold (memo cleared before each call) and warm.
+
+Usage:
+    python benchmarks/bench_tokens.py [--number N] [--repeat N] [--prefabs]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Add the parent directory to Python path to import frontend_compiler
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sevdo_frontend import frontend_compiler as fc  # noqa: E402
+
+SAMPLES = {
+    "h": "h(Welcome to the site)",
+    "t": "t(Some paragraph text for the page)",
+    "i": "i(email, label=Email){label=Your email}",
+    "b": "b(Save changes){onClick=save}",
+    "c": "c{class=mt-4 items-center}",
+    "f": "f",
+    "n": "n(Home, Blog, About, Contact)",
+    "img": "img(src=logo.png){alt=Logo}",
+    "sel": "sel(Small, Medium, Large, Extra large)",
+}
+
+
+def per_call_ns(fn, number: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--prefabs", action="store_true", help="also time prefabs")
+    args = parser.parse_args(argv)
+
+    print(f"{'token':8s} {'render ns':>10s} {'parse+render ns':>16s}")
+    for token, sample in SAMPLES.items():
+        (node,) = fc.parse_dsl(sample)
+        builtin = fc.BUILTIN_RENDERERS[token]
+        parsed, props, raw = node.parsed, node.props, node.args
+        render = per_call_ns(
+            lambda: builtin.render(parsed, props), args.number, args.repeat
+        )
+        full = per_call_ns(
+            lambda: builtin.render(builtin.parse(raw), props), args.number, args.repeat
+        )
+        print(f"{token:8s} {render:10.0f} {full:16.0f}")
+
+    if args.prefabs:
+        fc.preload_prefabs()
+        number = max(1, args.number // 100)
+        print(f"\n{'prefab':8s} {'cold ns':>10s} {'warm ns':>10s}")
+        for token in sorted(fc.COMPONENT_REGISTRY):
+            (node,) = fc.parse_dsl(token)
+
+            def cold():
+                fc.PREFAB_MEMO.clear()
+                fc._jsx_for_node(node)
+
+            cold_ns = per_call_ns(cold, number, args.repeat)
+            warm_ns = per_call_ns(lambda: fc._jsx_for_node(node), number, args.repeat)
+            print(f"{token:8s} {cold_ns:10.0f} {warm_ns:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
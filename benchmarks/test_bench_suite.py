@@ -0,0 +1,41 @@
+"""pytest-benchmark entry point for the cases in bench_suite.py.
+
+    pytest benchmarks/test_bench_suite.py --benchmark-autosave
+    pytest benchmarks/test_bench_suite.py --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import bench_suite  # noqa: E402
+from bench_suite import fc  # noqa: E402
+
+CASES = bench_suite.cases()
+IDS = [name for name, _ in CASES]
+
+
+@pytest.mark.parametrize("name,source", CASES, ids=IDS)
+def test_parse(benchmark, name, source):
+    benchmark.extra_info["bytes"] = len(source)
+    benchmark(fc.parse_dsl, source)
+
+
+@pytest.mark.parametrize("name,source", CASES, ids=IDS)
+def test_render_cold(benchmark, name, source):
+    nodes = fc.parse_dsl(source)
+    benchmark.pedantic(
+        bench_suite.render, args=(nodes,), setup=fc.PREFAB_MEMO.clear, rounds=20
+    )
+
+
+@pytest.mark.parametrize("name,source", CASES, ids=IDS)
+def test_render_warm(benchmark, name, source):
+    nodes = fc.parse_dsl(source)
+    bench_suite.render(nodes)
+    benchmark(bench_suite.render, nodes)
@@ -30,7 +30,11 @@ from watchdog.events import FileSystemEventHandler
 # Add the parent directory to Python path to import frontend_compiler
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sevdo_frontend.frontend_compiler import dsl_to_jsx, load_prefabs
+from sevdo_frontend.frontend_compiler import (
+    IncrementalCompiler,
+    dsl_to_jsx,
+    load_prefabs,
+)
 
 # Configuration
 INPUT_DIR = Path(__file__).parent / "input_files"
@@ -46,6 +50,9 @@ TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
 # Global state for file watching
 file_change_connections: List[WebSocket] = []
 observer: Optional[Observer] = None
+# One incremental compiler per watched file: an edit only re-renders the
+# statements that changed
+incremental_compilers: Dict[Path, IncrementalCompiler] = {}
 
 
 class FileChangeHandler(FileSystemEventHandler):
@@ -84,9 +91,15 @@ def compile_file(input_path: Path):
         )
 
         # Compile to JSX
-        jsx_content = dsl_to_jsx(
-            dsl_content, include_imports=True, component_name=component_name
-        )
+        # The watcher thread and /compile share one compiler per file;
+        # setdefault keeps racing first calls on the same instance
+        compiler = incremental_compilers.get(input_path)
+        if compiler is None:
+            compiler = incremental_compilers.setdefault(
+                input_path,
+                IncrementalCompiler(include_imports=True, component_name=component_name),
+            )
+        jsx_content = compiler.compile(dsl_content)
 
         # Write to output file
         output_path = OUTPUT_DIR / f"{input_path.stem}.jsx"
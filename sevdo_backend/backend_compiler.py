@@ -1,20 +1,30 @@
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import AsyncIterator, Callable, Collection, Dict, List, Optional, Tuple
+from types import MappingProxyType
 from pathlib import Path
+import io
 import os
+import re
+import subprocess
+import sys
+import tempfile
 import threading
-from time import time
+import tokenize
+from time import monotonic, perf_counter, time
 from hashlib import sha256
+import asyncio
 import concurrent.futures as cf
+from contextlib import aclosing
+
+import orjson
+
+from sevdo_common.disk_cache import DiskCache, disk_cache_from_env
+from sevdo_common.output_writer import write_if_changed
 
 # Import endpoint registry
-from sevdo_backend.endpoints import (
-    load_all_endpoints,
-    get_endpoint_module,
-    list_available_tokens,
-)
+from sevdo_backend.endpoints import REGISTRY, EndpointRegistry
 
 # Core imports that are always included
 CORE_IMPORTS = """
@@ -214,73 +224,502 @@ def revoke_session_endpoint(session_id: str, current_user: UserDB = Depends(get_
 }
 
 
-class BackendCompiler:
-    def __init__(self):
-        # Load all endpoint modules
-        load_all_endpoints()
+# Distinct token combinations whose shared code a snapshot keeps
+SHARED_CODE_MAXSIZE = 1024
 
-        # Combine legacy mapping with dynamic endpoints
-        self.mapping = legacy_mapping.copy()
+# @app.<method>("<path>", ...) route decorators
+_ROUTE_RE = re.compile(
+    r"""@app\.(get|post|put|patch|delete|head|options)\(\s*(["'])(.*?)\2"""
+)
+# Identifiers, to find which definitions a definition refers to
+_NAME_RE = re.compile(r"[A-Za-z_]\w*")
+_CORE_IMPORT_LINES = frozenset(line.strip() for line in CORE_IMPORTS.splitlines())
+
+# Lean emission: the same core set up for a faster cold start. Tables are
+# created by a lifespan hook once every model is defined, passlib is only
+# imported when a password is first hashed or checked, and imported names
+# the generated code never uses are dropped.
+_LEAN_LIFESPAN = """
+# Create tables when the app starts, once every model is defined
+@asynccontextmanager
+async def lifespan(app):
+    Base.metadata.create_all(bind=engine)
+    yield
 
-        # Add dynamically loaded endpoints - NEW ENDPOINTS OVERRIDE LEGACY
-        available_tokens = list_available_tokens()
-        for token in available_tokens:
-            module = get_endpoint_module(token)
-            if module and hasattr(module, "render_endpoint"):
-                # Let new endpoints override legacy
-                self.mapping[token] = module
+"""
 
-        # Build index of (method, path) -> token for reverse lookup
-        self._route_index = self._build_route_index()
+_LAZY_PWD_CONTEXT = '''class _LazyCryptContext:
+    """Imports passlib and builds the CryptContext on first use."""
+
+    _context = None
+
+    def __getattr__(self, name):
+        if _LazyCryptContext._context is None:
+            from passlib.context import CryptContext
+            _LazyCryptContext._context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        return getattr(_LazyCryptContext._context, name)
+
+pwd_context = _LazyCryptContext()
+'''
+
+_CORE_HEADER, _CORE_BODY = CORE_IMPORTS.split("\n# FastAPI app\n", 1)
+_LEAN_CORE_BODY = _LEAN_LIFESPAN + "# FastAPI app\n" + (
+    _CORE_BODY.replace(
+        "app = FastAPI(default_response_class=ORJSONResponse)",
+        "app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)",
+    )
+    .replace(
+        "# Auto-create tables on startup (dev convenience)\n"
+        "Base.metadata.create_all(bind=engine)\n\n",
+        "",
+    )
+    .replace(
+        'pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")\n',
+        _LAZY_PWD_CONTEXT,
+    )
+)
+_LEAN_HEADER = [
+    line
+    for line in _CORE_HEADER.strip().splitlines()
+    if not line.startswith("from passlib")
+] + ["from contextlib import asynccontextmanager"]
+_IMPORT_RE = re.compile(r"^(from \S+ import |import )(.+)$")
 
-    def _build_route_index(self):
-        index = {}
-        for token, snippet_or_module in self.mapping.items():
-            if isinstance(snippet_or_module, str):
-                # Legacy string-based mapping
-                decorator_start = snippet_or_module.find("@app.")
-                if decorator_start == -1:
+
+def _used_names(code: str) -> set:
+    """Identifiers in ``code`` outside comments; strings count, to be safe."""
+    names = set()
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(code).readline):
+            if tok.type == tokenize.NAME:
+                names.add(tok.string)
+            elif tok.type != tokenize.COMMENT:
+                names.update(_NAME_RE.findall(tok.string))
+    except (tokenize.TokenError, SyntaxError):
+        return set(_NAME_RE.findall(code))
+    return names
+
+
+def lean_core_imports(code: str) -> str:
+    """Lean replacement for CORE_IMPORTS ahead of ``code``.
+
+    Each core import line keeps only the names the core or ``code`` refer
+    to; lines left with none are dropped.
+    """
+    used = _LEAN_CORE_NAMES | _used_names(code)
+    lines = []
+    for line in _LEAN_HEADER:
+        m = _IMPORT_RE.match(line)
+        if m is None:
+            lines.append(line)
+            continue
+        # "import a.b" binds "a" and "x as y" binds "y"
+        names = [
+            name.strip()
+            for name in m.group(2).split(",")
+            if name.split()[-1].split(".")[0] in used
+        ]
+        if names:
+            lines.append(m.group(1) + ", ".join(names))
+    return "\n" + "\n".join(lines) + "\n" + _LEAN_CORE_BODY
+
+
+_LEAN_CORE_NAMES = _used_names(_LEAN_CORE_BODY)
+
+
+def _token_version(item) -> str:
+    """Digest of what a token renders from: its snippet or its module source."""
+    if isinstance(item, str):
+        data = item.encode("utf-8")
+    else:
+        try:
+            data = Path(item.__file__).read_bytes()
+        except (AttributeError, OSError, TypeError):
+            data = repr(item).encode("utf-8")
+    return sha256(data).hexdigest()[:16]
+
+
+def _render_item(token, item, args=None, props=None) -> str:
+    """Code for one mapping entry plus its separator; "" if rendering fails."""
+    if isinstance(item, str):
+        # Legacy string-based endpoint
+        return item + "\n\n"
+    # Module-based endpoint
+    try:
+        if args is None and props is None:
+            code = item.render_endpoint()
+        else:
+            code = item.render_endpoint(args, props)
+    except Exception as e:
+        print(f"Error rendering endpoint {token}: {e}")
+        return ""
+    return code + "\n\n"
+
+
+class _Registry:
+    """Immutable snapshot of a compiler's endpoints and everything derived.
+
+    Holds the token mapping, the default-rendered snippets, the shared
+    definitions endpoint modules declare, per-token source digests and the
+    route index. Apart from the ``custom`` render cache, a snapshot is never
+    mutated after it is built, so any number of threads can read it without
+    locks; the compiler swaps in a new one when endpoints change. Snippets
+    for tokens that did not change are carried over from the previous
+    snapshot.
+    """
+
+    __slots__ = (
+        "mapping",
+        "snippets",
+        "sources",
+        "definitions",
+        "rank",
+        "needs",
+        "imports",
+        "versions",
+        "version",
+        "routes",
+        "routes_version",
+        "custom",
+        "shared",
+    )
+
+    def __init__(self, mapping, previous=None, stale=()):
+        self.mapping = MappingProxyType(dict(mapping))
+        keep = previous is not None
+        snippets = {}
+        sources = {}
+        for token, item in self.mapping.items():
+            if keep and token not in stale and token in previous.sources:
+                sources[token] = previous.sources[token]
+                snippet = previous.snippets.get(token)
+            else:
+                sources[token] = _token_version(item)
+                snippet = _render_item(token, item)
+            # Failed renders are not kept, so they are retried (and reported)
+            if snippet:
+                snippets[token] = snippet
+        # Default snippets, each followed by its blank-line separator, so
+        # compiling is mostly a join
+        self.snippets = MappingProxyType(snippets)
+        # Digest of each token's own source (legacy snippet or module file)
+        self.sources = MappingProxyType(sources)
+        owners = self._resolve_definitions()
+        # Per-token digests covering the token's source and the sources of
+        # the definitions it pulls in; cache keys only depend on these
+        versions = {}
+        for token, source in sources.items():
+            providers = sorted({owners[n] for n in self.needs.get(token, ())} - {token})
+            if providers:
+                raw = "|".join([source] + [f"{p}={sources[p]}" for p in providers])
+                source = sha256(raw.encode("utf-8")).hexdigest()[:16]
+            versions[token] = source
+        self.versions = MappingProxyType(versions)
+        self.version = _compute_mapping_version(versions)
+        self.routes = MappingProxyType(self._build_route_index())
+        # Decompile results only depend on the routes, not on endpoint bodies
+        self.routes_version = sha256(
+            repr(sorted(self.routes.items())).encode("utf-8")
+        ).hexdigest()
+        # Renders with explicit args/props; a cache, so racing writers only
+        # ever store equal values
+        self.custom: Dict[tuple, str] = {}
+        # shared_code results by (tokens with definitions or imports, flag)
+        # and lean core imports by ("lean", token set)
+        self.shared: Dict[tuple, str] = {}
+
+    def _resolve_definitions(self):
+        """Index the DEFINITIONS, REQUIRES and IMPORTS of endpoint modules.
+
+        Every definition gets a rank such that anything it refers to ranks
+        lower, and every token gets the ranked names its code needs (its own
+        definitions, what it requires, and what those refer to) plus its
+        import lines. Returns definition name -> providing token.
+        """
+        owners = {}
+        code = {}
+        for token, item in self.mapping.items():
+            if isinstance(item, str):
+                continue
+            for name, source in (getattr(item, "DEFINITIONS", None) or {}).items():
+                source = source.strip() + "\n\n"
+                if name in owners:
+                    # The first token (in mapping order) providing a name owns it
+                    if code[name] != source:
+                        print(
+                            f"Warning: {token} redefines {name}; "
+                            f"keeping the definition from {owners[name]}"
+                        )
                     continue
-                line_end = snippet_or_module.find("\n", decorator_start)
-                line = snippet_or_module[
-                    decorator_start : line_end if line_end != -1 else None
-                ]
-                try:
-                    after_app = line.split("@app.", 1)[1]
-                    method = after_app.split("(", 1)[0].strip()
-                    first_quote = line.find('"', line.find("(") + 1)
-                    second_quote = line.find('"', first_quote + 1)
-                    path = line[first_quote + 1 : second_quote]
-                    index[(method.upper(), path)] = token
-                except Exception:
+                owners[name] = token
+                code[name] = source
+
+        refs = {
+            name: [n for n in dict.fromkeys(_NAME_RE.findall(source)) if n in code and n != name]
+            for name, source in code.items()
+        }
+        order = []
+        state = {}
+
+        def visit(name):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                print(f"Warning: definition cycle through {name}")
+                return
+            state[name] = "visiting"
+            for ref in refs[name]:
+                visit(ref)
+            state[name] = "done"
+            order.append(name)
+
+        for name in code:
+            visit(name)
+        rank = {name: i for i, name in enumerate(order)}
+
+        needs = {}
+        imports = {}
+        for token, item in self.mapping.items():
+            if isinstance(item, str):
+                continue
+            wanted = list(getattr(item, "DEFINITIONS", None) or ())
+            wanted.extend(getattr(item, "REQUIRES", None) or ())
+            closure = set()
+            while wanted:
+                name = wanted.pop()
+                if name in closure:
                     continue
-            # For module-based endpoints, we'd need to extract path info from the module
-            # This could be added later if needed
+                if name not in code:
+                    print(f"Warning: {token} requires unknown definition {name}")
+                    continue
+                closure.add(name)
+                wanted.extend(refs[name])
+            if closure:
+                needs[token] = tuple(sorted(closure, key=rank.__getitem__))
+            # Import lines of the token and of the modules providing what it uses
+            lines = list(getattr(item, "IMPORTS", None) or ())
+            for provider in dict.fromkeys(owners[n] for n in needs.get(token, ())):
+                lines.extend(getattr(self.mapping[provider], "IMPORTS", None) or ())
+            if lines:
+                imports[token] = tuple(dict.fromkeys(line.strip() for line in lines))
+
+        # Definition name -> source followed by its blank-line separator
+        self.definitions = MappingProxyType(code)
+        self.rank = MappingProxyType(rank)
+        self.needs = MappingProxyType(needs)
+        self.imports = MappingProxyType(imports)
+        return owners
+
+    def _build_route_index(self):
+        """(METHOD, path) -> token for every route any snippet declares.
+
+        Built from the rendered snippets, so module-based endpoints are
+        covered as well as legacy ones. The first token declaring a route
+        owns it.
+        """
+        index = {}
+        for token in self.mapping:
+            for m in _ROUTE_RE.finditer(self.render_snippet(token)):
+                index.setdefault((m.group(1).upper(), m.group(3)), token)
         return index
 
-    def tokens_to_code(self, tokens, include_imports=True):
-        tokens = list(tokens)
-        parts = []
+    def render_snippet(self, token, args=None, props=None):
+        if args is None and props is None:
+            snippet = self.snippets.get(token)
+            if snippet is not None:
+                return snippet
+            item = self.mapping.get(token)
+            return "" if item is None else _render_item(token, item)
+        key = (token, args, tuple(sorted(props.items())) if props else ())
+        snippet = self.custom.get(key)
+        if snippet is None:
+            item = self.mapping.get(token)
+            if item is None:
+                return ""
+            snippet = _render_item(token, item, args, props)
+            if snippet:
+                self.custom[key] = snippet
+        return snippet
+
+    def shared_code(self, tokens, include_imports=True):
+        """Import lines and definitions ``tokens`` need, each emitted once.
+
+        Definitions come in dependency order; import lines already in the
+        core imports are skipped, and all of them are left out together
+        with the core imports when ``include_imports`` is false.
+        """
+        needs = self.needs
+        imports = self.imports
+        key = (
+            tuple(t for t in tokens if t in needs or t in imports),
+            include_imports,
+        )
+        code = self.shared.get(key)
+        if code is not None:
+            return code
+        names = set()
+        lines = {}
+        for token in key[0]:
+            names.update(needs.get(token, ()))
+            if include_imports:
+                lines.update(dict.fromkeys(imports.get(token, ())))
+        parts = [line + "\n" for line in lines if line not in _CORE_IMPORT_LINES]
+        if parts:
+            parts.append("\n")
+        definitions = self.definitions
+        parts.extend(definitions[n] for n in sorted(names, key=self.rank.__getitem__))
+        code = "".join(parts)
+        if len(self.shared) >= SHARED_CODE_MAXSIZE:
+            self.shared.clear()
+        self.shared[key] = code
+        return code
 
+    def tokens_to_code(self, tokens, include_imports=True, lean=False):
+        snippets = self.snippets
+        # Each endpoint is emitted once, however often its token repeats
+        tokens = list(dict.fromkeys(tokens))
+        parts = [self.shared_code(tokens, include_imports)]
+        for token in tokens:
+            snippet = snippets.get(token)
+            if snippet is None:
+                snippet = self.render_snippet(token)
+            parts.append(snippet)
         if include_imports:
-            parts.append(CORE_IMPORTS)
+            parts.insert(0, self._lean_core(tokens, parts) if lean else CORE_IMPORTS)
+        return "".join(parts)
 
-        for token in tokens:
-            if token in self.mapping:
-                item = self.mapping[token]
-                if isinstance(item, str):
-                    # Legacy string-based endpoint
-                    parts.append(item + "\n\n")
-                else:
-                    # Module-based endpoint
-                    try:
-                        code = item.render_endpoint()
-                        parts.append(code + "\n\n")
-                    except Exception as e:
-                        print(f"Error rendering endpoint {token}: {e}")
-                        continue
+    def _lean_core(self, tokens, parts):
+        # Only depends on which tokens are used, so it is kept per token set
+        key = ("lean", frozenset(tokens))
+        core = self.shared.get(key)
+        if core is None:
+            core = lean_core_imports("".join(parts))
+            if len(self.shared) >= SHARED_CODE_MAXSIZE:
+                self.shared.clear()
+            self.shared[key] = core
+        return core
 
-        return "".join(parts)
+    def code_to_tokens(self, code):
+        index = self.routes
+        found = {}
+        for m in _ROUTE_RE.finditer(code):
+            token = index.get((m.group(1).upper(), m.group(3)))
+            if token is not None:
+                found.setdefault(token, None)
+        return list(found)
+
+
+class BackendCompiler:
+    def __init__(self, endpoints: Optional[EndpointRegistry] = None, on_change=None):
+        # Load all endpoint modules
+        self._endpoints = endpoints if endpoints is not None else REGISTRY
+        self._endpoints.load()
+        # Modules added with register_module; they override the registry
+        self._extra: Dict[str, object] = {}
+        # Called as on_change(tokens, old, new) after a new snapshot is swapped in
+        self._on_change = on_change
+
+        # Readers take self._state once and use only that snapshot; writers
+        # serialise on _swap_lock and replace it with a single assignment
+        self._state = _Registry(self._compose_mapping())
+        self._swap_lock = threading.Lock()
+        self._checked = monotonic()
+
+    def _compose_mapping(self):
+        # Combine legacy mapping with dynamic endpoints
+        mapping = legacy_mapping.copy()
+
+        # Add dynamically loaded endpoints - NEW ENDPOINTS OVERRIDE LEGACY
+        for token, module in self._endpoints.modules.items():
+            if hasattr(module, "render_endpoint"):
+                # Let new endpoints override legacy
+                mapping[token] = module
+        mapping.update(self._extra)
+        return mapping
+
+    @property
+    def mapping(self):
+        """Read-only token -> legacy snippet or endpoint module."""
+        return self._state.mapping
+
+    @property
+    def token_versions(self):
+        return self._state.versions
+
+    @property
+    def registry_version(self) -> str:
+        return self._state.version
+
+    def registry(self) -> _Registry:
+        """The current snapshot; use it for a consistent key and result."""
+        return self._state
+
+    def render_snippet(self, token, args=None, props=None):
+        """Code for one token (plus separator), rendered once per (args, props).
+
+        Returns "" for unknown tokens and for endpoints that fail to render;
+        failures are not cached, so a fixed module is picked up next time.
+        """
+        return self._state.render_snippet(token, args, props)
+
+    def _swap(self, rescan: bool, interval: float = 0.0):
+        with self._swap_lock:
+            if rescan:
+                now = monotonic()
+                # Threads that queued on the lock for the same expired window
+                # find it already rescanned
+                if now - self._checked < interval:
+                    return []
+                self._checked = now
+                self._endpoints.refresh()
+            old = self._state
+            mapping = self._compose_mapping()
+            # Compared per compiler: another compiler may have refreshed the
+            # shared registry already
+            stale = {
+                token
+                for token in mapping.keys() | old.mapping.keys()
+                if mapping.get(token) is not old.mapping.get(token)
+            }
+            if not stale:
+                return []
+            new = self._state = _Registry(mapping, old, stale)
+            # Tokens using a definition from a reloaded module change too
+            changed = sorted(
+                stale
+                | {
+                    token
+                    for token in new.versions.keys() | old.versions.keys()
+                    if new.versions.get(token) != old.versions.get(token)
+                }
+            )
+        if self._on_change is not None:
+            self._on_change(changed, old, new)
+        return changed
+
+    def refresh_snippets(self):
+        """Pick up edited, new and deleted endpoint files.
+
+        Only modified modules are reloaded and only their snippets rendered
+        again. Returns the tokens that changed.
+        """
+        return self._swap(rescan=True)
+
+    def register_module(self, token, module):
+        """Add or replace a module-based endpoint on this compiler."""
+        with self._swap_lock:
+            self._extra[token] = module
+        self._swap(rescan=False)
+
+    def maybe_refresh(self):
+        """``refresh_snippets`` at most every SNIPPET_CHECK_SECONDS."""
+        if monotonic() - self._checked >= SNIPPET_CHECK_SECONDS:
+            self._swap(rescan=True, interval=SNIPPET_CHECK_SECONDS)
+
+    def tokens_to_code(self, tokens, include_imports=True, lean=False):
+        """Code for ``tokens``; ``lean`` emits a core that imports faster."""
+        self.maybe_refresh()
+        return self._state.tokens_to_code(tokens, include_imports, lean)
 
     def file_tokens_to_code(self, input_path="input.txt", output_path="output.py"):
         with open(input_path, "r") as f:
@@ -291,14 +730,13 @@ class BackendCompiler:
         return code
 
     def code_to_tokens(self, code):
-        found = []  # list of (pos, token)
-        for (method, path), token in self._route_index.items():
-            signature = f'@app.{method.lower()}("{path}")'
-            pos = code.find(signature)
-            if pos != -1:
-                found.append((pos, token))
-        found.sort(key=lambda x: x[0])
-        return [t for _, t in found]
+        """Tokens whose routes appear in ``code``, in order of first appearance.
+
+        One pass over the code: every route decorator is matched by a single
+        regex and looked up in the route index.
+        """
+        self.maybe_refresh()
+        return self._state.code_to_tokens(code)
 
     def file_code_to_tokens(self, code_path="output.py"):
         with open(code_path, "r") as f:
@@ -328,21 +766,101 @@ class BackendCompiler:
 # REST API for compilation service
 MAX_FILE_BYTES = int(os.getenv("TRANSLATE_MAX_FILE_BYTES", "1048576"))
 BATCH_MAX_WORKERS = int(os.getenv("TRANSLATE_BATCH_MAX_WORKERS", "4"))
+# Most jobs a streaming batch runs or holds finished results for at once
+STREAM_MAX_IN_FLIGHT = int(os.getenv("TRANSLATE_STREAM_MAX_IN_FLIGHT", "8"))
 CACHE_TTL_SECONDS = int(os.getenv("TRANSLATE_CACHE_TTL_SECONDS", "1800"))
 CACHE_MAXSIZE = int(os.getenv("TRANSLATE_CACHE_MAXSIZE", "256"))
+CACHE_SHARDS = int(os.getenv("TRANSLATE_CACHE_SHARDS", "16"))
+# How often compilers check endpoint module files for edits
+SNIPPET_CHECK_SECONDS = float(os.getenv("TRANSLATE_SNIPPET_CHECK_SECONDS", "2"))
+# Import profiling of generated code: interpreter runs and per-run time limit
+IMPORT_PROFILE_RUNS = int(os.getenv("TRANSLATE_IMPORT_PROFILE_RUNS", "3"))
+IMPORT_PROFILE_TIMEOUT = float(os.getenv("TRANSLATE_IMPORT_PROFILE_TIMEOUT", "60"))
+
+
+def profile_import(
+    code: str, runs: Optional[int] = None, timeout: Optional[float] = None
+) -> dict:
+    """Import ``code`` as a module in fresh interpreters and time it.
+
+    Each run is ``python -X importtime`` in a temporary directory, which is
+    also where a generated app creates its SQLite file. Reports the fastest
+    run: the interpreter's wall time, the module's own import time and the
+    slowest modules it imported directly. ``ok`` is false, with the error,
+    if the import fails or times out.
+    """
+    runs = max(1, runs or IMPORT_PROFILE_RUNS)
+    timeout = timeout or IMPORT_PROFILE_TIMEOUT
+    cmd = [sys.executable, "-X", "importtime", "-c", "import generated_app"]
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    best = None
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "generated_app.py").write_text(code, encoding="utf-8")
+        for _ in range(runs):
+            start = perf_counter()
+            try:
+                proc = subprocess.run(
+                    cmd, cwd=tmp, env=env, capture_output=True, text=True,
+                    timeout=timeout,
+                )
+            except subprocess.TimeoutExpired:
+                return {"ok": False, "error": f"import timed out after {timeout}s"}
+            wall = perf_counter() - start
+            timings = []
+            other = []
+            for line in proc.stderr.splitlines():
+                if not line.startswith("import time:"):
+                    other.append(line)
+                    continue
+                # "import time: self [us] | cumulative | imported package"
+                fields = line[len("import time:"):].split("|")
+                if len(fields) != 3 or not fields[1].strip().isdigit():
+                    continue
+                name = fields[2][1:].rstrip()
+                depth = (len(name) - len(name.lstrip())) // 2
+                timings.append((depth, name.strip(), int(fields[1])))
+            if proc.returncode != 0:
+                return {"ok": False, "error": (other or ["import failed"])[-1]}
+            if best is None or wall < best[0]:
+                best = (wall, timings)
+    wall, timings = best
+    # Modules are listed after everything they import, so the generated
+    # module's direct imports are the depth-1 lines just above it
+    module_us = 0
+    direct = []
+    for i, (depth, name, us) in enumerate(timings):
+        if depth == 0 and name == "generated_app":
+            module_us = us
+            for child_depth, child, child_us in reversed(timings[:i]):
+                if child_depth == 0:
+                    break
+                if child_depth == 1:
+                    direct.append((child, child_us))
+            break
+    slowest = sorted(direct, key=lambda item: -item[1])[:10]
+    return {
+        "ok": True,
+        "runs": runs,
+        "wall_ms": round(wall * 1000, 1),
+        "import_ms": round(module_us / 1000, 1),
+        "slowest": [{"module": name, "ms": round(us / 1000, 1)} for name, us in slowest],
+    }
 
 
-def _compute_mapping_version() -> str:
-    # Stable hash to invalidate caches when mapping changes
+def _compute_mapping_version(token_versions: Dict[str, str]) -> str:
+    # Stable hash of the whole registry, from each token's source digest
     items = []
-    for k in sorted(legacy_mapping.keys()):
+    for k in sorted(token_versions):
         items.append(k)
-        items.append(legacy_mapping[k])
+        items.append(token_versions[k])
     digest = sha256("\u0001".join(items).encode("utf-8")).hexdigest()
     return digest
 
 
-MAPPING_VERSION = _compute_mapping_version()
+# Digest of this module: the core imports and how code is assembled and
+# decompiled. Part of every cache key, so after a deploy that changes the
+# output, entries in the shared disk tier are not reused.
+COMPILER_VERSION = sha256(Path(__file__).read_bytes()).hexdigest()[:16]
 
 
 def _read_text_with_limits(path: str, max_bytes: int = MAX_FILE_BYTES) -> str:
@@ -390,7 +908,7 @@ def _ensure_output_parent_exists(path: str):
         )
 
 
-def _validate_tokens(tokens: List[str], mapping_keys: List[str]):
+def _validate_tokens(tokens: List[str], mapping_keys: Collection[str]):
     if not isinstance(tokens, list) or any(not isinstance(t, str) for t in tokens):
         raise HTTPException(
             status_code=400,
@@ -407,67 +925,163 @@ def _validate_tokens(tokens: List[str], mapping_keys: List[str]):
 
 
 class SimpleTTLCache:
-    def __init__(self, maxsize: int = CACHE_MAXSIZE, ttl: int = CACHE_TTL_SECONDS):
+    """TTL cache split into shards, each with its own lock.
+
+    Keys are spread over the shards by hash, so concurrent batch workers
+    rarely wait on each other. Each shard holds an equal share of maxsize.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = CACHE_MAXSIZE,
+        ttl: int = CACHE_TTL_SECONDS,
+        backing: Optional[DiskCache] = None,
+        shards: Optional[int] = None,
+    ):
         self.maxsize = maxsize
         self.ttl = ttl
-        self._store = {}
-        self._lock = threading.Lock()
+        # Optional shared disk tier: read-through on miss, write-through on set
+        self.backing = backing
+        n = max(1, min(shards or CACHE_SHARDS, maxsize))
+        self._shard_maxsize = -(-maxsize // n)
+        self._shards = [({}, threading.Lock()) for _ in range(n)]
 
-    def get(self, key):
-        with self._lock:
-            item = self._store.get(key)
-            if not item:
-                return None
-            value, expiry = item
-            if expiry < time():
-                self._store.pop(key, None)
-                return None
-            return value
-
-    def set(self, key, value):
-        with self._lock:
-            if len(self._store) >= self.maxsize:
-                # naive eviction: pop an arbitrary item
-                self._store.pop(next(iter(self._store)))
-            self._store[key] = (value, time() + self.ttl)
+    def _shard(self, key):
+        return self._shards[hash(key) % len(self._shards)]
 
+    def __len__(self) -> int:
+        return sum(len(store) for store, _ in self._shards)
 
-TOKENS_TO_CODE_CACHE = SimpleTTLCache()
-CODE_TO_TOKENS_CACHE = SimpleTTLCache()
+    def get(self, key):
+        store, lock = self._shard(key)
+        with lock:
+            item = store.get(key)
+            if item:
+                value, expiry, _ = item
+                if expiry >= time():
+                    return value
+                store.pop(key, None)
+        if self.backing is None:
+            return None
+        value = self.backing.get(key)
+        if value is not None:
+            self._put(key, value)
+        return value
+
+    def set(self, key, value, tags=()):
+        """Store ``value``; ``tags`` name what it depends on (see invalidate)."""
+        self._put(key, value, frozenset(tags))
+        if self.backing is not None:
+            self.backing.set(key, value)
+
+    def _put(self, key, value, tags=frozenset()):
+        store, lock = self._shard(key)
+        with lock:
+            if key not in store and len(store) >= self._shard_maxsize:
+                # naive eviction: pop an arbitrary item
+                store.pop(next(iter(store)))
+            store[key] = (value, time() + self.ttl, tags)
+
+    def invalidate(self, tags) -> int:
+        """Drop in-memory entries tagged with any of ``tags``; returns how many.
+
+        The disk tier is left alone: its keys carry the versions they were
+        built from, so stale entries there are never looked up again and age
+        out through its LRU eviction.
+        """
+        tags = frozenset(tags)
+        dropped = 0
+        for store, lock in self._shards:
+            with lock:
+                stale = [key for key, item in store.items() if item[2] & tags]
+                for key in stale:
+                    del store[key]
+            dropped += len(stale)
+        return dropped
+
+    def clear(self):
+        for store, lock in self._shards:
+            with lock:
+                store.clear()
+        if self.backing is not None:
+            self.backing.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "shards": len(self._shards),
+            "ttl_seconds": self.ttl,
+            "disk": self.backing.stats() if self.backing is not None else None,
+        }
 
 
-def _key_tokens(tokens: List[str], include_imports: bool) -> str:
-    raw = "|".join(tokens) + f"|imports={include_imports}|v={MAPPING_VERSION}"
+TOKENS_TO_CODE_CACHE = SimpleTTLCache(backing=disk_cache_from_env("tokens_to_code"))
+CODE_TO_TOKENS_CACHE = SimpleTTLCache(backing=disk_cache_from_env("code_to_tokens"))
+
+
+def _key_tokens(
+    tokens: List[str],
+    include_imports: bool,
+    token_versions: Dict[str, str],
+    lean: bool = False,
+) -> str:
+    # Scoped to the tokens used: editing one endpoint module only changes the
+    # keys of results that include its token. Repeats are dropped, as they
+    # are when compiling, so "a a b" and "a b" share an entry.
+    raw = "|".join(
+        f"{t}@{token_versions.get(t, '-')}" for t in dict.fromkeys(tokens)
+    )
+    raw += f"|imports={include_imports}|compiler={COMPILER_VERSION}"
+    if include_imports and lean:
+        raw += "|lean"
     return sha256(raw.encode("utf-8")).hexdigest()
 
 
-def _key_code(code: str) -> str:
-    raw = sha256(code.encode("utf-8")).hexdigest() + f"|v={MAPPING_VERSION}"
+def _key_code(code: str, routes_version: str) -> str:
+    raw = sha256(code.encode("utf-8")).hexdigest()
+    raw += f"|v={routes_version}|compiler={COMPILER_VERSION}"
     return sha256(raw.encode("utf-8")).hexdigest()
 
 
 # Global compiler instance for reuse
 GLOBAL_COMPILER = None
+_COMPILER_LOCK = threading.Lock()
+
+
+def _drop_stale_results(tokens: List[str], old, new):
+    """Evict cached results built from endpoints that just changed."""
+    TOKENS_TO_CODE_CACHE.invalidate(tokens)
+    if new.routes_version != old.routes_version:
+        CODE_TO_TOKENS_CACHE.invalidate([old.routes_version])
 
 
 def _get_compiler() -> "BackendCompiler":
     global GLOBAL_COMPILER
-    if GLOBAL_COMPILER is None:
-        GLOBAL_COMPILER = BackendCompiler()
-    return GLOBAL_COMPILER
+    compiler = GLOBAL_COMPILER
+    if compiler is None:
+        with _COMPILER_LOCK:
+            # Batch workers may race here on the first request: build once
+            if GLOBAL_COMPILER is None:
+                GLOBAL_COMPILER = BackendCompiler(on_change=_drop_stale_results)
+            compiler = GLOBAL_COMPILER
+    return compiler
 
 
 def tokens_to_code_cached_info(
-    tokens: List[str], include_imports: bool, use_cache: bool = True
+    tokens: List[str], include_imports: bool, use_cache: bool = True, lean: bool = False
 ):
-    key = _key_tokens(tokens, include_imports)
+    compiler = _get_compiler()
+    compiler.maybe_refresh()
+    # Key and code come from the same snapshot even if endpoints reload
+    registry = compiler.registry()
+    key = _key_tokens(tokens, include_imports, registry.versions, lean)
     if use_cache:
         cached = TOKENS_TO_CODE_CACHE.get(key)
         if cached is not None:
             return cached, True, key
-    compiler = _get_compiler()
-    code = compiler.tokens_to_code(tokens, include_imports=include_imports)
-    TOKENS_TO_CODE_CACHE.set(key, code)
+    code = registry.tokens_to_code(tokens, include_imports=include_imports, lean=lean)
+    TOKENS_TO_CODE_CACHE.set(key, code, tags=tokens)
     return code, False, key
 
 
@@ -477,14 +1091,16 @@ def tokens_to_code_cached(tokens: List[str], include_imports: bool) -> str:
 
 
 def code_to_tokens_cached_info(code: str, use_cache: bool = True):
-    key = _key_code(code)
+    compiler = _get_compiler()
+    compiler.maybe_refresh()
+    registry = compiler.registry()
+    key = _key_code(code, registry.routes_version)
     if use_cache:
         cached = CODE_TO_TOKENS_CACHE.get(key)
         if cached is not None:
             return cached, True, key
-    compiler = _get_compiler()
-    tokens = compiler.code_to_tokens(code)
-    CODE_TO_TOKENS_CACHE.set(key, tokens)
+    tokens = registry.code_to_tokens(code)
+    CODE_TO_TOKENS_CACHE.set(key, tokens, tags=[registry.routes_version])
     return tokens, False, key
 
 
@@ -496,12 +1112,7 @@ def code_to_tokens_cached(code: str) -> List[str]:
 def _write_if_changed(path: str, content: str) -> bool:
     p = Path(path)
     try:
-        if p.exists():
-            existing = p.read_text(encoding="utf-8")
-            if existing == content:
-                return False
-        p.write_text(content, encoding="utf-8")
-        return True
+        return write_if_changed(path, content)
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -519,6 +1130,8 @@ class CompileRequest(BaseModel):
     output_path: str
     include_imports: bool = True
     use_cache: bool = True
+    lean: bool = False
+    profile_imports: bool = False
 
 
 class DecompileRequest(BaseModel):
@@ -532,10 +1145,13 @@ class BatchCompileJob(BaseModel):
     output_path: str
     include_imports: bool = True
     use_cache: bool = True
+    lean: bool = False
 
 
 class BatchCompileRequest(BaseModel):
     jobs: List[BatchCompileJob]
+    # Streaming only: lower the in-flight limit for this request
+    max_in_flight: Optional[int] = None
 
 
 class BatchDecompileJob(BaseModel):
@@ -546,12 +1162,16 @@ class BatchDecompileJob(BaseModel):
 
 class BatchDecompileRequest(BaseModel):
     jobs: List[BatchDecompileJob]
+    # Streaming only: lower the in-flight limit for this request
+    max_in_flight: Optional[int] = None
 
 
 class DirectCompileRequest(BaseModel):
     tokens: List[str]
     include_imports: bool = True
     use_cache: bool = True
+    lean: bool = False
+    profile_imports: bool = False
 
 
 # REST API instance
@@ -564,19 +1184,25 @@ def compile_api(body: CompileRequest):
         content = _read_text_with_limits(body.input_path)
         tokens = content.split()
         compiler = _get_compiler()
-        _validate_tokens(tokens, list(compiler.mapping.keys()))
+        _validate_tokens(tokens, compiler.mapping.keys())
         code, hit, cache_key = tokens_to_code_cached_info(
-            tokens, include_imports=body.include_imports, use_cache=body.use_cache
+            tokens,
+            include_imports=body.include_imports,
+            use_cache=body.use_cache,
+            lean=body.lean,
         )
         _ensure_output_parent_exists(body.output_path)
         changed = _write_if_changed(body.output_path, code)
-        return {
+        result = {
             "written_to": body.output_path,
             "tokens": tokens,
             "bytes": len(code),
             "changed": changed,
             "cache": {"hit": hit, "key": cache_key},
         }
+        if body.profile_imports:
+            result["import_profile"] = profile_import(code)
+        return result
     except HTTPException:
         raise
     except Exception as exc:
@@ -609,55 +1235,62 @@ def decompile_api(body: DecompileRequest):
         )
 
 
+def _compile_batch_job(idx: int, job: BatchCompileJob):
+    """Run one to-s batch job; returns (index, success, result or error)."""
+    job_id = job.id or str(idx)
+    try:
+        content = _read_text_with_limits(job.input_path)
+        tokens = content.split()
+        compiler = _get_compiler()
+        _validate_tokens(tokens, compiler.mapping.keys())
+        code, hit, cache_key = tokens_to_code_cached_info(
+            tokens,
+            include_imports=job.include_imports,
+            use_cache=job.use_cache,
+            lean=job.lean,
+        )
+        _ensure_output_parent_exists(job.output_path)
+        changed = _write_if_changed(job.output_path, code)
+        res = {
+            "id": job_id,
+            "written_to": job.output_path,
+            "tokens": tokens,
+            "bytes": len(code),
+            "changed": changed,
+            "cache": {"hit": hit, "key": cache_key},
+        }
+        return (idx, True, res)
+    except HTTPException as http_exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": http_exc.status_code,
+                "error": http_exc.detail,
+            },
+        )
+    except Exception as exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": 400,
+                "error": {"code": "unexpected_error", "error": str(exc)},
+            },
+        )
+
+
 @app.post("/api/translate/to-s-batch")
 def compile_batch_api(body: BatchCompileRequest):
     results = [None] * len(body.jobs)
     ok = 0
 
-    def process(idx: int, job: BatchCompileJob):
-        job_id = job.id or str(idx)
-        try:
-            content = _read_text_with_limits(job.input_path)
-            tokens = content.split()
-            compiler = _get_compiler()
-            _validate_tokens(tokens, list(compiler.mapping.keys()))
-            code, hit, cache_key = tokens_to_code_cached_info(
-                tokens, include_imports=job.include_imports, use_cache=job.use_cache
-            )
-            _ensure_output_parent_exists(job.output_path)
-            changed = _write_if_changed(job.output_path, code)
-            res = {
-                "id": job_id,
-                "written_to": job.output_path,
-                "tokens": tokens,
-                "bytes": len(code),
-                "changed": changed,
-                "cache": {"hit": hit, "key": cache_key},
-            }
-            return (idx, True, res)
-        except HTTPException as http_exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": http_exc.status_code,
-                    "error": http_exc.detail,
-                },
-            )
-        except Exception as exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": 400,
-                    "error": {"code": "unexpected_error", "error": str(exc)},
-                },
-            )
-
     with cf.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = [executor.submit(process, i, job) for i, job in enumerate(body.jobs)]
+        futures = [
+            executor.submit(_compile_batch_job, i, job) for i, job in enumerate(body.jobs)
+        ]
         for fut in futures:
             idx, success, payload = fut.result()
             results[idx] = payload
@@ -667,58 +1300,62 @@ def compile_batch_api(body: BatchCompileRequest):
     return {"results": results, "totals": {"ok": ok, "failed": len(results) - ok}}
 
 
+def _decompile_batch_job(idx: int, job: BatchDecompileJob):
+    """Run one from-s batch job; returns (index, success, result or error)."""
+    job_id = job.id or str(idx)
+    try:
+        code = _read_text_with_limits(job.code_path)
+        tokens, hit, cache_key = code_to_tokens_cached_info(
+            code, use_cache=job.use_cache
+        )
+        if not tokens:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "code": "invalid_code_format",
+                    "message": "No recognizable endpoints found",
+                },
+            )
+        return (
+            idx,
+            True,
+            {
+                "id": job_id,
+                "tokens": tokens,
+                "cache": {"hit": hit, "key": cache_key},
+            },
+        )
+    except HTTPException as http_exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": http_exc.status_code,
+                "error": http_exc.detail,
+            },
+        )
+    except Exception as exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": 400,
+                "error": {"code": "unexpected_error", "error": str(exc)},
+            },
+        )
+
+
 @app.post("/api/translate/from-s-batch")
 def decompile_batch_api(body: BatchDecompileRequest):
     results = [None] * len(body.jobs)
     ok = 0
 
-    def process(idx: int, job: BatchDecompileJob):
-        job_id = job.id or str(idx)
-        try:
-            code = _read_text_with_limits(job.code_path)
-            tokens, hit, cache_key = code_to_tokens_cached_info(
-                code, use_cache=job.use_cache
-            )
-            if not tokens:
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "code": "invalid_code_format",
-                        "message": "No recognizable endpoints found",
-                    },
-                )
-            return (
-                idx,
-                True,
-                {
-                    "id": job_id,
-                    "tokens": tokens,
-                    "cache": {"hit": hit, "key": cache_key},
-                },
-            )
-        except HTTPException as http_exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": http_exc.status_code,
-                    "error": http_exc.detail,
-                },
-            )
-        except Exception as exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": 400,
-                    "error": {"code": "unexpected_error", "error": str(exc)},
-                },
-            )
-
     with cf.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = [executor.submit(process, i, job) for i, job in enumerate(body.jobs)]
+        futures = [
+            executor.submit(_decompile_batch_job, i, job) for i, job in enumerate(body.jobs)
+        ]
         for fut in futures:
             idx, success, payload = fut.result()
             results[idx] = payload
@@ -728,27 +1365,86 @@ def decompile_batch_api(body: BatchDecompileRequest):
     return {"results": results, "totals": {"ok": ok, "failed": len(results) - ok}}
 
 
+async def _run_batch_streaming(
+    run_job: Callable[[int, BaseModel], Tuple[int, bool, dict]],
+    jobs: List[BaseModel],
+    max_in_flight: Optional[int],
+) -> AsyncIterator[Tuple[int, bool, dict]]:
+    """Yield (index, success, payload) per job, in completion order.
+
+    At most ``max_in_flight`` jobs (capped by STREAM_MAX_IN_FLIGHT) are
+    running or waiting to be sent. A new job is only started after a result
+    has been taken by the consumer, so a client that reads slowly holds the
+    batch back instead of letting results pile up in memory.
+    """
+    limit = max(1, min(max_in_flight or STREAM_MAX_IN_FLIGHT, STREAM_MAX_IN_FLIGHT))
+    loop = asyncio.get_running_loop()
+    executor = cf.ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, limit))
+    queued = iter(enumerate(jobs))
+    pending = set()
+
+    def submit_next():
+        item = next(queued, None)
+        if item is not None:
+            pending.add(loop.run_in_executor(executor, run_job, *item))
+
+    try:
+        for _ in range(limit):
+            submit_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                pending.discard(fut)
+                yield fut.result()
+                submit_next()
+    finally:
+        # Client went away: drop jobs not yet started, don't wait for the rest
+        for fut in pending:
+            fut.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _ndjson_batch(run_job, jobs, max_in_flight) -> StreamingResponse:
+    async def lines():
+        ok = 0
+        # Closed as soon as the response stops (client gone), not whenever
+        # the loop gets round to finalising it: that is what cancels the jobs
+        results = _run_batch_streaming(run_job, jobs, max_in_flight)
+        async with aclosing(results):
+            async for idx, success, payload in results:
+                ok += success
+                yield orjson.dumps({"index": idx, "ok": success, **payload}) + b"\n"
+        totals = {"ok": ok, "failed": len(jobs) - ok}
+        yield orjson.dumps({"totals": totals}) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/api/translate/to-s-batch-stream")
+async def compile_batch_stream_api(body: BatchCompileRequest):
+    """to-s-batch, streaming NDJSON as each job finishes"""
+    return _ndjson_batch(_compile_batch_job, body.jobs, body.max_in_flight)
+
+
+@app.post("/api/translate/from-s-batch-stream")
+async def decompile_batch_stream_api(body: BatchDecompileRequest):
+    """from-s-batch, streaming NDJSON as each job finishes"""
+    return _ndjson_batch(_decompile_batch_job, body.jobs, body.max_in_flight)
+
+
 @app.get("/api/cache/stats")
 def cache_stats():
     return {
-        "mapping_version": MAPPING_VERSION,
-        "tokens_to_code": {
-            "size": len(TOKENS_TO_CODE_CACHE._store),
-            "maxsize": TOKENS_TO_CODE_CACHE.maxsize,
-            "ttl_seconds": TOKENS_TO_CODE_CACHE.ttl,
-        },
-        "code_to_tokens": {
-            "size": len(CODE_TO_TOKENS_CACHE._store),
-            "maxsize": CODE_TO_TOKENS_CACHE.maxsize,
-            "ttl_seconds": CODE_TO_TOKENS_CACHE.ttl,
-        },
+        "mapping_version": _get_compiler().registry_version,
+        "tokens_to_code": TOKENS_TO_CODE_CACHE.stats(),
+        "code_to_tokens": CODE_TO_TOKENS_CACHE.stats(),
     }
 
 
 @app.post("/api/cache/flush")
 def cache_flush():
-    TOKENS_TO_CODE_CACHE._store.clear()
-    CODE_TO_TOKENS_CACHE._store.clear()
+    TOKENS_TO_CODE_CACHE.clear()
+    CODE_TO_TOKENS_CACHE.clear()
     return {"flushed": True}
 
 
@@ -756,16 +1452,22 @@ def cache_flush():
 def compile_direct_api(body: DirectCompileRequest):
     try:
         compiler = _get_compiler()
-        _validate_tokens(body.tokens, list(compiler.mapping.keys()))
+        _validate_tokens(body.tokens, compiler.mapping.keys())
         code, hit, cache_key = tokens_to_code_cached_info(
-            body.tokens, include_imports=body.include_imports, use_cache=body.use_cache
+            body.tokens,
+            include_imports=body.include_imports,
+            use_cache=body.use_cache,
+            lean=body.lean,
         )
-        return {
+        result = {
             "generated_code": code,
             "tokens": body.tokens,
             "bytes": len(code),
             "cache": {"hit": hit, "key": cache_key},
         }
+        if body.profile_imports:
+            result["import_profile"] = profile_import(code)
+        return result
     except HTTPException:
         raise
     except Exception as exc:
@@ -799,8 +1501,8 @@ async def health():
         "version": "1.0.0",
         "available_tokens": list(legacy_mapping.keys()),
         "cache_status": {
-            "tokens_to_code": len(TOKENS_TO_CODE_CACHE._store),
-            "code_to_tokens": len(CODE_TO_TOKENS_CACHE._store),
+            "tokens_to_code": len(TOKENS_TO_CODE_CACHE),
+            "code_to_tokens": len(CODE_TO_TOKENS_CACHE),
         },
     }
 
@@ -2,52 +2,137 @@
 """
 Backend endpoints for SEVDO system.
 Each endpoint file defines a render_endpoint function that returns FastAPI endpoint code.
+
+``EndpointRegistry`` is the one loader for these files. It loads every
+``*.py`` module in a directory (files starting with ``_`` are skipped) and,
+on ``refresh()``, re-executes only the files whose mtime or size changed,
+picks up new files and drops deleted ones. Each reload builds a fresh module
+object and the token table is replaced with a single assignment, so readers
+always see either the old or the new set of modules, never a mix.
 """
 
-import os
+import importlib.util
+import threading
 from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-# Global registry of all available endpoints
-ENDPOINT_REGISTRY = {}
+ENDPOINTS_DIR = Path(__file__).parent
 
 
-def register_endpoint(token, module_name):
-    """Register an endpoint with its token."""
-    ENDPOINT_REGISTRY[token] = module_name
+class _Loaded:
+    __slots__ = ("stat", "token", "module")
 
+    def __init__(self, stat, token, module):
+        self.stat = stat
+        self.token = token
+        self.module = module
 
-def load_all_endpoints():
-    """Load all endpoint modules and register them."""
-    endpoints_dir = Path(__file__).parent
 
-    for file_path in endpoints_dir.glob("*.py"):
-        if file_path.name.startswith("__"):
-            continue
+def _file_stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _exec_endpoint(path: Path, package: str):
+    """Execute ``path`` as a fresh module; None if it fails or is not an endpoint."""
+    name = f"{package}.{path.stem}"
+    try:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as e:
+        print(f"Error loading endpoint {path.stem}: {e}")
+        return None
+    if not (hasattr(module, "ENDPOINT_TOKEN") and hasattr(module, "render_endpoint")):
+        print(f"Warning: {path.stem} missing ENDPOINT_TOKEN or render_endpoint")
+        return None
+    return module
+
+
+class EndpointRegistry:
+    """Endpoint modules of one directory, keyed by ``ENDPOINT_TOKEN``."""
+
+    def __init__(self, directory=ENDPOINTS_DIR, package: str = __name__):
+        self.directory = Path(directory)
+        self.package = package
+        # File name -> what was loaded from it; only touched under _lock
+        self._files: Dict[str, _Loaded] = {}
+        self._tokens: Mapping[str, object] = MappingProxyType({})
+        self._lock = threading.Lock()
+        self._loaded = False
 
-        module_name = file_path.stem
-        try:
-            # Import the module
-            module = __import__(f"endpoints.{module_name}", fromlist=[module_name])
+    @property
+    def modules(self) -> Mapping[str, object]:
+        """Read-only token -> module table (a snapshot; safe to hold on to)."""
+        return self._tokens
 
-            # Check if module has required attributes
-            if hasattr(module, "ENDPOINT_TOKEN") and hasattr(module, "render_endpoint"):
-                token = module.ENDPOINT_TOKEN
-                ENDPOINT_REGISTRY[token] = module
-                print(f"Registered endpoint: {token} -> {module_name}")
-            else:
-                print(
-                    f"Warning: {module_name} missing ENDPOINT_TOKEN or render_endpoint"
-                )
+    def load(self):
+        """Load every endpoint file once; later calls are no-ops."""
+        if not self._loaded:
+            self.refresh()
 
-        except Exception as e:
-            print(f"Error loading endpoint {module_name}: {e}")
+    def refresh(self) -> List[str]:
+        """Reload changed files, load new ones and drop deleted ones.
+
+        Returns the tokens whose module was added, replaced or removed.
+        """
+        with self._lock:
+            self._loaded = True
+            paths = {
+                p.name: p
+                for p in sorted(self.directory.glob("*.py"))
+                if not p.name.startswith("_")
+            }
+            changed = set()
+            files = dict(self._files)
+            for name in list(files):
+                if name not in paths:
+                    old = files.pop(name)
+                    if old.token is not None:
+                        changed.add(old.token)
+            for name, path in paths.items():
+                stat = _file_stat(path)
+                old = files.get(name)
+                if old is not None and old.stat == stat:
+                    continue
+                module = _exec_endpoint(path, self.package)
+                token = module.ENDPOINT_TOKEN if module is not None else None
+                if old is not None and old.token is not None:
+                    changed.add(old.token)
+                if token is not None:
+                    changed.add(token)
+                files[name] = _Loaded(stat, token, module)
+            self._files = files
+            if not changed:
+                return []
+            tokens = {}
+            for name in sorted(files):
+                loaded = files[name]
+                if loaded.token is not None:
+                    # The first file in name order wins a token
+                    tokens.setdefault(loaded.token, loaded.module)
+            self._tokens = MappingProxyType(tokens)
+            return sorted(changed)
+
+
+# Registry of the endpoints shipped in this package
+REGISTRY = EndpointRegistry()
+
+
+def load_all_endpoints():
+    """Load all endpoint modules and register them."""
+    REGISTRY.load()
 
 
 def get_endpoint_module(token):
     """Get endpoint module by token."""
-    return ENDPOINT_REGISTRY.get(token)
+    return REGISTRY.modules.get(token)
 
 
 def list_available_tokens():
     """List all available endpoint tokens."""
-    return list(ENDPOINT_REGISTRY.keys())
+    return list(REGISTRY.modules.keys())
@@ -2,8 +2,30 @@
 """
 Template file for creating new endpoints.
 Copy this file and modify it for each new endpoint.
+
+Besides ``render_endpoint`` and ``ENDPOINT_TOKEN``, a module may declare:
+
+- ``DEFINITIONS``: models and helpers it provides, name -> source. Keep them
+  out of ``render_endpoint``; the compiler emits each definition once per
+  generated app, before the routes and after anything it refers to.
+- ``REQUIRES``: names of definitions provided by other endpoint modules.
+- ``IMPORTS``: import lines its code needs beyond the core imports.
 """
 
+# Models and helpers this endpoint provides
+DEFINITIONS = {
+    "ExampleResponse": """
+class ExampleResponse(BaseModel):
+    message: str
+""",
+}
+
+# Definitions provided by other endpoints
+REQUIRES = ()
+
+# Imports needed beyond the core imports
+IMPORTS = ()
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -29,7 +51,7 @@ def render_endpoint(args=None, props=None):
 
     # Generate the endpoint code
     endpoint_code = f'''
-@app.{method.lower()}("{endpoint_path}")
+@app.{method.lower()}("{endpoint_path}", response_model=ExampleResponse)
 async def example_endpoint():
     """
     {description}
@@ -3,6 +3,32 @@
 Blog get endpoint - retrieve a specific blog post by ID or slug.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "BlogPostDetailResponse": """
+# Single blog post response model
+class BlogPostDetailResponse(BaseModel):
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    content: str
+    featured_image: Optional[str] = None
+    published: bool
+    created_at: datetime
+    updated_at: datetime
+    author_id: int
+    author_username: str
+    author_email: Optional[str] = None
+    tags: List[str] = []
+    word_count: int
+    reading_time_minutes: int
+""",
+}
+
+# Definitions provided by other endpoints
+REQUIRES = ("BlogPostDB", "BlogTagDB", "PostTagDB")
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -30,24 +56,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the blog get endpoint code
     endpoint_code = f'''
-# Single blog post response model
-class BlogPostDetailResponse(BaseModel):
-    id: int
-    title: str
-    slug: str
-    excerpt: Optional[str] = None
-    content: str
-    featured_image: Optional[str] = None
-    published: bool
-    created_at: datetime
-    updated_at: datetime
-    author_id: int
-    author_username: str
-    author_email: Optional[str] = None
-    tags: List[str] = []
-    word_count: int
-    reading_time_minutes: int
-
 @app.{method.lower()}("{endpoint_path}")
 def blog_get_endpoint(
     post_id: str,
@@ -3,29 +3,9 @@
 Blog posts endpoint - list all published blog posts with pagination and filtering.
 """
 
-
-def render_endpoint(args=None, props=None):
-    """
-    Render blog posts list endpoint code.
-
-    Args:
-        args: String arguments from DSL (optional parameters)
-        props: Dictionary of properties from DSL
-
-    Returns:
-        String containing FastAPI endpoint code
-    """
-    # Default values
-    endpoint_path = props.get("path", "/api/blog/posts") if props else "/api/blog/posts"
-    method = props.get("method", "GET").upper() if props else "GET"
-
-    # Support for inline args parsing if needed
-    if args:
-        # Could parse custom path or options from args
-        pass
-
-    # Generate the blog posts endpoint code
-    endpoint_code = f'''
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "BlogPostResponse": """
 # Blog post data models
 class BlogPostResponse(BaseModel):
     id: int
@@ -40,7 +20,8 @@ class BlogPostResponse(BaseModel):
     author_id: int
     author_username: Optional[str] = None
     tags: List[str] = []
-
+""",
+    "BlogPostsListResponse": """
 class BlogPostsListResponse(BaseModel):
     posts: List[BlogPostResponse]
     total: int
@@ -48,7 +29,8 @@ class BlogPostsListResponse(BaseModel):
     limit: int
     has_next: bool
     has_prev: bool
-
+""",
+    "BlogPostDB": """
 # Blog post database model
 class BlogPostDB(Base):
     __tablename__ = "blog_posts"
@@ -62,19 +44,46 @@ class BlogPostDB(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     author_id = Column(Integer, ForeignKey("users.id"))
-
+""",
+    "BlogTagDB": """
 # Blog tags model
 class BlogTagDB(Base):
     __tablename__ = "blog_tags"
     id = Column(Integer, primary_key=True)
     name = Column(String(50), unique=True, nullable=False)
-
+""",
+    "PostTagDB": """
 # Post-tag relationship table
 class PostTagDB(Base):
     __tablename__ = "post_tags"
     post_id = Column(Integer, ForeignKey("blog_posts.id"), primary_key=True)
     tag_id = Column(Integer, ForeignKey("blog_tags.id"), primary_key=True)
+""",
+}
+
+
+def render_endpoint(args=None, props=None):
+    """
+    Render blog posts list endpoint code.
 
+    Args:
+        args: String arguments from DSL (optional parameters)
+        props: Dictionary of properties from DSL
+
+    Returns:
+        String containing FastAPI endpoint code
+    """
+    # Default values
+    endpoint_path = props.get("path", "/api/blog/posts") if props else "/api/blog/posts"
+    method = props.get("method", "GET").upper() if props else "GET"
+
+    # Support for inline args parsing if needed
+    if args:
+        # Could parse custom path or options from args
+        pass
+
+    # Generate the blog posts endpoint code
+    endpoint_code = f'''
 @app.{method.lower()}("{endpoint_path}")
 def blog_posts_endpoint(
     page: int = 1,
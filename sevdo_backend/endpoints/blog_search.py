@@ -3,6 +3,39 @@
 Blog search endpoint - advanced search functionality for blog posts.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "BlogSearchResult": """
+# Search result response model
+class BlogSearchResult(BaseModel):
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    featured_image: Optional[str] = None
+    created_at: datetime
+    author_username: str
+    tags: List[str] = []
+    match_score: float
+    match_type: str  # "title", "content", "tag", "author"
+""",
+    "BlogSearchResponse": """
+class BlogSearchResponse(BaseModel):
+    results: List[BlogSearchResult]
+    total: int
+    query: str
+    page: int
+    limit: int
+    has_next: bool
+    has_prev: bool
+    search_time_ms: float
+    suggestions: List[str] = []
+""",
+}
+
+# Definitions provided by other endpoints
+REQUIRES = ("BlogPostDB", "BlogTagDB", "PostTagDB")
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -28,30 +61,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the blog search endpoint code
     endpoint_code = f'''
-# Search result response model
-class BlogSearchResult(BaseModel):
-    id: int
-    title: str
-    slug: str
-    excerpt: Optional[str] = None
-    featured_image: Optional[str] = None
-    created_at: datetime
-    author_username: str
-    tags: List[str] = []
-    match_score: float
-    match_type: str  # "title", "content", "tag", "author"
-
-class BlogSearchResponse(BaseModel):
-    results: List[BlogSearchResult]
-    total: int
-    query: str
-    page: int
-    limit: int
-    has_next: bool
-    has_prev: bool
-    search_time_ms: float
-    suggestions: List[str] = []
-
 @app.{method.lower()}("{endpoint_path}")
 def blog_search_endpoint(
     q: str,
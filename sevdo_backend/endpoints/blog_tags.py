@@ -3,6 +3,36 @@
 Blog tags endpoint - manage and retrieve blog tags with post counts.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "BlogTagResponse": """
+# Tag response models
+class BlogTagResponse(BaseModel):
+    id: int
+    name: str
+    post_count: int
+    slug: str
+""",
+    "BlogTagsListResponse": """
+class BlogTagsListResponse(BaseModel):
+    tags: List[BlogTagResponse]
+    total: int
+""",
+    "TaggedPostsResponse": """
+class TaggedPostsResponse(BaseModel):
+    tag: BlogTagResponse
+    posts: List[BlogPostResponse]
+    total: int
+    page: int
+    limit: int
+    has_next: bool
+    has_prev: bool
+""",
+}
+
+# Definitions provided by other endpoints
+REQUIRES = ("BlogPostDB", "BlogTagDB", "PostTagDB", "BlogPostResponse")
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -26,26 +56,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the blog tags endpoint code
     endpoint_code = f'''
-# Tag response models
-class BlogTagResponse(BaseModel):
-    id: int
-    name: str
-    post_count: int
-    slug: str
-
-class BlogTagsListResponse(BaseModel):
-    tags: List[BlogTagResponse]
-    total: int
-
-class TaggedPostsResponse(BaseModel):
-    tag: BlogTagResponse
-    posts: List[BlogPostResponse]
-    total: int
-    page: int
-    limit: int
-    has_next: bool
-    has_prev: bool
-
 @app.{method.lower()}("{endpoint_path}")
 def blog_tags_endpoint(
     sort: str = "post_count_desc",
@@ -3,36 +3,17 @@
 Chat handler endpoint - processes chat messages from frontend.
 """
 
-
-def render_endpoint(args=None, props=None):
-    """
-    Render chat handler endpoint code.
-
-    Args:
-        args: String arguments from DSL (optional path parameters)
-        props: Dictionary of properties from DSL
-
-    Returns:
-        String containing FastAPI endpoint code
-    """
-    # Default values
-    endpoint_path = props.get("path", "/chat") if props else "/chat"
-    method = props.get("method", "POST").upper() if props else "POST"
-
-    # Support for inline args parsing if needed
-    if args:
-        # Could parse custom path or options from args
-        pass
-
-    # Generate the chat handler endpoint code
-    endpoint_code = f'''
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "ChatMessageData": """
 # Chat message data model
 class ChatMessageData(BaseModel):
     message: str
     chat_room: Optional[str] = "general"
     message_type: Optional[str] = "text"  # text, image, file
     reply_to: Optional[int] = None  # ID of message being replied to
-
+""",
+    "ChatRoomDB": """
 # Chat room database model
 class ChatRoomDB(Base):
     __tablename__ = "chat_rooms"
@@ -42,7 +23,8 @@ class ChatRoomDB(Base):
     is_private = Column(Boolean, default=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-
+""",
+    "ChatMessageDB": """
 # Chat message database model
 class ChatMessageDB(Base):
     __tablename__ = "chat_messages"
@@ -55,7 +37,32 @@ class ChatMessageDB(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_deleted = Column(Boolean, default=False)
+""",
+}
+
+
+def render_endpoint(args=None, props=None):
+    """
+    Render chat handler endpoint code.
+
+    Args:
+        args: String arguments from DSL (optional path parameters)
+        props: Dictionary of properties from DSL
+
+    Returns:
+        String containing FastAPI endpoint code
+    """
+    # Default values
+    endpoint_path = props.get("path", "/chat") if props else "/chat"
+    method = props.get("method", "POST").upper() if props else "POST"
+
+    # Support for inline args parsing if needed
+    if args:
+        # Could parse custom path or options from args
+        pass
 
+    # Generate the chat handler endpoint code
+    endpoint_code = f'''
 @app.{method.lower()}("{endpoint_path}")
 def chat_handler(chat_data: ChatMessageData, current_user: UserDB = Depends(get_current_user), db: Session = Depends(get_db)):
     """
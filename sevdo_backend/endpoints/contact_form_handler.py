@@ -3,6 +3,30 @@
 Contact form handler endpoint - processes contact form submissions.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "ContactFormData": """
+# Contact form data model
+class ContactFormData(BaseModel):
+    name: str
+    email: str
+    subject: Optional[str] = None
+    message: str
+""",
+    "ContactFormDB": """
+# Contact form database model
+class ContactFormDB(Base):
+    __tablename__ = "contact_forms"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    subject = Column(String, nullable=True)
+    message = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    is_read = Column(Boolean, default=False)
+""",
+}
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -26,24 +50,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the contact form handler endpoint code
     endpoint_code = f'''
-# Contact form data model
-class ContactFormData(BaseModel):
-    name: str
-    email: str
-    subject: Optional[str] = None
-    message: str
-
-# Contact form database model
-class ContactFormDB(Base):
-    __tablename__ = "contact_forms"
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    email = Column(String, nullable=False)
-    subject = Column(String, nullable=True)
-    message = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    is_read = Column(Boolean, default=False)
-
 @app.{method.lower()}("{endpoint_path}")
 def contact_form_handler(form_data: ContactFormData, db: Session = Depends(get_db)):
     """
@@ -3,6 +3,33 @@
 Email form handler endpoint - processes email form submissions from frontend.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "EmailFormData": """
+# Email form data model
+class EmailFormData(BaseModel):
+    to: str
+    subject: str
+    message: str
+    from_name: Optional[str] = None
+""",
+    "EmailLogDB": """
+# Email log database model
+class EmailLogDB(Base):
+    __tablename__ = "email_logs"
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String, nullable=False)
+    from_email = Column(String, nullable=True)
+    from_name = Column(String, nullable=True)
+    subject = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    status = Column(String, default="pending")  # pending, sent, failed
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+    error_message = Column(Text, nullable=True)
+""",
+}
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -29,27 +56,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the email form handler endpoint code
     endpoint_code = f'''
-# Email form data model
-class EmailFormData(BaseModel):
-    to: str
-    subject: str
-    message: str
-    from_name: Optional[str] = None
-
-# Email log database model
-class EmailLogDB(Base):
-    __tablename__ = "email_logs"
-    id = Column(Integer, primary_key=True, index=True)
-    to_email = Column(String, nullable=False)
-    from_email = Column(String, nullable=True)
-    from_name = Column(String, nullable=True)
-    subject = Column(String, nullable=False)
-    message = Column(Text, nullable=False)
-    status = Column(String, default="pending")  # pending, sent, failed
-    created_at = Column(DateTime, default=datetime.utcnow)
-    sent_at = Column(DateTime, nullable=True)
-    error_message = Column(Text, nullable=True)
-
 @app.{method.lower()}("{endpoint_path}")
 def email_form_handler(email_data: EmailFormData, current_user: UserDB = Depends(get_current_user), db: Session = Depends(get_db)):
     """
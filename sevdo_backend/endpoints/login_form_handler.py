@@ -3,6 +3,17 @@
 Login form handler endpoint - processes login form submissions from frontend.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "LoginFormData": """
+# Login form data model (more flexible than core User model)
+class LoginFormData(BaseModel):
+    username: str
+    password: str
+    remember_me: Optional[bool] = False
+""",
+}
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -26,12 +37,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the login form handler endpoint code
     endpoint_code = f'''
-# Login form data model (more flexible than core User model)
-class LoginFormData(BaseModel):
-    username: str
-    password: str
-    remember_me: Optional[bool] = False
-
 @app.{method.lower()}("{endpoint_path}")
 def login_form_handler(form_data: LoginFormData, db: Session = Depends(get_db)):
     """
@@ -3,6 +3,19 @@
 Register form handler endpoint - processes registration form submissions from frontend.
 """
 
+# Models this endpoint provides; the compiler emits each one once per app
+DEFINITIONS = {
+    "RegisterFormData": """
+# Register form data model
+class RegisterFormData(BaseModel):
+    username: str
+    email: str
+    password: str
+    confirm_password: str
+    accept_terms: Optional[bool] = False
+""",
+}
+
 
 def render_endpoint(args=None, props=None):
     """
@@ -31,14 +44,6 @@ def render_endpoint(args=None, props=None):
 
     # Generate the register form handler endpoint code
     endpoint_code = f'''
-# Register form data model
-class RegisterFormData(BaseModel):
-    username: str
-    email: str
-    password: str
-    confirm_password: str
-    accept_terms: Optional[bool] = False
-
 @app.{method.lower()}("{endpoint_path}")
 def register_form_handler(form_data: RegisterFormData, db: Session = Depends(get_db)):
     """
@@ -0,0 +1 @@
+"""Helpers shared by the SEVDO compiler services."""
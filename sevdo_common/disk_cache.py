@@ -0,0 +1,214 @@
+"""Persistent compile cache shared by all compiler workers.
+
+A single SQLite file under ``TRANSLATE_CACHE_DIR`` holds entries for every
+cache namespace (``dsl_to_jsx``, ``tokens_to_code``, ...). It sits behind the
+per-process in-memory caches: misses read through to disk, and results are
+written through so other workers and restarted pods start warm. Keys must be
+content-addressed by the caller, so entries never go stale and are only
+removed by the size cap (least recently used first).
+
+The tier is strictly best effort: any SQLite error is reported and treated as
+a miss, never as a failed request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Any, Optional
+
+CACHE_DIR = os.getenv("TRANSLATE_CACHE_DIR", "")
+CACHE_DIR_MAX_BYTES = int(os.getenv("TRANSLATE_CACHE_DIR_MAX_BYTES", "268435456"))
+CACHE_FILENAME = "compile-cache.sqlite3"
+
+# Reads refresh an entry's access time at most this often (seconds), so hot
+# keys do not turn every lookup into a write.
+_TOUCH_INTERVAL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    atime REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_atime ON entries (atime);
+CREATE TABLE IF NOT EXISTS usage (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO usage (id, bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_ins AFTER INSERT ON entries BEGIN
+    UPDATE usage SET bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_upd AFTER UPDATE OF size ON entries BEGIN
+    UPDATE usage SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_del AFTER DELETE ON entries BEGIN
+    UPDATE usage SET bytes = bytes - OLD.size WHERE id = 0;
+END;
+"""
+
+
+class DiskCache:
+    """One namespace of the shared on-disk cache.
+
+    Instances are thread-safe (one connection per thread) and any number of
+    processes may open the same file. ``max_bytes`` caps the whole file, not
+    just this namespace; eviction trims it to 90% of the cap so bursts of
+    writes do not evict on every insert.
+    """
+
+    def __init__(self, directory: str, namespace: str, max_bytes: int = CACHE_DIR_MAX_BYTES):
+        self.path = Path(directory) / CACHE_FILENAME
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str, n: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def _failed(self, op: str, exc: Exception):
+        self._count("errors")
+        print(f"Disk cache {op} failed ({self.path}): {exc}")
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, atime FROM entries WHERE ns = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            now = time()
+            if now - row[1] > _TOUCH_INTERVAL:
+                conn.execute(
+                    "UPDATE entries SET atime = ? WHERE ns = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+            self._count("hits")
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as exc:
+            self._failed("read", exc)
+            return None
+
+    def set(self, key: str, value: Any):
+        data = json.dumps(value, ensure_ascii=False)
+        # Character count; equals the stored bytes for the ASCII-only output
+        # the compilers produce, and avoids encoding large values twice
+        size = len(key) + len(data)
+        if size > self.max_bytes:
+            return
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO entries (ns, key, value, size, atime) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (ns, key) DO UPDATE SET"
+                " value = excluded.value, size = excluded.size, atime = excluded.atime",
+                (self.namespace, key, data, size, time()),
+            )
+            self._count("writes")
+            if self._usage(conn) > self.max_bytes:
+                self._evict(conn)
+        except sqlite3.Error as exc:
+            self._failed("write", exc)
+
+    def _usage(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT bytes FROM usage WHERE id = 0").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection):
+        target = int(self.max_bytes * 0.9)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-check under the write lock; another worker may have trimmed
+            excess = self._usage(conn) - target
+            victims = []
+            if excess > 0:
+                rows = conn.execute(
+                    "SELECT ns, key, size FROM entries ORDER BY atime"
+                )
+                for ns, key, size in rows:
+                    victims.append((ns, key))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                rows.close()
+            conn.executemany("DELETE FROM entries WHERE ns = ? AND key = ?", victims)
+            self._count("evictions", len(victims))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self):
+        try:
+            self._connect().execute(
+                "DELETE FROM entries WHERE ns = ?", (self.namespace,)
+            )
+        except sqlite3.Error as exc:
+            self._failed("clear", exc)
+
+    def stats(self) -> dict:
+        try:
+            conn = self._connect()
+            size = conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE ns = ?", (self.namespace,)
+            ).fetchone()[0]
+            total = self._usage(conn)
+        except sqlite3.Error as exc:
+            self._failed("stats", exc)
+            size, total = None, None
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "size": size,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "errors": self.errors,
+            }
+
+
+def disk_cache_from_env(namespace: str) -> Optional[DiskCache]:
+    """Open the shared cache for ``namespace``, or None when it is disabled.
+
+    The tier is enabled by pointing ``TRANSLATE_CACHE_DIR`` at a writable
+    directory (e.g. a volume mounted into every compiler container).
+    """
+    if not CACHE_DIR:
+        return None
+    try:
+        return DiskCache(CACHE_DIR, namespace, CACHE_DIR_MAX_BYTES)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"Disk cache disabled, cannot open {CACHE_DIR}: {exc}")
+        return None
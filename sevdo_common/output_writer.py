@@ -0,0 +1,281 @@
+"""Atomic, change-detecting writes for generated output files.
+
+Each output directory gets a small sidecar, ``.sevdo-manifest.jsonl``, that
+records the digest, size and mtime of every file written through this module.
+When an output's current size and mtime still match its entry, an unchanged
+result is detected from the digest alone, without reading the file back.
+Files the manifest does not know are compared by hashing them once, and only
+when the sizes match.
+
+Writes go to a temp file in the same directory and are renamed over the
+target, so readers never see a partial file and concurrent jobs writing the
+same output cannot interleave: the last rename wins. Symlinks are resolved
+first, so the file they point to is the one replaced, and a replaced file
+keeps its permission bits.
+
+The sidecar is append-only (one JSON line per write; the last line for a
+name wins) so concurrent writers in different processes never rewrite each
+other's entries. It is compacted once it holds twice as many lines as live
+entries. It is purely a hint: a lost or stale entry only costs a read.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import threading
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+MANIFEST_NAME = ".sevdo-manifest.jsonl"
+# Chunk size used when streaming data to or from disk
+_BLOCK = 1 << 16
+# Output directories whose manifest is kept in memory, least recent dropped
+_MANIFESTS_MAX = 256
+
+
+def _digest() -> "blake2b":
+    return blake2b(digest_size=20)
+
+
+class _Manifest:
+    """In-process view of one directory's sidecar, refreshed incrementally."""
+
+    def __init__(self, directory: Path):
+        self.path = directory / MANIFEST_NAME
+        self.entries: Dict[str, Tuple[str, int, int]] = {}
+        self.lines = 0
+        self._offset = 0
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        """Pick up lines appended (or a compaction done) by other writers."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            self.entries.clear()
+            self.lines = self._offset = 0
+            return
+        if size < self._offset:
+            self.entries.clear()
+            self.lines = self._offset = 0
+        if size == self._offset:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Only consume complete lines; a writer may be mid-append
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                rec = json.loads(line)
+                self.entries[rec["f"]] = (rec["d"], rec["s"], rec["m"])
+                self.lines += 1
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._offset += end
+
+    def lookup(self, name: str, st: Optional[os.stat_result]) -> Optional[str]:
+        """Digest of ``name`` if its entry still matches the file on disk."""
+        entry = self.entries.get(name)
+        if entry is None or st is None:
+            return None
+        digest, size, mtime_ns = entry
+        if (size, mtime_ns) != (st.st_size, st.st_mtime_ns):
+            return None
+        return digest
+
+    def record(self, name: str, digest: str, st: os.stat_result):
+        self.entries[name] = (digest, st.st_size, st.st_mtime_ns)
+        line = json.dumps(
+            {"f": name, "d": digest, "s": st.st_size, "m": st.st_mtime_ns},
+            separators=(",", ":"),
+        ).encode("utf-8") + b"\n"
+        try:
+            # O_APPEND keeps small concurrent appends whole
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            return
+        self.lines += 1
+        self._offset += len(line)
+        if self.lines > 2 * len(self.entries) + 16:
+            self._compact()
+
+    def _compact(self):
+        data = b"".join(
+            json.dumps(
+                {"f": name, "d": d, "s": s, "m": m}, separators=(",", ":")
+            ).encode("utf-8")
+            + b"\n"
+            for name, (d, s, m) in sorted(self.entries.items())
+        )
+        try:
+            _replace_atomically(self.path, [data])
+        except OSError:
+            return
+        self.lines = len(self.entries)
+        self._offset = len(data)
+
+
+# Resolved directory -> manifest, in least to most recently used order
+_MANIFESTS: Dict[Path, _Manifest] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def _manifest_for(directory: Path) -> _Manifest:
+    directory = directory.resolve()
+    with _MANIFESTS_LOCK:
+        manifest = _MANIFESTS.pop(directory, None)
+        if manifest is None:
+            manifest = _Manifest(directory)
+        _MANIFESTS[directory] = manifest
+        if len(_MANIFESTS) > _MANIFESTS_MAX:
+            # A writer still holding the evicted one is fine: the sidecar is
+            # append-only and shared with other processes anyway
+            del _MANIFESTS[next(iter(_MANIFESTS))]
+        return manifest
+
+
+def _target(path: str) -> Path:
+    """The file actually written for ``path``, through any symlinks."""
+    return Path(os.path.realpath(path))
+
+
+def _create_temp(path: Path) -> Tuple[int, str]:
+    """Open a new temp file beside ``path``.
+
+    Created with mode 0666 so the kernel applies the umask, as for a plain
+    ``open()``.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp = str(path.parent / f".{path.name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+
+
+def _commit(tmp: str, path: Path) -> os.stat_result:
+    """Rename ``tmp`` over ``path``, keeping the mode of the file it replaces.
+
+    Returns the stat of the new file taken before the rename, so a concurrent
+    writer replacing ``path`` right after cannot be mistaken for this one.
+    """
+    current = _stat(path)
+    if current is not None:
+        os.chmod(tmp, stat.S_IMODE(current.st_mode))
+    st = os.stat(tmp)
+    os.replace(tmp, path)
+    return st
+
+
+def _replace_atomically(path: Path, blocks: Iterable[bytes]) -> os.stat_result:
+    """Write ``blocks`` to a temp file beside ``path`` and rename it over it."""
+    fd, tmp = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for block in blocks:
+                f.write(block)
+        return _commit(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _file_digest(path: Path) -> str:
+    h = _digest()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _unchanged(manifest: _Manifest, path: Path, digest: str, nbytes: int) -> bool:
+    st = _stat(path)
+    known = manifest.lookup(path.name, st)
+    if known is not None:
+        return known == digest
+    if st is None or st.st_size != nbytes:
+        return False
+    # Not in the manifest (or touched since): hash it once and remember it
+    current = _file_digest(path)
+    manifest.record(path.name, current, st)
+    return current == digest
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Atomically write ``content`` unless ``path`` already holds it.
+
+    Returns True when the file was written.
+    """
+    p = _target(path)
+    data = content.encode("utf-8")
+    h = _digest()
+    h.update(data)
+    digest = h.hexdigest()
+    manifest = _manifest_for(p.parent)
+    with manifest.lock:
+        manifest.refresh()
+        if _unchanged(manifest, p, digest, len(data)):
+            return False
+        st = _replace_atomically(p, [data])
+        manifest.record(p.name, digest, st)
+    return True
+
+
+def write_chunks_if_changed(path: str, chunks: Iterable[str]) -> Tuple[bool, int]:
+    """Streaming variant of ``write_if_changed`` for content built in chunks.
+
+    The chunks are written to a temp file as they arrive, so the whole content
+    is never held in memory. Returns (changed, characters written).
+    """
+    p = _target(path)
+    h = _digest()
+    chars = 0
+
+    def encoded():
+        nonlocal chars
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            h.update(data)
+            chars += len(chunk)
+            yield data
+
+    fd, tmp = _create_temp(p)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for data in encoded():
+                f.write(data)
+            nbytes = f.tell()
+        digest = h.hexdigest()
+        manifest = _manifest_for(p.parent)
+        with manifest.lock:
+            manifest.refresh()
+            if _unchanged(manifest, p, digest, nbytes):
+                os.unlink(tmp)
+                return False, chars
+            manifest.record(p.name, digest, _commit(tmp, p))
+        return True, chars
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
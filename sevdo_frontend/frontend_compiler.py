@@ -1,55 +1,221 @@
 from __future__ import annotations
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Tuple, Dict
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+)
+from types import MappingProxyType
 from pathlib import Path
+from contextlib import asynccontextmanager
+from functools import partial
+import asyncio
+import atexit
+import importlib
+import inspect
+import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import re
+import sys
+import threading
 import concurrent.futures as cf
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
+from hashlib import blake2b
 import tempfile
+from time import monotonic
+
+import orjson
+
+from sevdo_common.disk_cache import DiskCache, disk_cache_from_env
+from sevdo_common.output_writer import write_chunks_if_changed, write_if_changed
+from sevdo_frontend.jsx_scanner import JSXElement, scan_jsx
+from sevdo_frontend.prefab_registry import (
+    PREFABS_DIR,
+    PrefabEntry,
+    arg_probes,
+    prefab_manifest,
+    prop_probes,
+)
+
+logger = logging.getLogger("sevdo_frontend")
+
+
+def _configure_logging():
+    """Log through a queue drained by a background thread.
+
+    Request handlers only enqueue records, so a slow or blocked stderr never
+    stalls the event loop.
+    """
+    if logger.handlers:
+        return
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    listener = logging.handlers.QueueListener(records, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(os.getenv("FRONTEND_LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
+
+_configure_logging()
 
 
 class ParseError(Exception):
-    pass
+    def __init__(self, message: str, pos: Optional[int] = None):
+        super().__init__(message)
+        # Offset into the (newline-normalised) source, when known
+        self.pos = pos
 
 
 # ----Component registry----
 COMPONENT_REGISTRY = {}
+# Tokens whose prefab declared COMPONENT_PURE: output depends only on
+# (args, props), so renders can be memoized
+PURE_COMPONENTS = set()
+
+
+# Digest of the compiler, every loaded prefab source and any components
+# registered at runtime. Part of each cache key, so cached output is
+# invalidated whenever the renderers change.
+PREFAB_REGISTRY_VERSION = ""
+# Digest of the compiler and prefab sources alone, set by load_prefabs
+_PREFAB_SOURCES_VERSION = ""
+# token -> identity of a component registered at runtime. Tied to this
+# process and registration, as a function's source does not capture what it
+# closes over, so the shared disk cache never mixes two processes' overrides.
+_RUNTIME_COMPONENTS: Dict[str, str] = {}
+_RUNTIME_REGISTRATIONS = 0
 
 
-def register_component(token, render_func):
+def _set_component(token, render_func, pure=False):
     COMPONENT_REGISTRY[token] = render_func
+    if pure:
+        PURE_COMPONENTS.add(token)
+    else:
+        PURE_COMPONENTS.discard(token)
+    _invalidate_fingerprints()
+
+
+def register_component(token, render_func, pure=False):
+    """Add or override a component at runtime.
+
+    Changes the registry version, so cached compiles miss, and drops
+    memoized prefab renders, which may contain the token's old output.
+    """
+    global PREFAB_REGISTRY_VERSION, _RUNTIME_REGISTRATIONS
+    with _PREFAB_IMPORT_LOCK:
+        _set_component(token, render_func, pure)
+        _RUNTIME_REGISTRATIONS += 1
+        name = getattr(render_func, "__qualname__", type(render_func).__name__)
+        _RUNTIME_COMPONENTS[token] = (
+            f"{os.getpid()}:{_RUNTIME_REGISTRATIONS}:"
+            f"{getattr(render_func, '__module__', '')}.{name}:{int(pure)}"
+        )
+        PREFAB_REGISTRY_VERSION = _with_runtime_components(_PREFAB_SOURCES_VERSION)
+    PREFAB_MEMO.clear()
 
 
-def load_prefabs():
-    prefabs_dir = Path(__file__).parent / "prefabs"
-    if not prefabs_dir.exists():
-        return
+def _registry_version(entries: List[PrefabEntry]) -> str:
+    h = blake2b(Path(__file__).read_bytes(), digest_size=8)
+    for entry in entries:
+        h.update(entry.file.encode())
+        h.update(bytes.fromhex(entry.digest))
+    return h.hexdigest()
 
-    import importlib.util
-    import sys
 
-    for file in prefabs_dir.glob("*.py"):
-        if file.name == "__init__.py":
-            continue
-        try:
-            # Import using file path instead of module name
-            spec = importlib.util.spec_from_file_location(file.stem, file)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[file.stem] = module
-                spec.loader.exec_module(module)
-
-                if hasattr(module, "COMPONENT_TOKEN") and hasattr(
-                    module, "render_prefab"
-                ):
-                    register_component(
-                        module.COMPONENT_TOKEN, module.render_prefab)
-        except Exception as e:
-            print(f"Error loading component {file.name}: {e}")
-            # Skip files that can't be imported
-            pass
+def _with_runtime_components(version: str) -> str:
+    if not _RUNTIME_COMPONENTS:
+        return version
+    h = blake2b(version.encode(), digest_size=8)
+    for token, identity in sorted(_RUNTIME_COMPONENTS.items()):
+        h.update(f"{token}={identity}\n".encode())
+    return h.hexdigest()
+
+
+class _LazyPrefab:
+    """Registry stub that imports its prefab module on first render."""
+
+    __slots__ = ("token", "module")
+
+    def __init__(self, token: str, module: str):
+        self.token = token
+        self.module = module
+
+    def __call__(self, args, props):
+        render = self.resolve()
+        if render is None:
+            return _jsx_for_token(self.token, args, props)
+        return render(args, props)
+
+    def resolve(self):
+        """Import the prefab now; returns its render function or None."""
+        with _PREFAB_IMPORT_LOCK:
+            render = COMPONENT_REGISTRY.get(self.token)
+            if render is self:
+                try:
+                    render = importlib.import_module(self.module).render_prefab
+                except Exception as e:
+                    logger.error("Error loading component %s: %s", self.module, e)
+                    # Same as a prefab that failed to load eagerly: the token
+                    # falls back to the built-in renderer, if any
+                    COMPONENT_REGISTRY.pop(self.token, None)
+                    PURE_COMPONENTS.discard(self.token)
+                    render = None
+                else:
+                    COMPONENT_REGISTRY[self.token] = render
+        return render
+
+
+_PREFAB_IMPORT_LOCK = threading.RLock()
+
+
+def preload_prefabs():
+    """Import every lazily registered prefab (e.g. in a fresh worker process)."""
+    for render in list(COMPONENT_REGISTRY.values()):
+        if isinstance(render, _LazyPrefab):
+            render.resolve()
+
+
+def load_prefabs():
+    """Register every prefab from the manifest as a lazy stub.
+
+    Modules are imported as ``sevdo_frontend.prefabs.<name>`` the first time
+    their token is rendered.
+    """
+    global PREFAB_REGISTRY_VERSION, _PREFAB_SOURCES_VERSION
+    entries: List[PrefabEntry] = []
+    if PREFABS_DIR.exists():
+        entries = [e for e in prefab_manifest(PREFABS_DIR) if e.token]
+    with _PREFAB_IMPORT_LOCK:
+        for entry in entries:
+            _set_component(
+                entry.token, _LazyPrefab(entry.token, entry.module), pure=entry.pure
+            )
+            # The manifest's prefab replaces any runtime override
+            _RUNTIME_COMPONENTS.pop(entry.token, None)
+        _PREFAB_SOURCES_VERSION = _registry_version(entries)
+        PREFAB_REGISTRY_VERSION = _with_runtime_components(_PREFAB_SOURCES_VERSION)
+    PREFAB_MEMO.clear()
 
 
 def _split_top_level(content: str) -> List[str]:
@@ -96,52 +262,111 @@ def _parse_invocation(stmt: str) -> Tuple[str, Optional[str], Dict[str, str]]:
 # ----------------- Nested DSL parser -----------------
 
 CONTAINER_TOKENS = {"c", "f"}
+# Tokens rendered by BUILTIN_RENDERERS when no prefab overrides them
+BUILTIN_TOKENS = frozenset({"h", "t", "i", "b", "c", "f", "n", "img", "sel"})
 
 
-class _Cursor:
-    def __init__(self, text: str):
-        self.text = text
-        self.pos = 0
+class DSLToken(NamedTuple):
+    kind: str  # "ident", "open", "close", "args" or "props"
+    start: int
+    end: int
 
-    def eof(self) -> bool:
-        return self.pos >= len(self.text)
 
-    def peek(self) -> str:
-        return self.text[self.pos] if not self.eof() else ""
+# Comment lines (first non-blank chars are // or #) are only recognised at the
+# start of a line, hence MULTILINE and the comment alternative coming first.
+_COMMENT = r"^[^\S\n]*(?://|\#)[^\n]*"
+_TRIVIA_RE = re.compile(r"(?:" + _COMMENT + r"|[^\S\n]+|\n)*", re.MULTILINE)
+# Letters only, matching the previous isalpha() walk
+_IDENT_RE = re.compile(r"[^\W\d_]+")
+_BALANCED_RE = {
+    "(": re.compile(r"(?P<comment>" + _COMMENT + r")|[()]", re.MULTILINE),
+    "{": re.compile(r"(?P<comment>" + _COMMENT + r")|[{}]", re.MULTILINE),
+}
 
-    def advance(self, n: int = 1):
-        self.pos += n
 
-    def skip_ws(self):
-        while not self.eof() and self.text[self.pos].isspace():
-            self.pos += 1
+def _normalize_newlines(source: str) -> str:
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
 
 
-def _parse_identifier(cur: _Cursor) -> str:
-    start = cur.pos
-    while not cur.eof() and cur.text[cur.pos].isalpha():
-        cur.pos += 1
-    return cur.text[start: cur.pos]
+class DSLScanner:
+    """Single-pass, pull-based lexer for the DSL.
 
+    The parser asks for the next token and the scanner only ever moves
+    forward, so every character is looked at once no matter how deeply
+    containers are nested. Argument and prop bodies are returned as one
+    token spanning their inner text.
+    """
 
-def _extract_balanced(cur: _Cursor, open_ch: str, close_ch: str) -> str:
-    if cur.peek() != open_ch:
-        return ""
-    cur.advance(1)
-    depth = 1
-    start = cur.pos
-    while not cur.eof():
-        ch = cur.peek()
-        if ch == open_ch:
-            depth += 1
-        elif ch == close_ch:
-            depth -= 1
-            if depth == 0:
-                content = cur.text[start: cur.pos]
-                cur.advance(1)
-                return content
-        cur.advance(1)
-    raise ParseError("Unbalanced parentheses or braces in DSL")
+    def __init__(self, source: str):
+        self.source = _normalize_newlines(source)
+        self.pos = 0
+        # Comment spans seen inside the last args/props token
+        self.comments: List[Tuple[int, int]] = []
+
+    def skip_trivia(self):
+        self.pos = _TRIVIA_RE.match(self.source, self.pos).end()
+
+    def peek(self) -> str:
+        return self.source[self.pos: self.pos + 1]
+
+    def ident(self) -> Optional[DSLToken]:
+        m = _IDENT_RE.match(self.source, self.pos)
+        if not m:
+            return None
+        self.pos = m.end()
+        return DSLToken("ident", m.start(), m.end())
+
+    def char(self, kind: str) -> DSLToken:
+        start = self.pos
+        self.pos += 1
+        return DSLToken(kind, start, self.pos)
+
+    def balanced(self, kind: str, opened: Optional[int] = None) -> DSLToken:
+        """Consume a bracketed body and return a token for its inner text.
+
+        Starts on the opening bracket, or, when ``opened`` (the offset of an
+        already consumed bracket) is given, somewhere inside its body; the
+        latter is used to skip the rest of a container.
+        """
+        open_ch = "(" if kind == "args" else "{"
+        if opened is None:
+            opened, depth, start = self.pos, 0, self.pos + 1
+        else:
+            depth, start = 1, self.pos
+        self.comments = []
+        for m in _BALANCED_RE[open_ch].finditer(self.source, self.pos):
+            if m.lastgroup == "comment":
+                self.comments.append(m.span())
+            elif m.group() == open_ch:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self.pos = m.end()
+                    return DSLToken(kind, start, m.start())
+        line = self.source.count("\n", 0, opened) + 1
+        column = opened - self.source.rfind("\n", 0, opened)
+        raise ParseError(
+            "Unbalanced parentheses or braces in DSL "
+            f"(opened at line {line}, column {column})",
+            pos=opened,
+        )
+
+    def text(self, tok: DSLToken) -> str:
+        """Source text of a token, minus any comment lines inside it."""
+        if tok.kind not in ("args", "props") or not self.comments:
+            return self.source[tok.start: tok.end]
+        # Drop comment lines with their newline, as the old line-based
+        # comment stripper did
+        pieces = []
+        cursor = tok.start
+        for c_start, c_end in self.comments:
+            pieces.append(self.source[cursor:c_start])
+            cursor = c_end + 1 if self.source.startswith("\n", c_end) else c_end
+        pieces.append(self.source[cursor: tok.end])
+        return "".join(pieces)
 
 
 def _parse_props_from_text(text: str) -> Dict[str, str]:
@@ -160,74 +385,126 @@ def _parse_props_from_text(text: str) -> Dict[str, str]:
     return props
 
 
+# Shared, read-only defaults for the (very common) leaf nodes without props
+# or children, so those don't each allocate an empty dict and list.
+_EMPTY_PROPS: Mapping[str, str] = MappingProxyType({})
+_EMPTY_CHILDREN: Tuple["Node", ...] = ()
+# Node.parsed of nodes whose args have not been parsed (built by hand)
+_UNPARSED = object()
+
+
 class Node:
+    """One DSL statement.
+
+    ``start``/``end`` are source offsets of the whole statement, from the
+    token name through its closing paren or brace. Children are stored as a
+    tuple; props and children fall back to shared empty objects. For built-in
+    tokens the parser also stores the parsed args in ``parsed``.
+    """
+
+    __slots__ = ("token", "args", "props", "children", "start", "end", "parsed")
+
     def __init__(
         self,
         token: str,
         args: Optional[str] = None,
-        props: Optional[Dict[str, str]] = None,
-        children: Optional[List["Node"]] = None,
+        props: Optional[Mapping[str, str]] = None,
+        children: Optional[Tuple["Node", ...]] = None,
+        start: int = 0,
+        end: int = 0,
+        parsed: object = None,
     ):
         self.token = token
         self.args = args
-        self.props = props or {}
-        self.children = children or []
+        # Args of a built-in token as its BuiltinRenderer.parse returned them
+        self.parsed = _UNPARSED if parsed is None else parsed
+        self.props = props or _EMPTY_PROPS
+        self.children = tuple(children) if children else _EMPTY_CHILDREN
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return (
+            f"Node({self.token!r}, args={self.args!r}, props={dict(self.props)!r}, "
+            f"children={len(self.children)}, span=({self.start}, {self.end}))"
+        )
 
 
-def _parse_statement(cur: _Cursor) -> Optional[Node]:
-    cur.skip_ws()
-    if cur.eof():
-        return None
-    token = _parse_identifier(cur)
-    if not token:
-        return None
+class _Parser:
+    """Recursive-descent parser on top of ``DSLScanner``.
 
-    cur.skip_ws()
-    args_text: Optional[str] = None
-    children: List[Node] = []
-    if cur.peek() == "(":
-        inner = _extract_balanced(cur, "(", ")")
-        # For container tokens, parse children from inner
-        if token in CONTAINER_TOKENS:
-            child_cur = _Cursor(inner)
-            kids: List[Node] = []
-            while True:
-                child = _parse_statement(child_cur)
-                if child is None:
-                    break
-                kids.append(child)
-            children = kids
-        else:
-            args_text = inner.strip()
+    Containers parse their children in place; nothing is sliced out and
+    scanned again.
+    """
 
-    cur.skip_ws()
-    props: Dict[str, str] = {}
-    if cur.peek() == "{":
-        props_text = _extract_balanced(cur, "{", "}")
-        props = _parse_props_from_text(props_text)
+    def __init__(self, source: str):
+        self.scanner = DSLScanner(source)
 
-    return Node(token=token, args=args_text, props=props, children=children)
+    def parse_statement(self) -> Optional[Node]:
+        sc = self.scanner
+        sc.skip_trivia()
+        ident = sc.ident()
+        if ident is None:
+            return None
+        token = sc.text(ident)
+
+        end = ident.end
+        sc.skip_trivia()
+        args_text: Optional[str] = None
+        children: List[Node] = []
+        if sc.peek() == "(":
+            if token in CONTAINER_TOKENS:
+                opened = sc.char("open").start
+                while True:
+                    child = self.parse_statement()
+                    if child is None:
+                        break
+                    children.append(child)
+                sc.skip_trivia()
+                if sc.peek() == ")":
+                    sc.char("close")
+                else:
+                    # Whatever follows an unparsable child is ignored up to
+                    # the container's closing paren
+                    sc.balanced("args", opened=opened)
+            else:
+                args_text = sc.text(sc.balanced("args")).strip()
+            end = sc.pos
+
+        sc.skip_trivia()
+        props: Mapping[str, str] = _EMPTY_PROPS
+        if sc.peek() == "{":
+            props = _parse_props_from_text(sc.text(sc.balanced("props")))
+            end = sc.pos
+
+        builtin = BUILTIN_RENDERERS.get(token)
+        return Node(
+            token=token,
+            args=args_text,
+            props=props,
+            children=children,
+            start=ident.start,
+            end=end,
+            parsed=builtin.parse(args_text) if builtin else None,
+        )
 
 
-def parse_dsl(source: str) -> List[Node]:
-    def _strip_comments(src: str) -> str:
-        lines = src.splitlines()
-        out = []
-        for ln in lines:
-            s = ln.lstrip()
-            if s.startswith("//") or s.startswith("#"):
-                continue
-            out.append(ln)
-        return "\n".join(out)
+    def parse_all(self) -> List[Node]:
+        nodes: List[Node] = []
+        while True:
+            node = self.parse_statement()
+            if node is None:
+                return nodes
+            nodes.append(node)
 
-    cur = _Cursor(_strip_comments(source))
-    nodes: List[Node] = []
-    while True:
-        node = _parse_statement(cur)
-        if node is None:
-            break
-        nodes.append(node)
-    return nodes
+    def at_end(self) -> bool:
+        """True when nothing but whitespace/comments is left unparsed."""
+        self.scanner.skip_trivia()
+        return self.scanner.pos >= len(self.scanner.source)
+
+
+def parse_dsl(source: str) -> List[Node]:
+    return _Parser(source).parse_all()
 
 
 def _join_class_names(existing: Optional[str], extra: Optional[str]) -> str:
@@ -238,6 +515,138 @@ def _join_class_names(existing: Optional[str], extra: Optional[str]) -> str:
     return existing or extra
 
 
+# ----------------- Built-in tokens -----------------
+
+
+class BuiltinRenderer(NamedTuple):
+    """How one built-in token turns into JSX.
+
+    ``parse`` converts the raw args once, when the statement is parsed; the
+    result is kept on the node and handed to ``render`` with the props.
+    """
+
+    parse: Callable[[Optional[str]], object]
+    render: Callable[[object, Mapping[str, str]], str]
+
+
+def _split_list(args: Optional[str]) -> Tuple[str, ...]:
+    if not args:
+        return ()
+    return tuple(part.strip() for part in args.split(",") if part.strip())
+
+
+def _strip_or(default: str) -> Callable[[Optional[str]], str]:
+    return lambda args: (args or default).strip()
+
+
+def _parse_input(args: Optional[str]) -> Tuple[str, Dict[str, str]]:
+    """``placeholder[, key=value...]``: first part without '=' is the placeholder."""
+    placeholder = ""
+    inline_props: Dict[str, str] = {}
+    parts = list(_split_list(args))
+    if parts and "=" not in parts[0]:
+        placeholder = parts.pop(0)
+    for part in parts:
+        if "=" in part:
+            k, v = part.split("=", 1)
+            inline_props[k.strip()] = v.strip()
+    return placeholder, inline_props
+
+
+def _render_input(parsed, props: Mapping[str, str]) -> str:
+    placeholder, inline_props = parsed
+    field = (
+        f'<input className="border rounded px-3 py-2 w-full" '
+        f'placeholder="{placeholder}" />'
+    )
+    # Merge priority: props from {} override inline
+    label = props.get("label") or inline_props.get("label")
+    if label:
+        return (
+            f'<label className="block">'
+            f'<span className="mb-1 block">{label}</span>'
+            f"{field}"
+            f"</label>"
+        )
+    return field
+
+
+def _render_button(label: str, props: Mapping[str, str]) -> str:
+    on_click = props.get("onClick")
+    handler = (" onClick={" + on_click + "}") if on_click else ""
+    return (
+        f'<button className="bg-blue-600 hover:bg-blue-700 text-white '
+        f'font-medium px-4 py-2 rounded"{handler}>{label}</button>'
+    )
+
+
+def _container_tags(token: str, props: Mapping[str, str]) -> Tuple[str, str]:
+    if token == "c":
+        class_name = _join_class_names("flex flex-col gap-4", props.get("class"))
+        return f'<div className="{class_name}">', "</div>"
+    return "<form>", "</form>"
+
+
+def _render_nav(links: Tuple[str, ...], props: Mapping[str, str]) -> str:
+    items = "".join(
+        f'<a className="px-3 py-2 hover:underline" href="#">{link}</a>'
+        for link in links
+    )
+    return f'<nav className="flex gap-2">{items}</nav>'
+
+
+def _parse_image(args: Optional[str]) -> str:
+    # args like: src=logo.png or just logo.png
+    if not args:
+        return ""
+    return (args.split("=", 1)[1] if "=" in args else args).strip()
+
+
+def _render_image(src: str, props: Mapping[str, str]) -> str:
+    alt = props.get("alt", "")
+    return f'<img className="max-w-full" src="{src}" alt="{alt}" />'
+
+
+def _render_select(options: Tuple[str, ...], props: Mapping[str, str]) -> str:
+    opts = "".join(
+        f'<option key="{o}" value="{o}">{o}</option>' for o in options
+    )
+    return f'<select className="border rounded px-3 py-2">{opts}</select>'
+
+
+def _no_args(args: Optional[str]) -> None:
+    return None
+
+
+# Token -> renderer for everything rendered without a prefab. Containers
+# render their children in _iter_node; called directly they render empty.
+BUILTIN_RENDERERS: Mapping[str, BuiltinRenderer] = MappingProxyType(
+    {
+        # h — Header
+        "h": BuiltinRenderer(_strip_or("Header"), lambda text, props: f"<h1>{text}</h1>"),
+        # t — Text/Paragraph
+        "t": BuiltinRenderer(_strip_or(""), lambda text, props: f"<p>{text}</p>"),
+        # i — Input (placeholder and optional label)
+        "i": BuiltinRenderer(_parse_input, _render_input),
+        # b — Button (text from args; onClick prop supported)
+        "b": BuiltinRenderer(_strip_or("Click"), _render_button),
+        "c": BuiltinRenderer(_no_args, lambda _, props: "".join(_container_tags("c", props))),
+        "f": BuiltinRenderer(_no_args, lambda _, props: "".join(_container_tags("f", props))),
+        # n — Navbar
+        "n": BuiltinRenderer(_split_list, _render_nav),
+        # img — Image
+        "img": BuiltinRenderer(_parse_image, _render_image),
+        # sel — Select
+        "sel": BuiltinRenderer(_split_list, _render_select),
+    }
+)
+if BUILTIN_RENDERERS.keys() != BUILTIN_TOKENS:
+    raise RuntimeError(
+        "BUILTIN_RENDERERS and BUILTIN_TOKENS disagree: "
+        f"{sorted(BUILTIN_RENDERERS.keys() ^ BUILTIN_TOKENS)}"
+    )
+
+
 def _jsx_for_token(
     token: str,
     args: Optional[str],
@@ -245,192 +654,985 @@ def _jsx_for_token(
 ) -> str:
     token = token.strip()
 
-    if token in COMPONENT_REGISTRY:
-        return COMPONENT_REGISTRY[token](args, props)
-
-    # h — Header
-    if token == "h":
-        text = (args or "Header").strip()
-        return f"<h1>{text}</h1>"
-
-    # t — Text/Paragraph
-    if token == "t":
-        text = (args or "").strip()
-        return f"<p>{text}</p>"
-
-    # i — Input (supports placeholder and optional label prop)
-    if token == "i":
-        raw_args = (args or "").strip()
-        placeholder = ""
-        inline_props: Dict[str, str] = {}
-        if raw_args:
-            parts = [p.strip() for p in raw_args.split(",") if p.strip()]
-            if parts:
-                # First part without '=' is placeholder
-                if "=" not in parts[0]:
-                    placeholder = parts[0]
-                    parts = parts[1:]
-                for part in parts:
-                    if "=" in part:
-                        k, v = part.split("=", 1)
-                        inline_props[k.strip()] = v.strip()
-        # Merge priority: props from {} override inline
-        effective_label = props.get("label") or inline_props.get("label")
-        if effective_label:
-            return (
-                f'<label className="block">'
-                f'<span className="mb-1 block">{effective_label}</span>'
-                f'<input className="border rounded px-3 py-2 w-full" '
-                f'placeholder="{placeholder}" />'
-                f"</label>"
-            )
-        return (
-            f'<input className="border rounded px-3 py-2 w-full" '
-            f'placeholder="{placeholder}" />'
+    render = COMPONENT_REGISTRY.get(token)
+    if render is not None:
+        if token in PURE_COMPONENTS:
+            return _render_pure(token, render, args, props)
+        return render(args, props)
+
+    builtin = BUILTIN_RENDERERS.get(token)
+    if builtin is None:
+        raise ParseError(f"Unknown token: {token}")
+    return builtin.render(builtin.parse(args), props)
+
+
+def _jsx_for_node(node: Node) -> str:
+    """``_jsx_for_token`` for a parsed leaf, reusing its pre-parsed args."""
+    if node.parsed is _UNPARSED or node.token in COMPONENT_REGISTRY:
+        return _jsx_for_token(node.token, node.args, node.props)
+    return BUILTIN_RENDERERS[node.token].render(node.parsed, node.props)
+
+
+def _iter_node(node: Node, level: int = 1) -> Iterator[str]:
+    """Yield the JSX of ``node`` as chunks, depth-first.
+
+    Uses an explicit stack instead of recursion, so output is produced in a
+    single pass without intermediate per-level joins and without a recursion
+    limit on nesting depth.
+    """
+    # Items are either literal chunks or (node, level) still to be rendered
+    stack: list = [(node, level)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+        node, level = item
+        indent = "  " * level
+        if node.token not in CONTAINER_TOKENS:
+            # Leaf
+            yield indent + _jsx_for_node(node)
+            continue
+        open_tag, close_tag = _container_tags(node.token, node.props)
+        if not node.children:
+            yield f"{indent}{open_tag}{close_tag}"
+            continue
+        yield f"{indent}{open_tag}\n"
+        stack.append(f"\n{indent}{close_tag}")
+        children = node.children
+        for idx in range(len(children) - 1, -1, -1):
+            stack.append((children[idx], level + 1))
+            if idx:
+                stack.append("\n")
+
+
+def _render_node(node: Node, level: int = 1) -> str:
+    return "".join(_iter_node(node, level))
+
+
+def _wrap_component(
+    fragments: List[str], include_imports: bool, component_name: str
+) -> str:
+    """Splice rendered statements into the component in a single join."""
+    head, tail = _component_parts(include_imports, component_name)
+    return "\n".join([head, *(fragments or [""]), tail])
+
+
+def _component_parts(include_imports: bool, component_name: str) -> Tuple[str, str]:
+    if not include_imports:
+        return "<>", "</>\n"
+    # Minimal imports suitable for Tailwind React apps
+    head = (
+        "import React from 'react';\n\n"
+        f"export default function {component_name}() {{\n"
+        "  return (\n<>"
+    )
+    return head, "</>\n  );\n}\n"
+
+
+def _iter_component(
+    nodes: List[Node], include_imports: bool, component_name: str
+) -> Iterator[str]:
+    head, tail = _component_parts(include_imports, component_name)
+    yield head
+    if not nodes:
+        yield "\n"
+    for node in nodes:
+        yield "\n"
+        yield from _iter_node(node)
+    yield "\n"
+    yield tail
+
+
+def iter_jsx(
+    dsl_source: str,
+    include_imports: bool = True,
+    component_name: str = "GeneratedComponent",
+) -> Iterator[str]:
+    """Render DSL as a stream of JSX chunks.
+
+    The source is parsed eagerly, so syntax errors raise here rather than
+    part-way through the stream; unknown tokens are only found while
+    rendering (see ``check_tokens``).
+    """
+    return _iter_component(parse_dsl(dsl_source), include_imports, component_name)
+
+
+def dsl_to_jsx(
+    dsl_source: str,
+    include_imports: bool = True,
+    component_name: str = "GeneratedComponent",
+) -> str:
+    """Convert DSL (with optional nesting) into a React component string."""
+    return "".join(iter_jsx(dsl_source, include_imports, component_name))
+
+
+def write_jsx(
+    dsl_source: str,
+    out: TextIO,
+    include_imports: bool = True,
+    component_name: str = "GeneratedComponent",
+) -> int:
+    """Render DSL straight into a text stream; returns characters written."""
+    written = 0
+    for chunk in _batched(iter_jsx(dsl_source, include_imports, component_name)):
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _batched(chunks: Iterable[str], size: int = 65536) -> Iterator[str]:
+    """Coalesce small chunks into pieces of roughly ``size`` characters."""
+    buf: List[str] = []
+    pending = 0
+    for chunk in chunks:
+        buf.append(chunk)
+        pending += len(chunk)
+        if pending >= size:
+            yield "".join(buf)
+            buf.clear()
+            pending = 0
+    if buf:
+        yield "".join(buf)
+
+
+def check_tokens(nodes: List[Node]):
+    """Raise ParseError for the first token no renderer knows about."""
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        token = node.token.strip()
+        if token not in COMPONENT_REGISTRY and token not in BUILTIN_TOKENS:
+            raise ParseError(f"Unknown token: {token}", pos=node.start)
+        stack.extend(node.children)
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the common prefix, compared in galloping C-level chunks."""
+    n = min(len(a), len(b))
+    lo, step = 0, 256
+    while lo < n:
+        hi = min(lo + step, n)
+        if a.startswith(b[lo:hi], lo):
+            lo, step = hi, step * 2
+            continue
+        # The first difference is in [lo, hi)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if a.startswith(b[lo:mid], lo):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+    return n
+
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix, at most ``limit`` characters."""
+    la, lb = len(a), len(b)
+    lo, step = 0, 256
+    while lo < limit:
+        hi = min(lo + step, limit)
+        if a.endswith(b[lb - hi: lb - lo], 0, la - lo):
+            lo, step = hi, step * 2
+            continue
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if a.endswith(b[lb - mid: lb - lo], 0, la - lo):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+    return limit
+
+
+class IncrementalCompiler:
+    """Recompile one page, re-rendering only the statements that changed.
+
+    Each top-level statement is hashed on its source text and its rendered
+    JSX fragment cached under that hash. On ``compile`` the new source is
+    diffed against the previous one; only the statements overlapping the
+    edited lines are re-parsed, and only statements whose hash is new are
+    rendered before the fragments are spliced back together. Whenever the
+    edited region does not parse cleanly on its own (unbalanced brackets,
+    junk, props continuing a neighbouring statement) it falls back to a
+    full compile, so the output always equals ``dsl_to_jsx``. Fragments
+    are only reused while ``PREFAB_REGISTRY_VERSION`` stays the same; after
+    ``register_component`` or ``load_prefabs`` the next call compiles in full.
+
+    One instance may be shared between threads (a file watcher and a
+    request handler, say): calls are serialised, since each one diffs
+    against and replaces the state the previous call left.
+    """
+
+    def __init__(
+        self,
+        include_imports: bool = True,
+        component_name: str = "GeneratedComponent",
+        max_fragments: int = 4096,
+    ):
+        self.include_imports = include_imports
+        self.component_name = component_name
+        self.max_fragments = max_fragments
+        self._source: Optional[str] = None
+        self._output = ""
+        # Parallel per-statement lists for the current page: source span,
+        # digest of the statement text and its rendered JSX
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._digests: List[bytes] = []
+        self._rendered: List[str] = []
+        self._fragments: Dict[bytes, str] = {}
+        # PREFAB_REGISTRY_VERSION the fragments were rendered under
+        self._registry_version: Optional[str] = None
+        self.stats = {"full": 0, "incremental": 0, "rendered": 0, "reused": 0}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._source = None
+            self._fragments.clear()
+
+    def compile(self, dsl_source: str) -> str:
+        with self._lock:
+            return self._compile(dsl_source)
+
+    def _compile(self, dsl_source: str) -> str:
+        source = _normalize_newlines(dsl_source)
+        if PREFAB_REGISTRY_VERSION != self._registry_version:
+            self._source = None
+            self._fragments.clear()
+            self._registry_version = PREFAB_REGISTRY_VERSION
+        if source == self._source:
+            return self._output
+        page = None
+        if self._source is not None:
+            page = self._recompile_region(source)
+        if page is None:
+            page = self._parse_range(source, 0, len(source))
+            if page is None:
+                # Let the regular compiler raise / stop exactly as it would
+                self._source = None
+                return dsl_to_jsx(dsl_source, self.include_imports, self.component_name)
+            self.stats["full"] += 1
+        else:
+            self.stats["incremental"] += 1
+        self._starts, self._ends, self._digests, self._rendered = page
+        if len(self._fragments) > self.max_fragments:
+            self._fragments = dict(zip(self._digests, self._rendered))
+        self._source = source
+        self._output = _wrap_component(
+            self._rendered, self.include_imports, self.component_name
         )
+        return self._output
 
-    # b — Button (text taken from args; onClick prop supported)
-    if token == "b":
-        label = (args or "Click").strip()
-        on_click = props.get("onClick")
-        handler = (" onClick={" + on_click + "}") if on_click else ""
+    def _recompile_region(self, source: str):
+        old = self._source
+        prefix = _common_prefix_len(old, source)
+        suffix = _common_suffix_len(
+            old, source, min(len(old), len(source)) - prefix
+        )
+        # Widen the edit to whole lines: comments are line-based
+        line_start = old.rfind("\n", 0, prefix) + 1
+        line_end = old.find("\n", len(old) - suffix)
+        if line_end == -1:
+            line_end = len(old)
+
+        # Statements [i, j) overlap the edited lines and are re-parsed; the
+        # ones before and after are reused as they are.
+        i = bisect_right(self._ends, line_start)
+        j = bisect_left(self._starts, line_end, i)
+        start = min(line_start, self._starts[i]) if i < j else line_start
+        stop = max(line_end, self._ends[j - 1]) if i < j else line_end
+
+        shift = len(source) - len(old)
+        region = self._parse_range(source, start, stop + shift)
+        if region is None:
+            return None
+        starts, ends, digests, rendered = region
+        tail_starts = self._starts[j:]
+        tail_ends = self._ends[j:]
+        if shift:
+            tail_starts = [n + shift for n in tail_starts]
+            tail_ends = [n + shift for n in tail_ends]
         return (
-            f'<button className="bg-blue-600 hover:bg-blue-700 text-white '
-            f'font-medium px-4 py-2 rounded"{handler}>{label}</button>'
-        )
-
-    # Containers are rendered in the recursive renderer below
-    if token in CONTAINER_TOKENS:
-        # Fallback minimal if called directly
-        if token == "c":
-            base = "flex flex-col gap-4"
-            extra = props.get("class")
-            class_name = _join_class_names(base, extra)
-            return f'<div className="{class_name}"></div>'
-        if token == "f":
-            return "<form></form>"
-
-    # n — Navbar
-    if token == "n":
-        links = (args or "").split(",") if args else []
-        items = "".join(
-            [
-                f'<a className="px-3 py-2 hover:underline" href="#">{link.strip()}</a>'
-                for link in links
-                if link.strip()
-            ]
+            self._starts[:i] + starts + tail_starts,
+            self._ends[:i] + ends + tail_ends,
+            self._digests[:i] + digests + self._digests[j:],
+            self._rendered[:i] + rendered + self._rendered[j:],
         )
-        return f'<nav className="flex gap-2">{items}</nav>'
 
-    # img — Image
-    if token == "img":
-        src = ""
-        if args:
-            # args like: src=logo.png or just logo.png
-            if "=" in args:
-                _, src = args.split("=", 1)
+    def _parse_range(self, source: str, start: int, stop: int):
+        """Parse ``source[start:stop]`` as top-level statements.
+
+        Returns per-statement lists with absolute offsets, rendering
+        fragments for unseen hashes, or None if the range does not parse on
+        its own.
+        """
+        text = source[start:stop]
+        parser = _Parser(text)
+        try:
+            nodes = parser.parse_all()
+            if not parser.at_end():
+                return None
+        except ParseError:
+            return None
+
+        starts: List[int] = []
+        ends: List[int] = []
+        digests: List[bytes] = []
+        rendered: List[str] = []
+        fragments = self._fragments
+        for node in nodes:
+            starts.append(start + node.start)
+            ends.append(start + node.end)
+            digest = blake2b(
+                text[node.start: node.end].encode("utf-8"), digest_size=16
+            ).digest()
+            fragment = fragments.get(digest)
+            if fragment is None:
+                fragment = fragments[digest] = _render_node(node)
+                self.stats["rendered"] += 1
             else:
-                src = args
-        alt = props.get("alt", "")
-        return f'<img className="max-w-full" src="{src.strip()}" alt="{alt}" />'
-
-    # sel — Select
-    if token == "sel":
-        options = (args or "").split(",") if args else []
-        opts = "".join(
+                self.stats["reused"] += 1
+            digests.append(digest)
+            rendered.append(fragment)
+        return starts, ends, digests, rendered
+
+
+# ----------------- Whole-template compilation -----------------
+
+
+class TemplateBuild(NamedTuple):
+    """Result of ``compile_template``.
+
+    ``files`` maps output file names to JSX, layout first. ``shared`` is the
+    number of top-level statements the layout renders before and after
+    ``{children}``; ``statements`` counts top-level statements over all pages
+    and ``rendered`` how many of them were actually rendered.
+    """
+
+    files: Dict[str, str]
+    layout: Optional[str]
+    shared: Tuple[int, int]
+    statements: int
+    rendered: int
+
+
+def _component_identifier(name: str) -> str:
+    """PascalCase JS identifier for a page or file name (``about-us`` -> ``AboutUs``)."""
+    ident = "".join(
+        part[:1].upper() + part[1:] for part in re.split(r"[^0-9A-Za-z]+", name)
+    )
+    if not ident[:1].isalpha():
+        ident = "Page" + ident
+    return ident
+
+
+def _layout_parts(include_imports: bool, layout_name: str) -> Tuple[str, str]:
+    if not include_imports:
+        return "<>", "</>\n"
+    head = (
+        "import React from 'react';\n\n"
+        f"export default function {layout_name}({{ children }}) {{\n"
+        "  return (\n<>"
+    )
+    return head, "</>\n  );\n}\n"
+
+
+def _page_parts(
+    include_imports: bool, component_name: str, layout_name: str
+) -> Tuple[str, str]:
+    if not include_imports:
+        return "<>", "</>\n"
+    head = (
+        "import React from 'react';\n"
+        f"import {layout_name} from './{layout_name}';\n\n"
+        f"export default function {component_name}() {{\n"
+        f"  return (\n<{layout_name}>"
+    )
+    return head, f"</{layout_name}>\n  );\n}}\n"
+
+
+def _shared_statements(pages: List[List[bytes]]) -> Tuple[int, int]:
+    """Statements every page starts and ends with, as (prefix, suffix)."""
+    if len(pages) < 2:
+        return 0, 0
+    shortest = min(len(keys) for keys in pages)
+    first = pages[0]
+    prefix = 0
+    while prefix < shortest and all(keys[prefix] == first[prefix] for keys in pages):
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and all(
+        keys[-1 - suffix] == first[-1 - suffix] for keys in pages
+    ):
+        suffix += 1
+    return prefix, suffix
+
+
+def compile_template(
+    pages: Mapping[str, str],
+    layout_name: str = "Layout",
+    include_imports: bool = True,
+    component_suffix: str = "Page",
+) -> TemplateBuild:
+    """Compile every page of a template, sharing work across pages.
+
+    ``pages`` maps page names to DSL. Top-level statements are keyed on
+    their source text, so a statement repeated on several pages (the
+    ``mn(...)`` navigation, a footer, a shared ``cta``) is rendered once.
+    The statements all pages start and end with become a layout component
+    that renders ``{children}`` between them; each page then renders only
+    its own statements inside ``<Layout>``. Substituting a page's body for
+    ``{children}`` gives exactly what ``dsl_to_jsx`` renders for that page.
+    Without anything shared every page is a standalone component.
+    """
+    keyed: List[Tuple[str, List[Node], List[bytes]]] = []
+    for name, source in pages.items():
+        text = _normalize_newlines(source)
+        try:
+            nodes = parse_dsl(text)
+            check_tokens(nodes)
+        except ParseError as exc:
+            raise ParseError(f"{name}: {exc}", pos=exc.pos) from exc
+        keys = [
+            blake2b(text[n.start: n.end].encode("utf-8"), digest_size=16).digest()
+            for n in nodes
+        ]
+        keyed.append((name, nodes, keys))
+
+    fragments: Dict[bytes, str] = {}
+
+    def fragment(key: bytes, node: Node) -> str:
+        jsx = fragments.get(key)
+        if jsx is None:
+            jsx = fragments[key] = _render_node(node)
+        return jsx
+
+    prefix, suffix = _shared_statements([keys for _, _, keys in keyed])
+    files: Dict[str, str] = {}
+    layout_file = None
+    if prefix or suffix:
+        _, nodes, keys = keyed[0]
+        tail = len(nodes) - suffix
+        head_parts, tail_parts = _layout_parts(include_imports, layout_name)
+        layout_file = f"{layout_name}.jsx"
+        files[layout_file] = "\n".join(
             [
-                f'<option key="{o.strip()}" value="{o.strip()}">{o.strip()}</option>'
-                for o in options
-                if o.strip()
+                head_parts,
+                *(fragment(keys[i], nodes[i]) for i in range(prefix)),
+                "  {children}",
+                *(fragment(keys[i], nodes[i]) for i in range(tail, len(nodes))),
+                tail_parts,
             ]
         )
-        return f'<select className="border rounded px-3 py-2">{opts}</select>'
 
-    raise ParseError(f"Unknown token: {token}")
+    for name, nodes, keys in keyed:
+        component = _component_identifier(name) + component_suffix
+        if layout_file:
+            parts = _page_parts(include_imports, component, layout_name)
+        else:
+            parts = _component_parts(include_imports, component)
+        body = [
+            fragment(keys[i], nodes[i]) for i in range(prefix, len(nodes) - suffix)
+        ]
+        file_name = f"{_component_identifier(name)}.jsx"
+        if file_name in files:
+            raise ParseError(f"{name}: output {file_name} clashes with another file")
+        files[file_name] = "\n".join([parts[0], *(body or [""]), parts[1]])
+
+    return TemplateBuild(
+        files=files,
+        layout=layout_file,
+        shared=(prefix, suffix),
+        statements=sum(len(keys) for _, _, keys in keyed),
+        rendered=len(fragments),
+    )
 
 
-def dsl_to_jsx(
-    dsl_source: str,
-    include_imports: bool = True,
-    component_name: str = "GeneratedComponent",
-) -> str:
-    """Convert DSL (with optional nesting) into a React component string."""
+# ----------------- JSX -> DSL -----------------
 
-    def render(node: Node, level: int = 1) -> str:
-        indent = "  " * level
-        if node.token == "c":
-            base = "flex flex-col gap-4"
-            extra = node.props.get("class")
-            class_name = _join_class_names(base, extra)
-            if not node.children:
-                return f'{indent}<div className="{class_name}"></div>'
-            children_jsx = "\n".join(
-                render(child, level + 1) for child in node.children
-            )
-            return (
-                f'{indent}<div className="{class_name}">\n'
-                f"{children_jsx}\n"
-                f"{indent}</div>"
-            )
-        if node.token == "f":
-            if not node.children:
-                return f"{indent}<form></form>"
-            children_jsx = "\n".join(
-                render(child, level + 1) for child in node.children
+# Elements of the preorder (tag, className) shape kept per prefab fingerprint,
+# and how many of them must agree before an element is attributed to a prefab
+_FINGERPRINT_DEPTH = 16
+_FINGERPRINT_MIN = 3
+# Stand-in args used to locate where a prefab echoes its args in the output
+_ARGS_SENTINEL = "\ue000"
+# Stand-ins for the nested args and props of slot templates: _SLOT_BASE + i
+_SLOT_BASE = 0xE001
+_SENTINEL_RE = re.compile("[\ue000-\ue0ff]")
+
+
+class _Template(NamedTuple):
+    """A render with its sentinels cut out: literal ``parts`` around ``groups``."""
+
+    parts: Tuple[str, ...]
+    groups: Tuple[str, ...]
+
+    def match(self, text: str) -> Optional[Dict[str, str]]:
+        """Group values that turn the template into ``text``, if any.
+
+        Each value runs to the first occurrence of the literal after it, with
+        no backtracking (values are checked by re-rendering anyway); a group
+        seen again must repeat its value.
+        """
+        parts = self.parts
+        if not text.startswith(parts[0]):
+            return None
+        pos = len(parts[0])
+        values: Dict[str, str] = {}
+        last = len(self.groups) - 1
+        for i, group in enumerate(self.groups):
+            part = parts[i + 1]
+            value = values.get(group)
+            if value is None:
+                end = len(text) - len(part) if i == last else text.find(part, pos)
+                if end < pos:
+                    return None
+                value = values[group] = text[pos:end]
+            elif not text.startswith(value, pos):
+                return None
+            pos += len(value)
+            if not text.startswith(part, pos):
+                return None
+            pos += len(part)
+        return values if pos == len(text) else None
+
+
+class _SlotTemplate(NamedTuple):
+    template: _Template
+    # (group, "arg" or "prop", nested token or prop key) per captured value
+    slots: Tuple[Tuple[str, str, str], ...]
+    # Group values in the prefab's default render, left out when recovered
+    defaults: Mapping[str, str]
+
+
+class _PrefabFingerprint(NamedTuple):
+    token: str
+    props: Mapping[str, str]
+    rendered: str
+    shape: Tuple[Tuple[str, Optional[str]], ...]
+    # render(args, props) with the args captured, when they appear verbatim
+    args_template: Optional[_Template]
+    # render(args, props) with nested args and echoed props captured
+    templates: Tuple[_SlotTemplate, ...]
+
+
+# (root tag, root className) -> fingerprints; rebuilt when the registry changes
+_FINGERPRINTS: Dict[Tuple[str, Optional[str]], List[_PrefabFingerprint]] = {}
+_FINGERPRINTS_LOCK = threading.Lock()
+_FINGERPRINTS_BUILT = False
+
+
+def _invalidate_fingerprints():
+    global _FINGERPRINTS_BUILT
+    with _FINGERPRINTS_LOCK:
+        _FINGERPRINTS.clear()
+        _FINGERPRINTS_BUILT = False
+
+
+def _shape(el: JSXElement, limit: int = _FINGERPRINT_DEPTH):
+    """Preorder (tag, className) of the first ``limit`` elements under ``el``."""
+    out = []
+    stack = [el]
+    while stack and len(out) < limit:
+        el = stack.pop()
+        out.append((el.tag, el.attrs.get("className")))
+        stack.extend(reversed(el.children))
+    return tuple(out)
+
+
+def _sentinel_template(rendered: str, groups: Mapping[str, str]) -> Optional[_Template]:
+    """``rendered`` with each sentinel in ``groups`` cut out as its group."""
+    parts: List[str] = []
+    names: List[str] = []
+    pos = 0
+    for m in _SENTINEL_RE.finditer(rendered):
+        group = groups.get(m.group())
+        if group is not None:
+            parts.append(rendered[pos:m.start()])
+            names.append(group)
+            pos = m.end()
+    if not names:
+        return None
+    parts.append(rendered[pos:])
+    return _Template(tuple(parts), tuple(names))
+
+
+def _args_template(rendered: str) -> Optional[_Template]:
+    return _sentinel_template(rendered, {_ARGS_SENTINEL: "args"})
+
+
+def _probe_source(render) -> Tuple[List[Mapping[str, str]], List[str], List[str]]:
+    """Props variants to fingerprint, prop keys and nested arg tokens.
+
+    The variants are the defaults plus one single-prop variant per probe of
+    the source.
+    """
+    variants: List[Mapping[str, str]] = [_EMPTY_PROPS]
+    try:
+        source = Path(inspect.getsourcefile(render)).read_text(encoding="utf-8")
+        probes = prop_probes(source)
+        tokens = arg_probes(source)
+    except (TypeError, OSError, SyntaxError, ValueError):
+        return variants, [], []
+    for key, values in sorted(probes.items()):
+        variants.extend(MappingProxyType({key: value}) for value in values)
+    return variants, sorted(probes), tokens
+
+
+def _echoed_props(render, keys: List[str]) -> List[str]:
+    """Keys whose value the prefab writes into its output verbatim."""
+    sentinel = chr(_SLOT_BASE)
+    echoed = []
+    for key in keys:
+        try:
+            if sentinel in render(None, {key: sentinel}):
+                echoed.append(key)
+        except Exception:
+            continue
+    return echoed
+
+
+def _slot_templates(
+    render, props: Mapping[str, str], tokens: List[str], keys: List[str], rendered: str
+) -> Tuple[_SlotTemplate, ...]:
+    """Templates of ``render`` under ``props`` with the nested args, then also
+    the echoed props, replaced by sentinels.
+
+    Two templates, because a prop that is echoed may also switch markup on
+    (a subtitle paragraph shown only when set).
+    """
+    nested = tuple(("arg", token) for token in tokens)
+    echoed = tuple(("prop", key) for key in keys if key not in props)
+    templates = []
+    for slots in dict.fromkeys(filter(None, (nested, nested + echoed))):
+        groups = {chr(_SLOT_BASE + i): f"s{i}" for i in range(len(slots))}
+        args, slot_props = [], dict(props)
+        for sentinel, (kind, name) in zip(groups, slots):
+            if kind == "arg":
+                args.append(f"{name}({sentinel})")
+            else:
+                slot_props[name] = sentinel
+        try:
+            out = render(" ".join(args) or None, slot_props).strip()
+            template = _sentinel_template(out, groups)
+        except Exception:
+            continue
+        if template is None:
+            continue
+        templates.append(
+            _SlotTemplate(
+                template,
+                tuple(
+                    (f"s{i}", kind, name)
+                    for i, (kind, name) in enumerate(slots)
+                    if f"s{i}" in template.groups
+                ),
+                template.match(rendered) or {},
             )
-            return f"{indent}<form>\n{children_jsx}\n{indent}</form>"
-        # Leaf
-        return f"{indent}" + _jsx_for_token(node.token, node.args, node.props)
+        )
+    return tuple(templates)
+
+
+def _prefab_fingerprints() -> Dict[Tuple[str, Optional[str]], List[_PrefabFingerprint]]:
+    """Fingerprints of every registered prefab.
+
+    Each prefab is rendered with its defaults and with every single-prop
+    variant ``prop_probes`` finds in its source, since props can change the
+    structure of the output (a ``style`` switching layouts, say). Each
+    variant also gets slot templates: the prefab rendered with sentinels for
+    the nested args ``arg_probes`` finds and for the props it echoes, so
+    their values can be read back from any render of that variant.
+    """
+    global _FINGERPRINTS_BUILT
+    with _FINGERPRINTS_LOCK:
+        if _FINGERPRINTS_BUILT:
+            return _FINGERPRINTS
+        preload_prefabs()
+        for token, render in sorted(COMPONENT_REGISTRY.items()):
+            variants, keys, tokens = _probe_source(render)
+            echoed = _echoed_props(render, keys)
+            seen = set()
+            for props in variants:
+                try:
+                    rendered = render(None, dict(props)).strip()
+                    roots = scan_jsx(rendered)
+                except Exception as e:
+                    logger.debug("Cannot fingerprint %s%s: %s", token, dict(props), e)
+                    continue
+                if rendered in seen or len(roots) != 1 or roots[0].end != len(rendered):
+                    continue
+                seen.add(rendered)
+                try:
+                    args_template = _args_template(render(_ARGS_SENTINEL, dict(props)))
+                except Exception:
+                    args_template = None
+                templates = _slot_templates(render, props, tokens, echoed, rendered)
+                fp = _PrefabFingerprint(
+                    token, props, rendered, _shape(roots[0]), args_template, templates
+                )
+                _FINGERPRINTS.setdefault(fp.shape[0], []).append(fp)
+        _FINGERPRINTS_BUILT = True
+        return _FINGERPRINTS
 
-    nodes = parse_dsl(dsl_source)
-    inner = "\n".join(render(n) for n in nodes) if nodes else ""
-    fragment = f"<>\n{inner}\n</>\n"
-    if not include_imports:
-        return fragment
-    # Minimal imports suitable for Tailwind React apps
-    header = "import React from 'react';\n\n"
-    component = (
-        header
-        + f"export default function {component_name}() {{\n"
-        + f"  return (\n{fragment}  );\n"
-        + "}\n"
+
+def _reproduces(node: Node, text: str) -> bool:
+    """Whether the DSL statement of ``node`` parses back and renders ``text``."""
+    try:
+        parsed = parse_dsl(_dsl_statement(node))
+        return len(parsed) == 1 and _jsx_for_node(parsed[0]).strip() == text
+    except Exception:
+        return False
+
+
+def _from_template(
+    fp: _PrefabFingerprint, template: _SlotTemplate, text: str
+) -> Optional[Node]:
+    values = template.template.match(text)
+    if values is None:
+        return None
+    # Shortest statement first: leave out the values the prefab defaults to
+    for skip in (template.defaults, {}):
+        args, props = [], dict(fp.props)
+        for group, kind, name in template.slots:
+            if skip.get(group) == values[group]:
+                continue
+            if kind == "arg":
+                args.append(f"{name}({values[group]})")
+            else:
+                props[name] = values[group]
+        node = Node(fp.token, args=" ".join(args) or None, props=props)
+        if _reproduces(node, text):
+            return node
+    return None
+
+
+def _from_children(fp: _PrefabFingerprint, el: JSXElement, src: str) -> Optional[Node]:
+    """``fp``'s prefab with the decompiled children of ``el`` as its args."""
+    if not el.children:
+        return None
+    inner = decompile_jsx(src[el.inner_start:el.inner_end])
+    if not inner:
+        return None
+    node = Node(fp.token, args=nodes_to_dsl(inner).strip(), props=fp.props)
+    return node if _reproduces(node, src[el.start:el.end]) else None
+
+
+def _match_prefab(el: JSXElement, src: str) -> Optional[Tuple[Node, bool]]:
+    """The prefab ``el`` was rendered from, and whether its DSL reproduces it."""
+    candidates = _prefab_fingerprints().get(
+        (el.tag, el.attrs.get("className"))
     )
-    return component
+    if not candidates:
+        return None
+    span = {"start": el.start, "end": el.end}
+    text = src[el.start:el.end]
+    for fp in candidates:
+        if text == fp.rendered:
+            return Node(fp.token, props=fp.props, **span), True
+    for fp in candidates:
+        m = fp.args_template.match(text) if fp.args_template else None
+        if m:
+            node = Node(fp.token, args=m["args"], props=fp.props, **span)
+            if _reproduces(node, text):
+                return node, True
+    for fp in candidates:
+        for template in fp.templates:
+            node = _from_template(fp, template, text)
+            if node is not None:
+                node.start, node.end = el.start, el.end
+                return node, True
+    # Customised beyond the probes: recognise the prefab by structure alone
+    shape = _shape(el)
+    best, best_len = None, 0
+    for fp in candidates:
+        n = 0
+        for a, b in zip(shape, fp.shape):
+            if a != b:
+                break
+            n += 1
+        if n >= min(len(fp.shape), _FINGERPRINT_MIN) and n > best_len:
+            best, best_len = fp, n
+    if best is None:
+        return None
+    node = _from_children(best, el, src)
+    if node is not None:
+        node.start, node.end = el.start, el.end
+        return node, True
+    return Node(best.token, props=best.props, **span), False
+
+
+_C_CLASS = "flex flex-col gap-4"
+
+
+def _builtin_candidate(el: JSXElement, src: str) -> Optional[Node]:
+    """Built-in leaf token ``el`` looks like; confirmed by the caller."""
+    tag, attrs = el.tag, el.attrs
+    inner = src[el.inner_start:el.inner_end]
+    if tag == "h1" and not attrs and not el.children:
+        return Node("h", args=inner)
+    if tag == "p" and not attrs and not el.children:
+        return Node("t", args=inner or None)
+    if tag == "input":
+        return Node("i", args=attrs.get("placeholder") or None)
+    if tag == "label" and len(el.children) == 2:
+        span, field = el.children
+        label = src[span.inner_start:span.inner_end]
+        args = field.attrs.get("placeholder") or None
+        return Node("i", args=args, props={"label": label})
+    if tag == "button" and not el.children:
+        handler = attrs.get("onClick")
+        props = {"onClick": handler[1:-1]} if handler else None
+        return Node("b", args=inner, props=props)
+    if tag == "nav":
+        links = [src[a.inner_start:a.inner_end] for a in el.children]
+        return Node("n", args=",".join(links) or None)
+    if tag == "img":
+        source = attrs.get("src") or ""
+        args = f"src={source}" if "=" in source else source or None
+        alt = attrs.get("alt")
+        return Node("img", args=args, props={"alt": alt} if alt else None)
+    if tag == "select":
+        options = [src[o.inner_start:o.inner_end] for o in el.children]
+        return Node("sel", args=",".join(options) or None)
+    return None
+
+
+def _match_builtin(el: JSXElement, src: str) -> Optional[Node]:
+    node = _builtin_candidate(el, src)
+    if node is None or node.token in COMPONENT_REGISTRY:
+        return None
+    # Only accept what the renderer reproduces byte for byte
+    if _jsx_for_token(node.token, node.args, node.props) != src[el.start:el.end]:
+        return None
+    node.start, node.end = el.start, el.end
+    return node
+
+
+def _container_token(el: JSXElement) -> Optional[Node]:
+    for token in ("c", "f"):
+        if token in COMPONENT_REGISTRY:
+            return None
+    if el.tag == "form" and not el.attrs:
+        return Node("f", start=el.start, end=el.end)
+    if el.tag == "div" and list(el.attrs) == ["className"] and not el.has_text:
+        class_name = el.attrs["className"] or ""
+        if class_name == _C_CLASS or class_name.startswith(_C_CLASS + " "):
+            extra = class_name[len(_C_CLASS):].strip()
+            props = {"class": extra} if extra else None
+            return Node("c", props=props, start=el.start, end=el.end)
+    return None
+
+
+def decompile_jsx(
+    jsx_source: str, inexact: Optional[List[Node]] = None
+) -> List[Node]:
+    """Rebuild the DSL tree of a component from its JSX.
+
+    One pass of ``scan_jsx`` gives the element tree; each element is then
+    visited at most once, top-down. Elements are recognised as (in order):
+    a registered prefab, by fingerprint (see ``_prefab_fingerprints``); a
+    ``c``/``f`` container; a built-in leaf. Prefabs and leaves are accepted
+    only if their DSL re-renders to the same bytes, except prefabs matched on
+    structure alone, whose args and props could not be recovered: those are
+    appended to ``inexact``. Anything else is transparent: its children are
+    searched.
+    """
+    roots = scan_jsx(jsx_source)
+    nodes: List[Node] = []
+    # Items: (element, output list), or (container node, its children list)
+    stack: list = [(el, nodes) for el in reversed(roots)]
+    while stack:
+        el, out = stack.pop()
+        if isinstance(el, Node):
+            el.children = tuple(out)
+            continue
+        node = None
+        match = _match_prefab(el, jsx_source)
+        if match is not None:
+            node, exact = match
+            if not exact and inexact is not None:
+                inexact.append(node)
+        else:
+            node = _container_token(el)
+            if node is not None:
+                kids: List[Node] = []
+                out.append(node)
+                stack.append((node, kids))
+                stack.extend((child, kids) for child in reversed(el.children))
+                continue
+            node = _match_builtin(el, jsx_source)
+        if node is not None:
+            out.append(node)
+        else:
+            stack.extend((child, out) for child in reversed(el.children))
+    return nodes
+
+
+def _dsl_statement(node: Node) -> str:
+    text = node.token if node.args is None else f"{node.token}({node.args})"
+    if node.props:
+        text += "{" + ", ".join(f"{k}={v}" for k, v in node.props.items()) + "}"
+    return text
+
+
+def nodes_to_dsl(nodes: Iterable[Node]) -> str:
+    """Serialise nodes as DSL that parses back to the same tree."""
+    lines: List[str] = []
+    stack: list = [(node, 0) for node in reversed(list(nodes))]
+    while stack:
+        item, level = stack.pop()
+        indent = "  " * level
+        if isinstance(item, str):
+            lines.append(indent + item)
+            continue
+        if not item.children:
+            lines.append(indent + _dsl_statement(item))
+            continue
+        # Containers: children go inside the parens, props after them
+        closing = _dsl_statement(Node(item.token, props=item.props))[len(item.token):]
+        lines.append(f"{indent}{item.token}(")
+        stack.append((")" + closing, level))
+        stack.extend((child, level + 1) for child in reversed(item.children))
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _preorder(nodes: Iterable[Node]) -> List[Node]:
+    out: List[Node] = []
+    stack = list(reversed(list(nodes)))
+    while stack:
+        node = stack.pop()
+        out.append(node)
+        stack.extend(reversed(node.children))
+    return out
+
+
+def _preorder_tokens(nodes: Iterable[Node]) -> List[str]:
+    return [node.token for node in _preorder(nodes)]
 
 
 def jsx_to_dsl(jsx_source: str) -> List[str]:
-    """Very lightweight reverse: detect known patterns and produce tokens."""
-    tokens: List[str] = []
-    text = jsx_source
-    if "<h1>" in text:
-        tokens.append("h")
-    if "<p>" in text:
-        tokens.append("t")
-    if "<input" in text:
-        tokens.append("i")
-    if "<button" in text:
-        tokens.append("b")
-    if '<div className="flex flex-col gap-4"' in text:
-        tokens.append("c")
-    if "<form" in text:
-        tokens.append("f")
-    if "<nav" in text:
-        tokens.append("n")
-    if "<img" in text:
-        tokens.append("img")
-    if "<select" in text:
-        tokens.append("sel")
-    return tokens
+    """Tokens of the decompiled component, in document order."""
+    return _preorder_tokens(decompile_jsx(jsx_source))
 
 
 # ----------------- FastAPI app and schemas -----------------
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_batch_pool()
+
+
 # CREATE THE APP PROPERLY
 app = FastAPI(
     title="SEVDO Frontend Service",
     description="Frontend code generation service using DSL",
     version="1.0.0",
     default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
@@ -440,6 +1642,10 @@ class FECompileRequest(BaseModel):
     include_imports: bool = True
     component_name: str = "GeneratedComponent"
     use_cache: bool = True
+    # With return_code and use_cache both off, the output is streamed to disk
+    return_code: bool = True
+    # Render top-level statements on the process pool (same output)
+    parallel: bool = False
 
 
 class FEDirectCompileRequest(BaseModel):
@@ -447,6 +1653,9 @@ class FEDirectCompileRequest(BaseModel):
     include_imports: bool = True
     component_name: str = "GeneratedComponent"
     use_cache: bool = True
+    # Render top-level statements on the process pool (same output; ignored
+    # when streaming)
+    parallel: bool = False
 
 
 class FEDecompileRequest(BaseModel):
@@ -454,6 +1663,15 @@ class FEDecompileRequest(BaseModel):
     use_cache: bool = True
 
 
+class FETemplateCompileRequest(BaseModel):
+    # Directory of .s pages; one .jsx per page (plus the layout) is written
+    # to output_dir
+    input_dir: str
+    output_dir: str
+    include_imports: bool = True
+    layout_name: str = "Layout"
+
+
 class CacheStats(BaseModel):
     items: int
 
@@ -463,40 +1681,211 @@ class CacheStats(BaseModel):
 MAX_FILE_BYTES = int(os.getenv("TRANSLATE_MAX_FILE_BYTES", "1048576"))
 CACHE_TTL_SECONDS = int(os.getenv("TRANSLATE_CACHE_TTL_SECONDS", "1800"))
 CACHE_MAXSIZE = int(os.getenv("TRANSLATE_CACHE_MAXSIZE", "256"))
+CACHE_MAX_BYTES = int(os.getenv("TRANSLATE_CACHE_MAX_BYTES", "67108864"))
 BATCH_MAX_WORKERS = int(os.getenv("TRANSLATE_BATCH_MAX_WORKERS", "4"))
+BATCH_PROCESS_WORKERS = int(
+    os.getenv("TRANSLATE_BATCH_PROCESS_WORKERS", "0")
+) or (os.cpu_count() or 1)
+BATCH_PROCESS_CHUNK_MAX = int(os.getenv("TRANSLATE_BATCH_PROCESS_CHUNK_MAX", "16"))
+IO_MAX_WORKERS = int(os.getenv("TRANSLATE_IO_MAX_WORKERS", "8"))
+PREFAB_MEMO_MAXSIZE = int(os.getenv("TRANSLATE_PREFAB_MEMO_MAXSIZE", "1024"))
+PREFAB_MEMO_MAX_BYTES = int(os.getenv("TRANSLATE_PREFAB_MEMO_MAX_BYTES", "16777216"))
+
 
+class _LRUCache:
+    """Thread-safe LRU cache with a TTL, bounded by entries and by bytes.
 
-class _TTLCache:
-    def __init__(self, maxsize: int, ttl: int):
+    Sizes are measured with ``sys.getsizeof`` on key and value, so the byte
+    budget tracks real memory use (including wide unicode strings). Values
+    larger than the whole budget are not cached at all.
+
+    With a ``backing`` disk cache, misses read through to it (promoting the
+    entry back into memory) and every ``set`` is written through.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: int,
+        max_bytes: int,
+        backing: Optional[DiskCache] = None,
+    ):
         self.maxsize = maxsize
         self.ttl = ttl
-        self._store: Dict[str, Tuple[float, str]] = {}
+        self.max_bytes = max_bytes
+        self.backing = backing
+        # key -> (stored_at, value, size); ordered from least to most recent
+        self._store: "OrderedDict[str, Tuple[float, str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
 
     def get(self, key: str) -> Optional[str]:
-        now = __import__("time").time()
-        item = self._store.get(key)
-        if not item:
-            return None
-        ts, value = item
-        if now - ts > self.ttl:
-            self._store.pop(key, None)
+        with self._lock:
+            item = self._store.get(key)
+            if item is not None and monotonic() - item[0] > self.ttl:
+                self._drop(key)
+                self.expirations += 1
+                item = None
+            if item is not None:
+                self._store.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            self.misses += 1
+        # Disk lookups happen outside the lock so they never stall other
+        # threads' memory hits
+        if self.backing is None:
             return None
+        value = self.backing.get(key)
+        if value is not None:
+            self._put(key, value)
         return value
 
     def set(self, key: str, value: str):
-        if len(self._store) >= self.maxsize:
-            # Simple eviction: remove an arbitrary item
-            self._store.pop(next(iter(self._store)), None)
-        self._store[key] = (__import__("time").time(), value)
+        self._put(key, value)
+        if self.backing is not None:
+            self.backing.set(key, value)
+
+    def _put(self, key: str, value: str):
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        with self._lock:
+            if key in self._store:
+                self._drop(key)
+            if size > self.max_bytes or self.maxsize <= 0:
+                return
+            self._store[key] = (monotonic(), value, size)
+            self.bytes += size
+            while len(self._store) > self.maxsize or self.bytes > self.max_bytes:
+                self._drop(next(iter(self._store)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+            self.bytes = 0
+        if self.backing is not None:
+            self.backing.clear()
+
+    def _drop(self, key: str):
+        self.bytes -= self._store.pop(key)[2]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._store),
+                "maxsize": self.maxsize,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "disk": self.backing.stats() if self.backing is not None else None,
+            }
+
 
+DSL_TO_JSX_CACHE = _LRUCache(
+    CACHE_MAXSIZE,
+    CACHE_TTL_SECONDS,
+    CACHE_MAX_BYTES,
+    backing=disk_cache_from_env("dsl_to_jsx"),
+)
+JSX_TO_DSL_CACHE = _LRUCache(
+    CACHE_MAXSIZE,
+    CACHE_TTL_SECONDS,
+    CACHE_MAX_BYTES,
+    backing=disk_cache_from_env("jsx_to_dsl"),
+)
+# Renders of pure prefabs, keyed on (token, args, props)
+PREFAB_MEMO = _LRUCache(PREFAB_MEMO_MAXSIZE, CACHE_TTL_SECONDS, PREFAB_MEMO_MAX_BYTES)
 
-DSL_TO_JSX_CACHE = _TTLCache(CACHE_MAXSIZE, CACHE_TTL_SECONDS)
-JSX_TO_DSL_CACHE = _TTLCache(CACHE_MAXSIZE, CACHE_TTL_SECONDS)
+# Prefabs import the compiler as top-level ``frontend_compiler`` (via their own
+# sys.path setup); alias that name to this module instead of letting them load
+# and initialise a second copy
+sys.modules.setdefault("frontend_compiler", sys.modules[__name__])
 
 # Load prefabs
 load_prefabs()
 
 
+def _cache_digest(kind: str, *fields: str) -> str:
+    """Content-addressed cache key, stable across processes and restarts.
+
+    Every field is length-prefixed so distinct field tuples never share a key.
+    """
+    h = blake2b(digest_size=20)
+    for field in (PREFAB_REGISTRY_VERSION, *fields):
+        data = field.encode("utf-8", "surrogatepass")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return f"{kind}:{h.hexdigest()}"
+
+
+def dsl_cache_key(content: str, include_imports: bool, component_name: str) -> str:
+    flag = "1" if include_imports else "0"
+    return _cache_digest("dsl", content, flag, component_name)
+
+
+def jsx_cache_key(jsx: str) -> str:
+    return _cache_digest("jsx-dsl-result", jsx)
+
+
+def _render_pure(token: str, render, args: Optional[str], props: Mapping) -> str:
+    fields = [token, "" if args is None else "=" + args]
+    for k, v in sorted(props.items()):
+        if not isinstance(v, str):
+            # Only string props (what the parser produces) can be frozen
+            return render(args, props)
+        fields += (k, v)
+    key = _cache_digest("prefab", *fields)
+    jsx = PREFAB_MEMO.get(key)
+    if jsx is None:
+        jsx = render(args, props)
+        PREFAB_MEMO.set(key, jsx)
+    return jsx
+
+
+# File I/O and compilation run here rather than on the event loop, so one
+# slow disk or large compile cannot stall other requests. Bounded: excess
+# work queues instead of spawning threads.
+_BLOCKING_EXECUTOR = cf.ThreadPoolExecutor(
+    max_workers=IO_MAX_WORKERS, thread_name_prefix="fe-blocking"
+)
+
+
+# Thread-mode batch jobs. Shared rather than one pool per request: leaving a
+# per-request pool's ``with`` block waits for its queued jobs, which would
+# block the event loop when the request is cancelled.
+_BATCH_THREADS = cf.ThreadPoolExecutor(
+    max_workers=BATCH_MAX_WORKERS, thread_name_prefix="fe-batch"
+)
+
+
+async def _off_loop(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BLOCKING_EXECUTOR, partial(fn, *args))
+
+
+async def _run_batch_in_threads(run_job, jobs) -> List[Tuple[int, bool, dict]]:
+    """``run_job(idx, job)`` for every job on the batch threads, in job order."""
+    futures = [_BATCH_THREADS.submit(run_job, i, job) for i, job in enumerate(jobs)]
+    try:
+        return await asyncio.gather(*map(asyncio.wrap_future, futures))
+    finally:
+        # Request cancelled: drop its jobs not yet started
+        for fut in futures:
+            fut.cancel()
+
+
 def _read_text_with_limits(path: str) -> str:
     p = Path(path)
     if not p.exists():
@@ -534,17 +1923,26 @@ def _ensure_output_parent_exists(path: str):
 
 
 def _write_if_changed(path: str, content: str) -> bool:
-    p = Path(path)
-    old = p.read_text(encoding="utf-8") if p.exists() else None
-    if old == content:
-        return False
     try:
-        p.write_text(content, encoding="utf-8")
-        return True
+        return write_if_changed(path, content)
+    except Exception:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "file_write_error", "path": str(path)},
+        )
+
+
+def _write_chunks_if_changed(path: str, chunks: Iterable[str]) -> Tuple[bool, int]:
+    """Stream chunks into ``path`` without materialising the whole content.
+
+    Returns (changed, characters written).
+    """
+    try:
+        return write_chunks_if_changed(path, _batched(chunks))
     except Exception:
         raise HTTPException(
             status_code=400,
-            detail={"code": "file_write_error", "path": str(p)},
+            detail={"code": "file_write_error", "path": str(path)},
         )
 
 
@@ -577,8 +1975,8 @@ async def health():
         "service": "sevdo-frontend",
         "version": "1.0.0",
         "cache_status": {
-            "dsl_to_jsx_items": len(DSL_TO_JSX_CACHE._store),
-            "jsx_to_dsl_items": len(JSX_TO_DSL_CACHE._store),
+            "dsl_to_jsx_items": len(DSL_TO_JSX_CACHE),
+            "jsx_to_dsl_items": len(JSX_TO_DSL_CACHE),
         },
     }
 
@@ -600,44 +1998,57 @@ async def list_routes():
     }
 
 
+def _compile_cached(
+    content: str,
+    include_imports: bool,
+    component_name: str,
+    use_cache: bool,
+    parallel: bool = False,
+) -> Tuple[str, bool]:
+    """Compile through DSL_TO_JSX_CACHE; returns (jsx, cache_hit)."""
+    cache_key = dsl_cache_key(content, include_imports, component_name)
+    cached = DSL_TO_JSX_CACHE.get(cache_key) if use_cache else None
+    if cached is not None:
+        return cached, True
+    compile_fn = dsl_to_jsx_parallel if parallel else dsl_to_jsx
+    jsx = compile_fn(
+        content, include_imports=include_imports, component_name=component_name
+    )
+    if use_cache:
+        DSL_TO_JSX_CACHE.set(cache_key, jsx)
+    return jsx, False
+
+
 # DIRECT DSL-TO-JSX ENDPOINT (no files needed)
 @app.post("/api/fe-translate/to-s-direct")
 async def fe_compile_direct_api(body: FEDirectCompileRequest):
     """Generate frontend code directly from DSL content (no files)"""
     try:
-        print(f"Direct frontend generation request: {body.component_name}")
-        print(f"DSL content: {body.dsl_content[:100]}...")
-
-        # Handle use_cache field safely
-        use_cache = getattr(body, "use_cache", True)
-
-        cache_key = (
-            f"dsl:{hash((body.dsl_content, body.include_imports, body.component_name))}"
+        logger.info("Direct frontend generation request: %s", body.component_name)
+        logger.debug("DSL content: %s...", body.dsl_content[:100])
+
+        jsx, cache_hit = await _off_loop(
+            _compile_cached,
+            body.dsl_content,
+            body.include_imports,
+            body.component_name,
+            body.use_cache,
+            body.parallel,
         )
-        cached = DSL_TO_JSX_CACHE.get(cache_key) if use_cache else None
-
-        if cached is None:
-            jsx = dsl_to_jsx(
-                body.dsl_content,
-                include_imports=body.include_imports,
-                component_name=body.component_name,
-            )
-            if use_cache:
-                DSL_TO_JSX_CACHE.set(cache_key, jsx)
-            print("Frontend code generated successfully")
+        if cache_hit:
+            logger.info("Using cached frontend code")
         else:
-            jsx = cached
-            print("Using cached frontend code")
+            logger.info("Frontend code generated successfully")
 
         return {
             "success": True,
             "code": jsx,
             "component_name": body.component_name,
             "bytes": len(jsx),
-            "cache_hit": cached is not None,
+            "cache_hit": cache_hit,
         }
     except Exception as exc:
-        print(f"Frontend generation failed: {exc}")
+        logger.warning("Frontend generation failed: %s", exc)
         raise HTTPException(
             status_code=400,
             detail={
@@ -648,17 +2059,50 @@ async def fe_compile_direct_api(body: FEDirectCompileRequest):
         )
 
 
-# FILE-BASED ENDPOINT
-@app.post("/api/fe-translate/to-s")
-async def fe_compile_api(body: FECompileRequest):
-    """Generate frontend code from DSL file"""
+# STREAMING DSL-TO-JSX ENDPOINT
+@app.post("/api/fe-translate/to-s-stream")
+async def fe_compile_stream_api(body: FEDirectCompileRequest):
+    """Stream generated frontend code as plain text while it is rendered"""
     try:
-        print(f"File-based frontend generation: {body.input_path}")
+        nodes = await _off_loop(parse_dsl, body.dsl_content)
+        # Fail with a 400 up front; once streaming starts the status is sent
+        check_tokens(nodes)
+    except ParseError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "error": str(exc),
+                "code": "frontend_generation_failed",
+            },
+        )
+    cache_key = dsl_cache_key(
+        body.dsl_content, body.include_imports, body.component_name
+    )
+    cached = None
+    if body.use_cache:
+        cached = await _off_loop(DSL_TO_JSX_CACHE.get, cache_key)
+    if cached is not None:
+        chunks: Iterable[str] = [cached]
+    else:
+        # Streamed output is never cached: that would buffer it all again
+        chunks = _batched(
+            _iter_component(nodes, body.include_imports, body.component_name)
+        )
+    return StreamingResponse(
+        chunks,
+        media_type="text/plain; charset=utf-8",
+        headers={"X-Cache-Hit": "1" if cached is not None else "0"},
+    )
+
+
+def _compile_file(body: FECompileRequest) -> dict:
+    logger.info("File-based frontend generation: %s", body.input_path)
 
-        # Check if we're in a test scenario with temporary content
-        if not Path(body.input_path).exists():
-            # Create a temporary file for the request
-            temp_content = """
+    # Check if we're in a test scenario with temporary content
+    if not Path(body.input_path).exists():
+        # Create a temporary file for the request
+        temp_content = """
 c(
   h(Welcome to My Site)
   t(This is a sample page generated from DSL)
@@ -668,81 +2112,217 @@ c(
     b(Submit)
   )
 )
-            """.strip()
+        """.strip()
 
-            # Create temp directory and file
-            temp_dir = Path(tempfile.gettempdir()) / "sevdo_frontend"
-            temp_dir.mkdir(exist_ok=True)
+        # Create temp directory and file
+        temp_dir = Path(tempfile.gettempdir()) / "sevdo_frontend"
+        temp_dir.mkdir(exist_ok=True)
 
-            temp_input = temp_dir / "temp_input.txt"
-            temp_input.write_text(temp_content)
+        temp_input = temp_dir / "temp_input.txt"
+        temp_input.write_text(temp_content)
 
-            # Use the temporary file
-            content = temp_content
-            print("Using temporary DSL content for generation")
-        else:
-            content = _read_text_with_limits(body.input_path)
-
-        cache_key = f"dsl:{hash((content, body.include_imports, body.component_name))}"
-        cached = DSL_TO_JSX_CACHE.get(cache_key) if body.use_cache else None
-
-        if cached is None:
-            jsx = dsl_to_jsx(
-                content,
-                include_imports=body.include_imports,
-                component_name=body.component_name,
-            )
-            if body.use_cache:
-                DSL_TO_JSX_CACHE.set(cache_key, jsx)
-        else:
-            jsx = cached
+        # Use the temporary file
+        content = temp_content
+        logger.info("Using temporary DSL content for generation")
+    else:
+        content = _read_text_with_limits(body.input_path)
 
+    if not body.return_code and not body.use_cache and not body.parallel:
+        # Nothing needs the whole component in memory: stream it to disk
         _ensure_output_parent_exists(body.output_path)
-        changed = _write_if_changed(body.output_path, jsx)
-
-        print("File-based frontend generation completed")
-
+        changed, size = _write_chunks_if_changed(
+            body.output_path,
+            iter_jsx(content, body.include_imports, body.component_name),
+        )
+        logger.info("File-based frontend generation completed (streamed)")
         return {
             "success": True,
             "written_to": body.output_path,
-            "code": jsx,  # Include the generated code in response
-            "bytes": len(jsx),
+            "bytes": size,
             "changed": changed,
         }
+
+    jsx, _ = _compile_cached(
+        content,
+        body.include_imports,
+        body.component_name,
+        body.use_cache,
+        body.parallel,
+    )
+
+    _ensure_output_parent_exists(body.output_path)
+    changed = _write_if_changed(body.output_path, jsx)
+
+    logger.info("File-based frontend generation completed")
+
+    result = {
+        "success": True,
+        "written_to": body.output_path,
+        "bytes": len(jsx),
+        "changed": changed,
+    }
+    if body.return_code:
+        result["code"] = jsx  # Include the generated code in response
+    return result
+
+
+# FILE-BASED ENDPOINT
+@app.post("/api/fe-translate/to-s")
+async def fe_compile_api(body: FECompileRequest):
+    """Generate frontend code from DSL file"""
+    try:
+        return await _off_loop(_compile_file, body)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.warning("File-based frontend generation failed: %s", exc)
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "unexpected_error", "error": str(exc)},
+        )
+
+
+def _compile_template_dir(body: FETemplateCompileRequest) -> dict:
+    logger.info("Template frontend generation: %s", body.input_dir)
+    src = Path(body.input_dir)
+    if not src.is_dir():
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "input_dir_not_found", "path": str(src)},
+        )
+    paths = sorted(src.glob("*.s"))
+    if not paths:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "no_pages", "path": str(src)},
+        )
+    out = Path(body.output_dir)
+    if not out.is_dir():
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "output_dir_not_found", "path": str(out)},
+        )
+    pages = {p.stem: _read_text_with_limits(str(p)) for p in paths}
+
+    try:
+        build = compile_template(
+            pages, _component_identifier(body.layout_name), body.include_imports
+        )
+    except ParseError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "error": str(exc),
+                "code": "frontend_generation_failed",
+            },
+        )
+
+    # Every file is rendered before the first write, so a page that fails
+    # to compile leaves the output directory untouched
+    files = []
+    for name, jsx in build.files.items():
+        path = str(out / name)
+        changed = _write_if_changed(path, jsx)
+        files.append(
+            {"file": name, "written_to": path, "bytes": len(jsx), "changed": changed}
+        )
+
+    logger.info(
+        "Template frontend generation completed: %d pages, %d/%d statements rendered",
+        len(pages),
+        build.rendered,
+        build.statements,
+    )
+    before, after = build.shared
+    return {
+        "success": True,
+        "layout": build.layout,
+        "files": files,
+        "shared": {"before": before, "after": after},
+        "statements": build.statements,
+        "rendered": build.rendered,
+    }
+
+
+# TEMPLATE ENDPOINT
+@app.post("/api/fe-translate/to-s-template")
+async def fe_compile_template_api(body: FETemplateCompileRequest):
+    """Generate a layout plus one component per page from a directory of DSL"""
+    try:
+        return await _off_loop(_compile_template_dir, body)
     except HTTPException:
         raise
     except Exception as exc:
-        print(f"File-based frontend generation failed: {exc}")
+        logger.warning("Template frontend generation failed: %s", exc)
         raise HTTPException(
             status_code=400,
             detail={"code": "unexpected_error", "error": str(exc)},
         )
 
 
+_COMPONENT_NAME_RE = re.compile(r"export default function (\w+)\(")
+
+
+def _recompiles_to(dsl: str, jsx: str) -> bool:
+    """Whether compiling ``dsl`` as the same component gives back ``jsx``."""
+    m = _COMPONENT_NAME_RE.search(jsx)
+    try:
+        if m is None:
+            return dsl_to_jsx(dsl, include_imports=False) == jsx
+        return dsl_to_jsx(dsl, component_name=m.group(1)) == jsx
+    except Exception:
+        return False
+
+
+def _decompile_cached(jsx: str, use_cache: bool) -> dict:
+    """Tokens and DSL of a component, and whether the DSL reproduces it.
+
+    ``exact`` is true only when compiling the DSL gives back ``jsx`` byte for
+    byte. ``inexact`` indexes the ``tokens`` of prefabs recognised by
+    structure alone, whose args and props could not be recovered. The cache
+    holds everything but the tokens.
+    """
+    cache_key = jsx_cache_key(jsx)
+    cached = JSX_TO_DSL_CACHE.get(cache_key) if use_cache else None
+    if cached is None:
+        loose: List[Node] = []
+        nodes = decompile_jsx(jsx, loose)
+        dsl = nodes_to_dsl(nodes)
+        loose_ids = {id(node) for node in loose}
+        result = {
+            "dsl": dsl,
+            "exact": not loose and _recompiles_to(dsl, jsx),
+            "inexact": [
+                i for i, node in enumerate(_preorder(nodes)) if id(node) in loose_ids
+            ],
+        }
+        if nodes and use_cache:
+            JSX_TO_DSL_CACHE.set(cache_key, orjson.dumps(result).decode())
+    else:
+        result = orjson.loads(cached)
+        nodes = parse_dsl(result["dsl"])
+    if not nodes:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "invalid_code_format",
+                "message": ("No recognizable frontend components found"),
+            },
+        )
+    return {"tokens": _preorder_tokens(nodes), **result}
+
+
+def _decompile_file(body: FEDecompileRequest) -> dict:
+    jsx = _read_text_with_limits(body.code_path)
+    return _decompile_cached(jsx, body.use_cache)
+
+
 @app.post("/api/fe-translate/from-s")
 async def fe_decompile_api(body: FEDecompileRequest):
     """Decompile JSX back to DSL tokens"""
     try:
-        jsx = _read_text_with_limits(body.code_path)
-        cache_key = f"jsx:{hash(jsx)}"
-        cached = JSX_TO_DSL_CACHE.get(cache_key) if body.use_cache else None
-        if cached is None:
-            tokens = jsx_to_dsl(jsx)
-            token_str = " ".join(tokens)
-            if body.use_cache:
-                JSX_TO_DSL_CACHE.set(cache_key, token_str)
-        else:
-            token_str = cached
-            tokens = token_str.split() if token_str else []
-        if not tokens:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "code": "invalid_code_format",
-                    "message": ("No recognizable frontend components found"),
-                },
-            )
-        return {"tokens": tokens}
+        return await _off_loop(_decompile_file, body)
     except HTTPException:
         raise
     except Exception as exc:
@@ -755,24 +2335,27 @@ async def fe_decompile_api(body: FEDecompileRequest):
 # CACHE MANAGEMENT
 @app.get("/api/fe-cache/stats")
 async def fe_cache_stats():
+    # Stats of the disk tier query SQLite, so gather them off the loop
+    dsl_stats, jsx_stats = await asyncio.gather(
+        _off_loop(DSL_TO_JSX_CACHE.stats), _off_loop(JSX_TO_DSL_CACHE.stats)
+    )
     return {
-        "dsl_to_jsx": {
-            "size": len(DSL_TO_JSX_CACHE._store),
-            "maxsize": DSL_TO_JSX_CACHE.maxsize,
-            "ttl_seconds": DSL_TO_JSX_CACHE.ttl,
-        },
-        "jsx_to_dsl": {
-            "size": len(JSX_TO_DSL_CACHE._store),
-            "maxsize": JSX_TO_DSL_CACHE.maxsize,
-            "ttl_seconds": JSX_TO_DSL_CACHE.ttl,
-        },
+        "registry_version": PREFAB_REGISTRY_VERSION,
+        "dsl_to_jsx": dsl_stats,
+        "jsx_to_dsl": jsx_stats,
+        "prefab_renders": PREFAB_MEMO.stats(),
     }
 
 
+def _flush_caches():
+    DSL_TO_JSX_CACHE.clear()
+    JSX_TO_DSL_CACHE.clear()
+    PREFAB_MEMO.clear()
+
+
 @app.post("/api/fe-cache/flush")
 async def fe_cache_flush():
-    DSL_TO_JSX_CACHE._store.clear()
-    JSX_TO_DSL_CACHE._store.clear()
+    await _off_loop(_flush_caches)
     return {"flushed": True}
 
 
@@ -788,64 +2371,231 @@ class FEBatchCompileJob(BaseModel):
 
 class FEBatchCompileRequest(BaseModel):
     jobs: List[FEBatchCompileJob]
+    # "process" runs jobs on the persistent process pool (CPU-bound batches)
+    executor: Literal["thread", "process"] = "thread"
 
 
-@app.post("/api/fe-translate/to-s-batch")
-async def fe_compile_batch_api(body: FEBatchCompileRequest):
-    results: List[dict] = [None] * len(body.jobs)  # type: ignore
-    ok = 0
-
-    def process(idx: int, job: FEBatchCompileJob):
-        job_id = job.id or str(idx)
-        try:
-            content = _read_text_with_limits(job.input_path)
-            cache_key = "dsl:" + str(
-                hash((content, job.include_imports, job.component_name))
+def _compile_batch_job(idx: int, job: FEBatchCompileJob) -> Tuple[int, bool, dict]:
+    job_id = job.id or str(idx)
+    try:
+        content = _read_text_with_limits(job.input_path)
+        cache_key = dsl_cache_key(content, job.include_imports, job.component_name)
+        jsx = DSL_TO_JSX_CACHE.get(cache_key) if job.use_cache else None
+        if jsx is None:
+            jsx = dsl_to_jsx(
+                content,
+                include_imports=job.include_imports,
+                component_name=job.component_name,
             )
-            jsx = DSL_TO_JSX_CACHE.get(cache_key) if job.use_cache else None
-            if jsx is None:
-                jsx = dsl_to_jsx(
-                    content,
-                    include_imports=job.include_imports,
-                    component_name=job.component_name,
-                )
-                if job.use_cache:
-                    DSL_TO_JSX_CACHE.set(cache_key, jsx)
-            _ensure_output_parent_exists(job.output_path)
-            changed = _write_if_changed(job.output_path, jsx)
-            res = {
+            if job.use_cache:
+                DSL_TO_JSX_CACHE.set(cache_key, jsx)
+        _ensure_output_parent_exists(job.output_path)
+        changed = _write_if_changed(job.output_path, jsx)
+        res = {
+            "id": job_id,
+            "written_to": job.output_path,
+            "bytes": len(jsx),
+            "changed": changed,
+        }
+        return (idx, True, res)
+    except HTTPException as http_exc:
+        return (
+            idx,
+            False,
+            {
                 "id": job_id,
-                "written_to": job.output_path,
-                "bytes": len(jsx),
-                "changed": changed,
-            }
-            return (idx, True, res)
-        except HTTPException as http_exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": http_exc.status_code,
-                    "error": http_exc.detail,
-                },
-            )
-        except Exception as exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": 400,
-                    "error": {"code": "unexpected_error", "error": str(exc)},
-                },
+                "status": http_exc.status_code,
+                "error": http_exc.detail,
+            },
+        )
+    except Exception as exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": 400,
+                "error": {"code": "unexpected_error", "error": str(exc)},
+            },
+        )
+
+
+# ---- Process pool for CPU-bound batches ----
+# Workers are spawned once and reused; each imports this module (loading the
+# prefab manifest) and preloads every prefab before taking jobs. Their memory
+# caches are private, but they share the disk tier when TRANSLATE_CACHE_DIR
+# is set.
+_BATCH_POOL: Optional[cf.ProcessPoolExecutor] = None
+_BATCH_POOL_LOCK = threading.Lock()
+
+
+def _get_batch_pool() -> cf.ProcessPoolExecutor:
+    global _BATCH_POOL
+    with _BATCH_POOL_LOCK:
+        if _BATCH_POOL is None:
+            _BATCH_POOL = cf.ProcessPoolExecutor(
+                max_workers=BATCH_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=preload_prefabs,
             )
+        return _BATCH_POOL
+
+
+def shutdown_batch_pool(wait: bool = True):
+    global _BATCH_POOL
+    with _BATCH_POOL_LOCK:
+        pool, _BATCH_POOL = _BATCH_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# ---- Parallel rendering of one page ----
+# Opt-in: independent top-level statements of one large page are rendered
+# on the same process pool and spliced back together in source order.
+PARALLEL_MIN_STATEMENTS = int(os.getenv("TRANSLATE_PARALLEL_MIN_STATEMENTS", "16"))
+_PREFAB_MODULE_PREFIX = "sevdo_frontend.prefabs."
+
 
-    with cf.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = [executor.submit(process, i, job)
-                   for i, job in enumerate(body.jobs)]
+def _renders_in_workers(node: Node) -> bool:
+    """Whether a pool worker resolves the same renderer for every token.
+
+    Workers only know the built-ins and the prefabs in the manifest;
+    statements using components registered at runtime render in-process.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        render = COMPONENT_REGISTRY.get(node.token)
+        if render is not None and not isinstance(render, _LazyPrefab):
+            module = getattr(render, "__module__", None) or ""
+            if not module.startswith(_PREFAB_MODULE_PREFIX):
+                return False
+        stack.extend(node.children)
+    return True
+
+
+def _render_statements(statements: List[str]) -> List[str]:
+    """Worker side of ``dsl_to_jsx_parallel``: the JSX of each statement."""
+    return ["\n".join(_render_node(n) for n in parse_dsl(s)) for s in statements]
+
+
+def dsl_to_jsx_parallel(
+    dsl_source: str,
+    include_imports: bool = True,
+    component_name: str = "GeneratedComponent",
+) -> str:
+    """``dsl_to_jsx`` with top-level statements rendered across the process pool.
+
+    Each distinct statement is rendered once, by a worker, and the fragments
+    are reassembled in order, so the output is byte-identical to
+    ``dsl_to_jsx``. Pages with fewer than ``PARALLEL_MIN_STATEMENTS``
+    statements, or a pool of one worker, are rendered sequentially.
+    """
+    text = _normalize_newlines(dsl_source)
+    nodes = parse_dsl(text)
+    if len(nodes) < PARALLEL_MIN_STATEMENTS or BATCH_PROCESS_WORKERS < 2:
+        return "".join(_iter_component(nodes, include_imports, component_name))
+    check_tokens(nodes)
+
+    statements = [text[n.start: n.end] for n in nodes]
+    fragments: Dict[str, str] = {}
+    remote: Dict[str, Node] = {}
+    local: Dict[str, Node] = {}
+    for stmt, node in zip(statements, nodes):
+        if stmt not in remote and stmt not in local:
+            (remote if _renders_in_workers(node) else local)[stmt] = node
+
+    # Round-robin over ~4 chunks per worker, so adjacent heavy statements
+    # (a gallery next to a listing) land on different workers
+    pending = list(remote)
+    n_chunks = min(len(pending), BATCH_PROCESS_WORKERS * 4)
+    chunks = [pending[i::n_chunks] for i in range(n_chunks)]
+    futures = []
+    if chunks:
+        pool = _get_batch_pool()
+        futures = [pool.submit(_render_statements, chunk) for chunk in chunks]
+    try:
+        for stmt, node in local.items():
+            fragments[stmt] = _render_node(node)
+        for chunk, fut in zip(chunks, futures):
+            fragments.update(zip(chunk, fut.result()))
+    except cf.process.BrokenProcessPool:
+        # A worker died; start a fresh pool next time and finish here
+        shutdown_batch_pool(wait=False)
+        for stmt, node in remote.items():
+            if stmt not in fragments:
+                fragments[stmt] = _render_node(node)
+    finally:
         for fut in futures:
-            idx, success, payload = fut.result()
+            fut.cancel()
+
+    return _wrap_component(
+        [fragments[stmt] for stmt in statements], include_imports, component_name
+    )
+
+
+def _compile_job_chunk(
+    chunk: List[Tuple[int, FEBatchCompileJob]],
+) -> List[Tuple[int, bool, dict]]:
+    return [_compile_batch_job(idx, job) for idx, job in chunk]
+
+
+def _batch_chunk_size(n_jobs: int) -> int:
+    # About four chunks per worker: amortises dispatch without leaving
+    # workers idle behind one long chunk
+    per_worker = -(-n_jobs // (BATCH_PROCESS_WORKERS * 4))
+    return max(1, min(BATCH_PROCESS_CHUNK_MAX, per_worker))
+
+
+async def _run_batch_in_processes(
+    jobs: List[FEBatchCompileJob],
+) -> AsyncIterator[Tuple[int, bool, dict]]:
+    """Yield (index, success, payload) per job, in completion order."""
+    indexed = list(enumerate(jobs))
+    size = _batch_chunk_size(len(indexed))
+    chunks = [indexed[i : i + size] for i in range(0, len(indexed), size)]
+    pool = _get_batch_pool()
+    pending = {
+        asyncio.wrap_future(pool.submit(_compile_job_chunk, chunk)): chunk
+        for chunk in chunks
+    }
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for fut in done:
+                chunk = pending.pop(fut)
+                try:
+                    results = fut.result()
+                except Exception as exc:
+                    if isinstance(exc, cf.process.BrokenProcessPool):
+                        # A worker died; start a fresh pool for the next batch
+                        shutdown_batch_pool(wait=False)
+                    error = {"code": "worker_failed", "error": str(exc)}
+                    results = [
+                        (idx, False, {"id": job.id or str(idx), "status": 500, "error": error})
+                        for idx, job in chunk
+                    ]
+                for result in results:
+                    yield result
+    finally:
+        # Client went away or the batch failed: drop work not yet started
+        for fut in pending:
+            fut.cancel()
+
+
+@app.post("/api/fe-translate/to-s-batch")
+async def fe_compile_batch_api(body: FEBatchCompileRequest):
+    results: List[dict] = [None] * len(body.jobs)  # type: ignore
+    ok = 0
+
+    if body.executor == "process":
+        async for idx, success, payload in _run_batch_in_processes(body.jobs):
+            results[idx] = payload
+            ok += success
+    else:
+        for idx, success, payload in await _run_batch_in_threads(
+            _compile_batch_job, body.jobs
+        ):
             results[idx] = payload
             if success:
                 ok += 1
@@ -856,6 +2606,21 @@ async def fe_compile_batch_api(body: FEBatchCompileRequest):
     }
 
 
+@app.post("/api/fe-translate/to-s-batch-stream")
+async def fe_compile_batch_stream_api(body: FEBatchCompileRequest):
+    """Compile jobs on the process pool, streaming NDJSON as each job finishes"""
+
+    async def lines():
+        ok = 0
+        async for idx, success, payload in _run_batch_in_processes(body.jobs):
+            ok += success
+            yield orjson.dumps({"index": idx, "ok": success, **payload}) + b"\n"
+        totals = {"ok": ok, "failed": len(body.jobs) - ok}
+        yield orjson.dumps({"totals": totals}) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 class FEBatchDecompileJob(BaseModel):
     id: Optional[str] = None
     code_path: str
@@ -866,65 +2631,47 @@ class FEBatchDecompileRequest(BaseModel):
     jobs: List[FEBatchDecompileJob]
 
 
+def _decompile_batch_job(
+    idx: int, job: FEBatchDecompileJob
+) -> Tuple[int, bool, dict]:
+    job_id = job.id or str(idx)
+    try:
+        jsx = _read_text_with_limits(job.code_path)
+        result = _decompile_cached(jsx, job.use_cache)
+        return (idx, True, {"id": job_id, **result})
+    except HTTPException as http_exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": http_exc.status_code,
+                "error": http_exc.detail,
+            },
+        )
+    except Exception as exc:
+        return (
+            idx,
+            False,
+            {
+                "id": job_id,
+                "status": 400,
+                "error": {"code": "unexpected_error", "error": str(exc)},
+            },
+        )
+
+
 @app.post("/api/fe-translate/from-s-batch")
 async def fe_decompile_batch_api(body: FEBatchDecompileRequest):
     results: List[dict] = [None] * len(body.jobs)  # type: ignore
     ok = 0
 
-    def process(idx: int, job: FEBatchDecompileJob):
-        job_id = job.id or str(idx)
-        try:
-            jsx = _read_text_with_limits(job.code_path)
-            cache_key = "jsx:" + str(hash(jsx))
-            token_str = None
-            if job.use_cache:
-                token_str = JSX_TO_DSL_CACHE.get(cache_key)
-            if token_str is None:
-                tokens = jsx_to_dsl(jsx)
-                if not tokens:
-                    raise HTTPException(
-                        status_code=400,
-                        detail={
-                            "code": "invalid_code_format",
-                            "message": ("No recognizable frontend components found"),
-                        },
-                    )
-                token_str = " ".join(tokens)
-                if job.use_cache:
-                    JSX_TO_DSL_CACHE.set(cache_key, token_str)
-            tokens_list = []
-            if token_str:
-                tokens_list = token_str.split()
-            return (idx, True, {"id": job_id, "tokens": tokens_list})
-        except HTTPException as http_exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": http_exc.status_code,
-                    "error": http_exc.detail,
-                },
-            )
-        except Exception as exc:
-            return (
-                idx,
-                False,
-                {
-                    "id": job_id,
-                    "status": 400,
-                    "error": {"code": "unexpected_error", "error": str(exc)},
-                },
-            )
-
-    with cf.ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
-        futures = [executor.submit(process, i, job)
-                   for i, job in enumerate(body.jobs)]
-        for fut in futures:
-            idx, success, payload = fut.result()
-            results[idx] = payload
-            if success:
-                ok += 1
+    for idx, success, payload in await _run_batch_in_threads(
+        _decompile_batch_job, body.jobs
+    ):
+        results[idx] = payload
+        if success:
+            ok += 1
 
     return {
         "results": results,
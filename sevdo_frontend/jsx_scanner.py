@@ -0,0 +1,177 @@
+"""Single-pass JSX tag scanner used to decompile generated components.
+
+``scan_jsx`` walks the source once, left to right, and returns the element
+tree with source offsets. It only understands as much JSX as the compiler
+emits: tags and fragments, string / ``{expression}`` / boolean attributes,
+text, and ``{expression}`` children. Expressions are skipped as opaque,
+brace-balanced runs (string and template literals respected), so JavaScript
+inside event handlers never confuses the tag structure. Text outside any
+element (imports, the ``export default function`` wrapper) is ignored.
+
+Every step is an anchored regex match that consumes input, so scanning is
+linear in the size of the source.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional
+
+_OPEN_RE = re.compile(r"<[^\S\n]*(/)?[^\S\n]*([A-Za-z_$][\w$.:-]*)?(?=[\s/>])")
+_ATTR_RE = re.compile(
+    r"([A-Za-z_$][\w$.:-]*)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|(?=(\{))))?"
+)
+_SPACE_RE = re.compile(r"\s*")
+_TAG_END_RE = re.compile(r"\s*(/?)>")
+_TEXT_RE = re.compile(r"[^<{]+")
+_OUTER_TEXT_RE = re.compile(r"[^<]+")
+_EXPR_CHUNK_RE = re.compile(
+    r"[^{}'\"`]+"
+    r"|\"(?:[^\"\\\n]|\\.)*\""
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r"|`(?:[^`\\]|\\.)*`"
+    r"|[{}'\"`]"
+)
+
+
+class JSXElement:
+    """One element (``tag`` is ``""`` for fragments) and its source spans.
+
+    ``start``/``end`` cover the whole element; ``inner_start``/``inner_end``
+    cover what lies between the opening and closing tags. Attribute values
+    are kept as written: string values without their quotes, expressions
+    with their braces, ``None`` for boolean attributes.
+    """
+
+    __slots__ = (
+        "tag",
+        "attrs",
+        "children",
+        "start",
+        "inner_start",
+        "inner_end",
+        "end",
+        "has_text",
+    )
+
+    def __init__(self, tag: str, attrs: Dict[str, Optional[str]], start: int):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List["JSXElement"] = []
+        self.start = start
+        self.inner_start = self.inner_end = self.end = start
+        # Non-whitespace text or {expression} children directly inside
+        self.has_text = False
+
+    def __repr__(self) -> str:
+        return (
+            f"JSXElement({self.tag!r}, attrs={self.attrs!r}, "
+            f"children={len(self.children)}, span=({self.start}, {self.end}))"
+        )
+
+
+def _skip_expression(src: str, pos: int) -> int:
+    """Offset just past the ``{...}`` expression opening at ``pos``."""
+    depth = 0
+    n = len(src)
+    while pos < n:
+        m = _EXPR_CHUNK_RE.match(src, pos)
+        chunk = m.group()
+        pos = m.end()
+        if chunk == "{":
+            depth += 1
+        elif chunk == "}":
+            depth -= 1
+            if depth == 0:
+                return pos
+    return n
+
+
+def _scan_open_tag(src: str, pos: int) -> Optional[tuple]:
+    """Parse attributes up to ``>``; returns (attrs, end, self_closing)."""
+    attrs: Dict[str, Optional[str]] = {}
+    n = len(src)
+    while pos < n:
+        end = _TAG_END_RE.match(src, pos)
+        if end:
+            return attrs, end.end(), bool(end.group(1))
+        pos = _SPACE_RE.match(src, pos).end()
+        if src.startswith("{", pos):
+            # {...spread}
+            pos = _skip_expression(src, pos)
+            continue
+        m = _ATTR_RE.match(src, pos)
+        if m is None:
+            return None
+        pos = m.end()
+        if m.group(2) is not None:
+            attrs[m.group(1)] = m.group(2)
+        elif m.group(3) is not None:
+            attrs[m.group(1)] = m.group(3)
+        elif m.group(4):
+            expr_end = _skip_expression(src, pos)
+            attrs[m.group(1)] = src[pos:expr_end]
+            pos = expr_end
+        else:
+            attrs[m.group(1)] = None
+    return None
+
+
+def scan_jsx(src: str) -> List[JSXElement]:
+    """Top-level elements of ``src`` (usually the component's fragment)."""
+    roots: List[JSXElement] = []
+    stack: List[JSXElement] = []
+    pos = 0
+    n = len(src)
+    while pos < n:
+        ch = src[pos]
+        if ch == "<":
+            m = _OPEN_RE.match(src, pos)
+            if m is None or (m.group(2) is None and src[m.end():m.end() + 1] != ">"):
+                # Not a tag (e.g. a comparison in surrounding code)
+                if stack:
+                    stack[-1].has_text = True
+                pos += 1
+                continue
+            closing, tag = m.group(1), m.group(2) or ""
+            if closing:
+                end = _TAG_END_RE.match(src, m.end())
+                close_end = end.end() if end else m.end()
+                # Close the nearest matching element; unmatched closers are ignored
+                for depth in range(len(stack) - 1, -1, -1):
+                    if stack[depth].tag == tag:
+                        while len(stack) > depth:
+                            el = stack.pop()
+                            el.inner_end = pos
+                            el.end = close_end
+                        break
+                pos = close_end
+                continue
+            parsed = _scan_open_tag(src, m.end())
+            if parsed is None:
+                if stack:
+                    stack[-1].has_text = True
+                pos += 1
+                continue
+            attrs, tag_end, self_closing = parsed
+            el = JSXElement(tag, attrs, pos)
+            el.inner_start = el.inner_end = el.end = tag_end
+            (stack[-1].children if stack else roots).append(el)
+            if not self_closing:
+                stack.append(el)
+            pos = tag_end
+        elif stack:
+            if ch == "{":
+                stack[-1].has_text = True
+                pos = _skip_expression(src, pos)
+            else:
+                m = _TEXT_RE.match(src, pos)
+                if not m.group().isspace():
+                    stack[-1].has_text = True
+                pos = m.end()
+        else:
+            pos = _OUTER_TEXT_RE.match(src, pos).end()
+    # Unclosed elements run to the end of the source
+    for el in stack:
+        el.inner_end = el.end = n
+    return roots
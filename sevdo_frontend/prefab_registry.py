@@ -0,0 +1,220 @@
+"""Prefab manifest: which token each prefab module renders, without importing it.
+
+The manifest maps every ``prefabs/*.py`` file to its ``COMPONENT_TOKEN`` and
+``COMPONENT_PURE`` flag plus a content digest. It is read statically from the
+module source (module-level literal assignments) and cached in
+``prefabs/.registry-manifest.json``, revalidated on every start by file mtime
+and size. Only new or changed files are re-read, so a warm start costs one
+``stat`` per prefab and no imports.
+
+Rebuild it ahead of time (e.g. during an image build) with::
+
+    python -m sevdo_frontend.prefab_registry
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import json
+import os
+import tempfile
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+PREFABS_DIR = Path(__file__).parent / "prefabs"
+PREFABS_PACKAGE = "sevdo_frontend.prefabs"
+MANIFEST_NAME = ".registry-manifest.json"
+MANIFEST_FORMAT = 1
+
+
+class PrefabEntry(NamedTuple):
+    file: str
+    module: str
+    token: Optional[str]
+    pure: bool
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+def _literal_attrs(source: str) -> Dict[str, object]:
+    """Module-level ``NAME = <literal>`` assignments and top-level functions."""
+    found: Dict[str, object] = {}
+    for stmt in ast.parse(source).body:
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Constant):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    found[target.id] = stmt.value.value
+        elif isinstance(stmt, ast.FunctionDef):
+            found[stmt.name] = stmt
+    return found
+
+
+def _scan(path: Path, st: os.stat_result) -> PrefabEntry:
+    data = path.read_bytes()
+    module = f"{PREFABS_PACKAGE}.{path.stem}"
+    token: Optional[str] = None
+    pure = False
+    try:
+        attrs = _literal_attrs(data.decode("utf-8"))
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        attrs = {}
+    if "render_prefab" in attrs and isinstance(attrs.get("COMPONENT_TOKEN"), str):
+        token = attrs["COMPONENT_TOKEN"]
+        pure = attrs.get("COMPONENT_PURE") is True
+    elif "render_prefab" in attrs:
+        # Token computed at import time; fall back to importing the module once
+        try:
+            mod = importlib.import_module(module)
+            token = getattr(mod, "COMPONENT_TOKEN", None)
+            pure = getattr(mod, "COMPONENT_PURE", False) is True
+        except Exception as e:
+            print(f"Error loading component {path.name}: {e}")
+    return PrefabEntry(
+        file=path.name,
+        module=module,
+        token=token,
+        pure=pure,
+        mtime_ns=st.st_mtime_ns,
+        size=st.st_size,
+        digest=blake2b(data, digest_size=16).hexdigest(),
+    )
+
+
+def _prop_key(node: ast.AST) -> Optional[str]:
+    """``k`` for ``props.get("k", ...)`` or ``props["k"]``."""
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "get"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "props"
+        and node.args
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+    ):
+        return node.args[0].value
+    if (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "props"
+        and isinstance(node.slice, ast.Constant)
+        and isinstance(node.slice.value, str)
+    ):
+        return node.slice.value
+    return None
+
+
+def prop_probes(source: str) -> Dict[str, List[str]]:
+    """Props a prefab reads, each with values worth rendering it with.
+
+    Keys are the literal ``props.get("k")`` / ``props["k"]`` lookups. Values
+    are the string literals compared against the prop, directly or through a
+    variable assigned from it (``style == "split"``), plus ``"true"`` and a
+    generic non-empty value for props that only switch on presence.
+    """
+    tree = ast.parse(source)
+    found: Dict[str, set] = {}
+    # Variable name -> the single prop its assigned value was read from
+    bound: Dict[str, str] = {}
+    for node in ast.walk(tree):
+        key = _prop_key(node)
+        if key is not None:
+            found.setdefault(key, set())
+        if isinstance(node, ast.Assign):
+            keys = {k for sub in ast.walk(node.value) if (k := _prop_key(sub))}
+            if len(keys) == 1:
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        bound[target.id] = next(iter(keys))
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Compare):
+            continue
+        keys, values = set(), set()
+        for side in (node.left, *node.comparators):
+            for sub in ast.walk(side):
+                key = _prop_key(sub)
+                if key is not None:
+                    keys.add(key)
+                elif isinstance(sub, ast.Name) and sub.id in bound:
+                    keys.add(bound[sub.id])
+                elif isinstance(sub, ast.Constant) and isinstance(sub.value, str):
+                    values.add(sub.value)
+        for key in keys:
+            found.setdefault(key, set()).update(values)
+    return {key: sorted(values | {"true", "1"}) for key, values in found.items()}
+
+
+def arg_probes(source: str) -> List[str]:
+    """Nested tokens a prefab reads from its args, in source order.
+
+    Prefabs parse their args as DSL and take the args of the statements whose
+    token they compare against (``node.token == "h"``, ``node.token in
+    ("b", "t")``).
+    """
+    found: Dict[str, tuple] = {}
+    for node in ast.walk(ast.parse(source)):
+        if not (
+            isinstance(node, ast.Compare)
+            and isinstance(node.left, ast.Attribute)
+            and node.left.attr == "token"
+        ):
+            continue
+        for side in node.comparators:
+            for sub in ast.walk(side):
+                if isinstance(sub, ast.Constant) and isinstance(sub.value, str):
+                    where = (sub.lineno, sub.col_offset)
+                    found[sub.value] = min(found.get(sub.value, where), where)
+    return sorted(found, key=found.__getitem__)
+
+
+def _read_manifest(path: Path) -> Dict[str, PrefabEntry]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.get("format") != MANIFEST_FORMAT:
+            return {}
+        return {e["file"]: PrefabEntry(**e) for e in raw["entries"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def _write_manifest(path: Path, entries: List[PrefabEntry]):
+    payload = {"format": MANIFEST_FORMAT, "entries": [e._asdict() for e in entries]}
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".manifest-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=1)
+        os.replace(tmp, path)
+    except OSError as e:
+        # Read-only checkout: keep the freshly scanned entries in memory only
+        print(f"Could not write prefab manifest {path}: {e}")
+
+
+def prefab_manifest(prefabs_dir: Path = PREFABS_DIR) -> List[PrefabEntry]:
+    """Current manifest entries, refreshing the cached file if it is stale."""
+    manifest_path = prefabs_dir / MANIFEST_NAME
+    cached = _read_manifest(manifest_path)
+    entries: List[PrefabEntry] = []
+    stale = False
+    for file in sorted(prefabs_dir.glob("*.py")):
+        if file.name == "__init__.py":
+            continue
+        st = file.stat()
+        entry = cached.pop(file.name, None)
+        if entry is None or (entry.mtime_ns, entry.size) != (
+            st.st_mtime_ns,
+            st.st_size,
+        ):
+            entry = _scan(file, st)
+            stale = True
+        entries.append(entry)
+    if stale or cached:
+        _write_manifest(manifest_path, entries)
+    return entries
+
+
+if __name__ == "__main__":
+    manifest = prefab_manifest()
+    print(f"{PREFABS_DIR / MANIFEST_NAME}: {len(manifest)} prefabs")
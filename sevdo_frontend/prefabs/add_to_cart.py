@@ -116,3 +116,4 @@ def render_prefab(args, props):
 
 # Register with token "ac"
 COMPONENT_TOKEN = "ac"
+COMPONENT_PURE = True
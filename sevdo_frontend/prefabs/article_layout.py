@@ -176,3 +176,4 @@ def render_prefab(args, props):
 
 # Register with token "al"
 COMPONENT_TOKEN = "al"
+COMPONENT_PURE = True
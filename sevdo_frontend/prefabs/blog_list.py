@@ -235,3 +235,4 @@ def render_prefab(args, props):
 
 # Register with token "bl"
 COMPONENT_TOKEN = "bl"
+COMPONENT_PURE = True
@@ -90,3 +90,4 @@ def render_prefab(args, props):
 
 # Register with token "bpc"
 COMPONENT_TOKEN = "bpc"
+COMPONENT_PURE = True
@@ -83,6 +83,7 @@ def render_prefab(args, props):
 
 # Register with token "b" to override the built-in button
 COMPONENT_TOKEN = "b"
+COMPONENT_PURE = True
 
 
 # b(Save){variant=secondary, size=lg}
@@ -193,3 +193,4 @@ def render_prefab(args, props):
 
 
 COMPONENT_TOKEN = "cal"
+COMPONENT_PURE = True
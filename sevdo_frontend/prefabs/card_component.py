@@ -71,3 +71,4 @@ def render_prefab(args, props):
 
 # Register with token "cd"
 COMPONENT_TOKEN = "cd"
+COMPONENT_PURE = True
@@ -68,3 +68,4 @@ def render_prefab(args, props):
 
 # Register with token "ch"
 COMPONENT_TOKEN = "ch"
+COMPONENT_PURE = True
@@ -140,3 +140,4 @@ def render_prefab(args, props):
 
 # Register with token "cf"
 COMPONENT_TOKEN = "cf"
+COMPONENT_PURE = True
@@ -149,3 +149,4 @@ def render_prefab(args, props):
 
 # Register with token "co"
 COMPONENT_TOKEN = "co"
+COMPONENT_PURE = True
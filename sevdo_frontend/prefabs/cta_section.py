@@ -208,3 +208,4 @@ def render_prefab(args, props):
 
 # Register with token "cta"
 COMPONENT_TOKEN = "cta"
+COMPONENT_PURE = True
@@ -137,3 +137,4 @@ def render_prefab(args, props):
 
 # Register with token "em"
 COMPONENT_TOKEN = "em"
+COMPONENT_PURE = True
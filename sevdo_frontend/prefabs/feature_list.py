@@ -132,3 +132,4 @@ def render_prefab(args, props):
 
 # Register with token "fl"
 COMPONENT_TOKEN = "fl"
+COMPONENT_PURE = True
@@ -120,3 +120,4 @@ def render_prefab(args, props):
 
 # Register with token "fc"
 COMPONENT_TOKEN = "fc"
+COMPONENT_PURE = True
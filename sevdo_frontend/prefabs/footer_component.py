@@ -123,3 +123,4 @@ def render_prefab(args, props):
 
 # Register with token "ft"
 COMPONENT_TOKEN = "ft"
+COMPONENT_PURE = True
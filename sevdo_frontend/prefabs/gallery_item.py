@@ -91,3 +91,4 @@ def render_prefab(args, props):
 
 # Register with token "gl"
 COMPONENT_TOKEN = "gl"
+COMPONENT_PURE = True
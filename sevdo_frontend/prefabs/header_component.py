@@ -98,3 +98,4 @@ def render_prefab(args, props):
 
 # Register with token "h" to override the built-in header
 COMPONENT_TOKEN = "h"
+COMPONENT_PURE = True
@@ -79,3 +79,4 @@ def render_prefab(args, props):
 
 # Register with token "ho"
 COMPONENT_TOKEN = "ho"
+COMPONENT_PURE = True
@@ -105,3 +105,4 @@ def render_prefab(args, props):
 
 # Register with token "hrs"
 COMPONENT_TOKEN = "hrs"
+COMPONENT_PURE = True
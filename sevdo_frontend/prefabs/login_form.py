@@ -104,3 +104,4 @@ def render_prefab(args, props):
 
 # Register with token "lf"
 COMPONENT_TOKEN = "lf"
+COMPONENT_PURE = True
@@ -113,3 +113,4 @@ def render_prefab(args, props):
 
 # Register with token "mc"
 COMPONENT_TOKEN = "mec"
+COMPONENT_PURE = True
@@ -85,3 +85,4 @@ def render_prefab(args, props):
 
 # Register with token "mn"
 COMPONENT_TOKEN = "mn"
+COMPONENT_PURE = True
@@ -89,3 +89,4 @@ def render_prefab(args, props):
 
 # Register with token "mic"
 COMPONENT_TOKEN = "mic"
+COMPONENT_PURE = True
@@ -77,3 +77,4 @@ def render_prefab(args, props):
  
 # Register with token "pg"
 COMPONENT_TOKEN = "pg"
+COMPONENT_PURE = True
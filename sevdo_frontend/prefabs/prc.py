@@ -116,3 +116,4 @@ def render_prefab(args, props):
 
 # Register with token "pc"
 COMPONENT_TOKEN = "prc"
+COMPONENT_PURE = True
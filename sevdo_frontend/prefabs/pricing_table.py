@@ -162,3 +162,4 @@ def render_prefab(args, props):
 
 # Register with token "pt"
 COMPONENT_TOKEN = "pt"
+COMPONENT_PURE = True
@@ -98,3 +98,4 @@ def render_prefab(args, props):
 
 # Register with token "pdc"
 COMPONENT_TOKEN = "pdc"
+COMPONENT_PURE = True
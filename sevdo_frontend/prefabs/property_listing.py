@@ -258,3 +258,4 @@ def render_prefab(args, props):
 
 # Register with token "pl"
 COMPONENT_TOKEN = "pl"
+COMPONENT_PURE = True
@@ -106,3 +106,4 @@ def render_prefab(args, props):
 
 # Register with token "qa"
 COMPONENT_TOKEN = "qa"
+COMPONENT_PURE = True
@@ -109,3 +109,4 @@ def render_prefab(args, props):
 
 # Register with token "rf"
 COMPONENT_TOKEN = "rf"
+COMPONENT_PURE = True
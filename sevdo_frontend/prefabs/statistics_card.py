@@ -89,3 +89,4 @@ def render_prefab(args, props):
 
 # Register with token "st"
 COMPONENT_TOKEN = "st"
+COMPONENT_PURE = True
@@ -94,3 +94,4 @@ def render_prefab(args, props):
 
 # Register with token "tt"
 COMPONENT_TOKEN = "tt"
+COMPONENT_PURE = True
@@ -85,3 +85,4 @@ def render_prefab(args, props):
 
 # Register with token "i"
 COMPONENT_TOKEN = "i"
+COMPONENT_PURE = True
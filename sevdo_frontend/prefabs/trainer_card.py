@@ -138,3 +138,4 @@ def render_prefab(args, props):
 
 # Register with token "tc"
 COMPONENT_TOKEN = "tc"
+COMPONENT_PURE = True
@@ -137,3 +137,4 @@ def render_prefab(args, props):
 
 # Register with token "wp"
 COMPONENT_TOKEN = "wp"
+COMPONENT_PURE = True
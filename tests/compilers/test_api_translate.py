@@ -1,4 +1,9 @@
+import asyncio
 import importlib
+import json
+import threading
+import time
+
 from fastapi.testclient import TestClient
 
 
@@ -272,3 +277,120 @@ def test_disable_cache_flag_results_in_misses(tmp_path):
     )
     assert r2.status_code == 200
     assert r2.json()["cache"]["hit"] is False
+
+
+def test_lean_output_is_cached_separately_and_profiled(tmp_path, monkeypatch):
+    client = get_client()
+    client.post("/api/cache/flush")
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    monkeypatch.setattr(
+        mod, "profile_import", lambda code: {"ok": True, "bytes": len(code)}
+    )
+
+    body = {"tokens": ["r", "m"], "lean": True}
+    lean = client.post("/api/translate/to-s-direct", json=body).json()
+    full = client.post("/api/translate/to-s-direct", json={"tokens": ["r", "m"]}).json()
+    assert lean["cache"]["key"] != full["cache"]["key"]
+    assert "passlib" in full["generated_code"] and "import_profile" not in full
+    assert "\nfrom passlib" not in lean["generated_code"]
+
+    resp = client.post(
+        "/api/translate/to-s-direct", json={**body, "profile_imports": True}
+    )
+    data = resp.json()
+    assert data["cache"]["hit"] is True
+    assert data["import_profile"] == {"ok": True, "bytes": data["bytes"]}
+
+    inp = tmp_path / "in.txt"
+    inp.write_text("r m\n", encoding="utf-8")
+    out = tmp_path / "out.py"
+    resp = client.post(
+        "/api/translate/to-s",
+        json={"input_path": str(inp), "output_path": str(out), "lean": True},
+    )
+    assert resp.json()["cache"]["hit"] is True
+    assert out.read_text(encoding="utf-8") == lean["generated_code"]
+
+
+def test_batch_stream_endpoints_emit_ndjson(tmp_path):
+    client = get_client()
+    jobs = []
+    for i in range(5):
+        inp = tmp_path / f"in{i}.txt"
+        inp.write_text("r l\n" if i != 3 else "r zz\n", encoding="utf-8")
+        out = tmp_path / f"o{i}.py"
+        jobs.append({"id": f"j{i}", "input_path": str(inp), "output_path": str(out)})
+
+    resp = client.post(
+        "/api/translate/to-s-batch-stream", json={"jobs": jobs, "max_in_flight": 2}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[-1] == {"totals": {"ok": 4, "failed": 1}}
+    by_index = {line["index"]: line for line in lines[:-1]}
+    assert sorted(by_index) == [0, 1, 2, 3, 4]
+    assert by_index[3]["ok"] is False
+    assert by_index[3]["error"] == {"code": "unknown_tokens", "unknown": ["zz"]}
+    assert by_index[0]["id"] == "j0" and by_index[0]["tokens"] == ["r", "l"]
+
+    decompile = [
+        {"id": f"d{i}", "code_path": str(tmp_path / f"o{i}.py")} for i in (0, 1, 3)
+    ]
+    resp = client.post("/api/translate/from-s-batch-stream", json={"jobs": decompile})
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[-1] == {"totals": {"ok": 2, "failed": 1}}
+    by_id = {line["id"]: line for line in lines[:-1]}
+    assert by_id["d1"]["tokens"] == ["r", "l"]
+    assert by_id["d3"]["error"]["code"] == "file_not_found"
+
+
+def test_batch_stream_limits_jobs_in_flight():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    lock = threading.Lock()
+    state = {"started": 0, "taken": 0, "most": 0}
+
+    def run_job(idx, job):
+        with lock:
+            state["started"] += 1
+            state["most"] = max(state["most"], state["started"] - state["taken"])
+        time.sleep(0.005)
+        return idx, True, {"id": str(idx)}
+
+    async def consume():
+        seen = []
+        async for idx, _, _ in mod._run_batch_streaming(run_job, list(range(20)), 3):
+            with lock:
+                state["taken"] += 1
+            # A slow reader: no new job may start while this one is held
+            await asyncio.sleep(0.01)
+            seen.append(idx)
+        return seen
+
+    assert sorted(asyncio.run(consume())) == list(range(20))
+    assert state["most"] <= 3
+
+
+def test_batch_stream_cleans_up_when_response_stops(monkeypatch):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    shutdowns = []
+
+    class Executor(mod.cf.ThreadPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            shutdowns.append(kwargs)
+            super().shutdown(*args, **kwargs)
+
+    monkeypatch.setattr(mod.cf, "ThreadPoolExecutor", Executor)
+
+    async def disconnect_after_first_line():
+        lines = mod._ndjson_batch(
+            lambda idx, job: (idx, True, {}), list(range(10)), 1
+        ).body_iterator
+        await lines.__anext__()
+        await lines.aclose()
+        # The job stream was closed with it, not left to the finaliser
+        return list(shutdowns)
+
+    assert asyncio.run(disconnect_after_first_line()) == [
+        {"wait": False, "cancel_futures": True}
+    ]
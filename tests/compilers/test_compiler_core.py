@@ -1,4 +1,13 @@
 import importlib
+import importlib.util
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sevdo_backend.endpoints import EndpointRegistry
 
 
 def test_round_trip_tokens_to_code_and_back():
@@ -23,3 +32,297 @@ def test_write_if_changed(tmp_path):
     # Different content should be True again
     changed3 = mod._write_if_changed(str(out), "print('b')\n")
     assert changed3 is True
+
+
+ENDPOINT = '''
+CALLS = []
+ENDPOINT_TOKEN = "zz"
+
+
+def render_endpoint(args=None, props=None):
+    CALLS.append((args, props))
+    path = (props or {{}}).get("path", "{path}")
+    return f'@app.get("{{path}}")\\ndef zz_endpoint():\\n    return {{{{}}}}'
+'''
+
+
+def _touch(path, text):
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_endpoint_snippets_render_once_and_reload_on_edit(tmp_path):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    src = tmp_path / "zz_endpoint.py"
+    src.write_text(ENDPOINT.format(path="/one"), encoding="utf-8")
+    (tmp_path / "_template.py").write_text(ENDPOINT.format(path="/skip"), encoding="utf-8")
+
+    compiler = mod.BackendCompiler(endpoints=EndpointRegistry(tmp_path))
+    module = compiler.mapping["zz"]
+    first = compiler.tokens_to_code(["zz", "r", "zz"], include_imports=False)
+    assert compiler.tokens_to_code(["zz", "r", "zz"], include_imports=False) == first
+    assert first.count('@app.get("/one")') == 1
+    assert module.CALLS == [(None, None)]
+
+    custom = compiler.render_snippet("zz", props={"path": "/custom"})
+    assert '@app.get("/custom")' in custom
+    assert compiler.render_snippet("zz", props={"path": "/custom"}) is custom
+    assert len(module.CALLS) == 2
+
+    assert compiler.refresh_snippets() == []
+    _touch(src, ENDPOINT.format(path="/two"))
+    assert compiler.refresh_snippets() == ["zz"]
+    assert compiler.mapping["zz"] is not module
+    assert '@app.get("/two")' in compiler.tokens_to_code(["zz"], include_imports=False)
+
+
+def test_registry_picks_up_new_and_deleted_endpoint_files(tmp_path):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    compiler = mod.BackendCompiler(endpoints=EndpointRegistry(tmp_path))
+    assert "zz" not in compiler.mapping
+
+    src = tmp_path / "zz_endpoint.py"
+    src.write_text(ENDPOINT.format(path="/new"), encoding="utf-8")
+    assert compiler.refresh_snippets() == ["zz"]
+    assert compiler.code_to_tokens('@app.get("/new")\n') == ["zz"]
+
+    # A broken edit drops the token instead of keeping a half-loaded module
+    _touch(src, "def render_endpoint(:\n")
+    assert compiler.refresh_snippets() == ["zz"]
+    assert "zz" not in compiler.mapping
+
+    _touch(src, ENDPOINT.format(path="/new"))
+    assert compiler.refresh_snippets() == ["zz"]
+    src.unlink()
+    assert compiler.refresh_snippets() == ["zz"]
+    assert "zz" not in compiler.mapping
+    assert compiler.code_to_tokens('@app.get("/new")\n') == []
+
+
+def test_endpoint_edit_invalidates_only_results_using_its_token(tmp_path, monkeypatch):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    src = tmp_path / "zz_endpoint.py"
+    src.write_text(ENDPOINT.format(path="/one"), encoding="utf-8")
+
+    compiler = mod.BackendCompiler(
+        endpoints=EndpointRegistry(tmp_path), on_change=mod._drop_stale_results
+    )
+    monkeypatch.setattr(mod, "GLOBAL_COMPILER", compiler)
+    monkeypatch.setattr(mod, "TOKENS_TO_CODE_CACHE", mod.SimpleTTLCache())
+    monkeypatch.setattr(mod, "CODE_TO_TOKENS_CACHE", mod.SimpleTTLCache())
+    monkeypatch.setattr(mod, "SNIPPET_CHECK_SECONDS", 0)
+    _, _, key_r = mod.tokens_to_code_cached_info(["r", "l"], True)
+    _, _, key_zz = mod.tokens_to_code_cached_info(["r", "zz"], True)
+    mod.code_to_tokens_cached_info('@app.get("/one")\n')
+    assert len(mod.TOKENS_TO_CODE_CACHE) == 2
+    version = compiler.registry_version
+
+    _touch(src, ENDPOINT.format(path="/two"))
+    code, hit, key = mod.tokens_to_code_cached_info(["r", "zz"], True)
+    assert not hit and key != key_zz and '@app.get("/two")' in code
+    assert mod.tokens_to_code_cached_info(["r", "l"], True)[1:] == (True, key_r)
+    assert compiler.registry_version != version
+    # The stale "r zz" entry was dropped rather than left to expire
+    assert len(mod.TOKENS_TO_CODE_CACHE) == 2
+    assert len(mod.CODE_TO_TOKENS_CACHE) == 0
+    assert mod.code_to_tokens_cached_info('@app.get("/one")\n')[0] == []
+
+
+def test_shared_definitions_are_emitted_once_in_dependency_order():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    compiler = mod.BackendCompiler()
+    code = compiler.tokens_to_code(["bs", "bt", "bs"])
+    for name in ("BlogPostDB", "PostTagDB", "BlogPostResponse", "BlogSearchResult"):
+        assert code.count(f"class {name}(") == 1
+    assert code.count("def blog_search_endpoint(") == 1
+    # bt's models refer to bp's, which it does not render itself
+    assert "def blog_posts_endpoint(" not in code
+    assert code.index("class BlogPostResponse(") < code.index("class TaggedPostsResponse(")
+    assert code.index("class TaggedPostsResponse(") < code.index("@app.")
+    assert compiler.tokens_to_code(["bs"]) == compiler.tokens_to_code(["bs", "bs"])
+
+
+PROVIDER = '''
+IMPORTS = ("import re", "import uuid")
+DEFINITIONS = {{
+    "Slug": """
+class Slug(BaseModel):
+    value: str = "{default}"
+""",
+}}
+ENDPOINT_TOKEN = "pp"
+
+
+def render_endpoint(args=None, props=None):
+    return '@app.get("/pp")\\ndef pp_endpoint() -> Slug:\\n    return Slug()'
+'''
+
+CONSUMER = '''
+IMPORTS = ("import re",)
+DEFINITIONS = {
+    "Page": """
+class Page(BaseModel):
+    slug: Slug
+""",
+}
+ENDPOINT_TOKEN = "cc"
+
+
+def render_endpoint(args=None, props=None):
+    return '@app.get("/cc")\\ndef cc_endpoint() -> Page:\\n    return Page(slug=Slug())'
+'''
+
+
+def test_required_definitions_resolve_across_modules(tmp_path):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    (tmp_path / "pp.py").write_text(PROVIDER.format(default="a"), encoding="utf-8")
+    (tmp_path / "cc.py").write_text(CONSUMER, encoding="utf-8")
+    compiler = mod.BackendCompiler(endpoints=EndpointRegistry(tmp_path))
+
+    code = compiler.tokens_to_code(["cc"])
+    body = code[len(mod.CORE_IMPORTS):]
+    # "import uuid" is a core import; Slug is pulled in through Page
+    assert body.startswith("import re\n\nclass Slug(BaseModel):")
+    assert body.index("class Slug(") < body.index("class Page(") < body.index('@app.get("/cc")')
+    assert "/pp" not in body
+    assert not compiler.tokens_to_code(["cc"], include_imports=False).startswith("import")
+
+    version = compiler.token_versions["cc"]
+    _touch(tmp_path / "pp.py", PROVIDER.format(default="b"))
+    assert compiler.refresh_snippets() == ["cc", "pp"]
+    assert compiler.token_versions["cc"] != version
+    assert 'value: str = "b"' in compiler.tokens_to_code(["cc"])
+
+
+def test_code_to_tokens_covers_module_routes_in_one_scan(tmp_path):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    src = tmp_path / "zz_endpoint.py"
+    src.write_text(ENDPOINT.format(path="/zz"), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("zz_endpoint", src)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    compiler = mod.BackendCompiler()
+    compiler.register_module("zz", module)
+    code = compiler.tokens_to_code(["m", "zz", "r", "m"])
+    assert compiler.code_to_tokens(code) == ["m", "zz", "r"]
+    # Decorators with extra arguments or single quotes still match
+    assert compiler.code_to_tokens("@app.get('/zz', tags=['x'])\n@app.post(\"/login\")") == ["zz", "l"]
+
+
+def test_registry_is_read_only_and_swapped_atomically(tmp_path):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    src = tmp_path / "zz_endpoint.py"
+    src.write_text(ENDPOINT.format(path="/zz"), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("zz_endpoint", src)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    compiler = mod.BackendCompiler()
+    before = compiler.registry()
+    with pytest.raises(TypeError):
+        compiler.mapping["zz"] = module
+    compiler.register_module("zz", module)
+    # Readers holding the old snapshot keep a consistent view
+    assert "zz" not in before.mapping and "zz" not in before.versions
+    assert before.tokens_to_code(["zz"], False) == ""
+    after = compiler.registry()
+    assert after.code_to_tokens(after.tokens_to_code(["zz", "r"])) == ["zz", "r"]
+    assert after.snippets["r"] is before.snippets["r"]
+
+
+def test_sharded_ttl_cache_from_threads():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    cache = mod.SimpleTTLCache(maxsize=64, shards=4)
+
+    def work(n):
+        for i in range(200):
+            cache.set(f"{n}-{i}", i)
+            assert cache.get(f"{n}-{i}") == i
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(work, range(4)))
+    assert len(cache) <= 64
+    assert cache.stats()["shards"] == 4
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lean_core_defers_startup_work_and_drops_unused_imports():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    compiler = mod.BackendCompiler()
+    full = compiler.tokens_to_code(["m"])
+    lean = compiler.tokens_to_code(["m"], lean=True)
+    compile(lean, "lean_app.py", "exec")
+    assert lean.endswith(full[len(mod.CORE_IMPORTS):])
+
+    header = lean.split("# Create tables", 1)[0]
+    assert "passlib" not in header and "import uuid" not in header
+    assert "import logging" not in header and "relationship" not in header
+    assert "\nBase.metadata.create_all" not in lean
+    assert "lifespan=lifespan" in lean and "pwd_context = _LazyCryptContext()" in lean
+
+    # Names the selected tokens use are kept
+    header = compiler.tokens_to_code(["l", "bs"], lean=True).split("# Create tables", 1)[0]
+    assert "import uuid" in header and "from datetime import datetime, timedelta" in header
+    assert "List" in header and "Text" in header
+    assert compiler.tokens_to_code(["m"], include_imports=False, lean=True) == (
+        compiler.tokens_to_code(["m"], include_imports=False)
+    )
+
+
+def test_profile_import_times_generated_module():
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    code = "import colorsys\nVALUE = colorsys.rgb_to_hsv(1, 0, 0)\n"
+    profile = mod.profile_import(code, runs=1)
+    assert profile["ok"] and profile["runs"] == 1
+    assert profile["wall_ms"] >= profile["import_ms"] > 0
+    assert [s["module"] for s in profile["slowest"]] == ["colorsys"]
+
+    failed = mod.profile_import("import no_such_module_here\n", runs=1)
+    assert not failed["ok"] and "no_such_module_here" in failed["error"]
+
+
+def test_cache_keys_cover_compiler_source_and_ignore_repeats(monkeypatch):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    versions = {"a": "1", "b": "2"}
+    key = mod._key_tokens(["a", "b"], True, versions)
+    assert mod._key_tokens(["a", "a", "b", "a"], True, versions) == key
+    assert mod._key_tokens(["b", "a"], True, versions) != key
+    code_key = mod._key_code("code", "routes")
+
+    # A deploy that changes how code is assembled gets fresh keys
+    monkeypatch.setattr(mod, "COMPILER_VERSION", "changed")
+    assert mod._key_tokens(["a", "b"], True, versions) != key
+    assert mod._key_tokens(["a", "b"], False, versions) != key
+    assert mod._key_code("code", "routes") != code_key
+
+
+def test_expired_check_window_is_rescanned_once(tmp_path, monkeypatch):
+    mod = importlib.import_module("sevdo_backend.backend_compiler")
+    registry = EndpointRegistry(tmp_path)
+    compiler = mod.BackendCompiler(endpoints=registry)
+    scans = []
+    scan = registry.refresh
+
+    def slow_refresh():
+        scans.append(1)
+        time.sleep(0.05)
+        return scan()
+
+    monkeypatch.setattr(registry, "refresh", slow_refresh)
+    monkeypatch.setattr(mod, "SNIPPET_CHECK_SECONDS", 60.0)
+    compiler._checked -= 60
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        compiler.maybe_refresh()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(scans) == 1
@@ -0,0 +1,65 @@
+import importlib
+
+from sevdo_common.disk_cache import DiskCache
+
+
+def test_entries_are_shared_between_instances(tmp_path):
+    a = DiskCache(str(tmp_path), "dsl_to_jsx")
+    b = DiskCache(str(tmp_path), "dsl_to_jsx")
+    other = DiskCache(str(tmp_path), "tokens_to_code")
+    a.set("k", "<div/>")
+    a.set("tokens", ["a", "b"])
+    assert b.get("k") == "<div/>"
+    assert b.get("tokens") == ["a", "b"]
+    # Namespaces share the file but not the keys
+    assert other.get("k") is None
+    assert b.stats()["hits"] == 2 and other.stats()["misses"] == 1
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path, monkeypatch):
+    import sevdo_common.disk_cache as dc
+
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(dc, "time", lambda: next(clock) * 100.0)
+    cache = DiskCache(str(tmp_path), "ns", max_bytes=1000)
+    for i in range(4):
+        cache.set(f"k{i}", "x" * 200)
+    cache.get("k0")  # refresh k0 so k1 becomes the oldest
+    cache.set("k4", "x" * 200)
+    stats = cache.stats()
+    assert stats["bytes"] <= 1000 and stats["evictions"] >= 1
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    # Values larger than the whole cap are never stored
+    cache.set("huge", "x" * 2000)
+    assert cache.get("huge") is None
+
+
+def test_clear_only_drops_own_namespace(tmp_path):
+    a = DiskCache(str(tmp_path), "a")
+    b = DiskCache(str(tmp_path), "b")
+    a.set("k", "1")
+    b.set("k", "2")
+    a.clear()
+    assert a.get("k") is None and b.get("k") == "2"
+    assert a.stats()["bytes"] == b.stats()["bytes"] > 0
+
+
+def test_memory_caches_read_and_write_through(tmp_path):
+    fc = importlib.import_module("sevdo_frontend.frontend_compiler")
+    bc = importlib.import_module("sevdo_backend.backend_compiler")
+
+    worker1 = fc._LRUCache(8, 60, 1 << 20, backing=DiskCache(str(tmp_path), "fe"))
+    worker2 = fc._LRUCache(8, 60, 1 << 20, backing=DiskCache(str(tmp_path), "fe"))
+    worker1.set("key", "<p>Hi</p>")
+    assert worker2.get("key") == "<p>Hi</p>"
+    assert len(worker2) == 1  # promoted into memory
+    stats = worker2.stats()
+    assert stats["misses"] == 1 and stats["disk"]["hits"] == 1
+
+    be1 = bc.SimpleTTLCache(backing=DiskCache(str(tmp_path), "be"))
+    be2 = bc.SimpleTTLCache(backing=DiskCache(str(tmp_path), "be"))
+    be1.set("key", ["r", "l"])
+    assert be2.get("key") == ["r", "l"]
+    be2.clear()
+    assert be1.backing.get("key") is None
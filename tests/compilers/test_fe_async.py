@@ -0,0 +1,50 @@
+import asyncio
+import importlib
+import logging.handlers
+import time
+
+import httpx
+import pytest
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+@pytest.mark.anyio
+async def test_slow_file_io_does_not_block_other_requests(tmp_path, monkeypatch):
+    fc = _fc()
+    real_read = fc._read_text_with_limits
+
+    def slow_read(path):
+        time.sleep(0.5)  # a stalled disk
+        return real_read(path)
+
+    monkeypatch.setattr(fc, "_read_text_with_limits", slow_read)
+    inp = tmp_path / "in.s"
+    inp.write_text("t(Hello)", encoding="utf-8")
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+
+        start = time.perf_counter()
+
+        async def timed(delay, make_request):
+            await asyncio.sleep(delay)
+            resp = await make_request()
+            return resp, time.perf_counter() - start
+
+        body = {"input_path": str(inp), "output_path": str(tmp_path / "out.jsx")}
+        # /health is sent while the compile is stuck in its file read
+        (slow, slow_t), (health, health_t) = await asyncio.gather(
+            timed(0, lambda: client.post("/api/fe-translate/to-s", json=body)),
+            timed(0.1, lambda: client.get("/health")),
+        )
+    assert slow.status_code == 200 and health.status_code == 200
+    assert slow_t >= 0.5
+    assert health_t < 0.35
+
+
+def test_logging_goes_through_a_queue():
+    fc = _fc()
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in fc.logger.handlers)
+    assert not fc.logger.propagate
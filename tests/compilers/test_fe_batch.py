@@ -0,0 +1,105 @@
+import asyncio
+import concurrent.futures as cf
+import importlib
+import json
+import threading
+
+import httpx
+import pytest
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+@pytest.fixture
+def fc(monkeypatch):
+    mod = _fc()
+    monkeypatch.setattr(mod, "BATCH_PROCESS_WORKERS", 2)
+    monkeypatch.setattr(mod, "BATCH_PROCESS_CHUNK_MAX", 2)
+    yield mod
+    mod.shutdown_batch_pool()
+
+
+def _jobs(tmp_path, n):
+    jobs = []
+    for i in range(n):
+        inp = tmp_path / f"page{i}.s"
+        inp.write_text(f"c(h(Page {i}) t(Body {i}) mn(Home,Blog))", encoding="utf-8")
+        out = tmp_path / f"page{i}.jsx"
+        jobs.append({"id": f"p{i}", "input_path": str(inp), "output_path": str(out)})
+    missing = {"input_path": str(tmp_path / "nope.s"), "output_path": str(tmp_path / "x.jsx")}
+    jobs.append({"id": "missing", **missing})
+    return jobs
+
+
+@pytest.mark.anyio
+async def test_batch_stream_runs_on_process_pool(fc, tmp_path):
+    jobs = _jobs(tmp_path, 7)
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        resp = await client.post("/api/fe-translate/to-s-batch-stream", json={"jobs": jobs})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+
+    assert lines[-1] == {"totals": {"ok": 7, "failed": 1}}
+    by_id = {line["id"]: line for line in lines[:-1]}
+    assert sorted(line["index"] for line in lines[:-1]) == list(range(8))
+    assert by_id["missing"]["ok"] is False and by_id["missing"]["status"] == 404
+    for i in range(7):
+        out = tmp_path / f"page{i}.jsx"
+        assert by_id[f"p{i}"]["ok"] and by_id[f"p{i}"]["changed"]
+        expected = fc.dsl_to_jsx((tmp_path / f"page{i}.s").read_text(encoding="utf-8"))
+        assert out.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.anyio
+async def test_batch_executors_agree(fc, tmp_path):
+    jobs = _jobs(tmp_path, 3)
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        url = "/api/fe-translate/to-s-batch"
+        threaded = (await client.post(url, json={"jobs": jobs})).json()
+        pooled = (await client.post(url, json={"jobs": jobs, "executor": "process"})).json()
+    assert pooled["totals"] == threaded["totals"] == {"ok": 3, "failed": 1}
+    # Second run finds identical output on disk
+    assert [r.get("changed") for r in pooled["results"]] == [False, False, False, None]
+    assert [r["id"] for r in pooled["results"]] == ["p0", "p1", "p2", "missing"]
+
+
+@pytest.mark.anyio
+async def test_cancelled_thread_batch_does_not_wait_for_queued_jobs(fc, monkeypatch):
+    pool = cf.ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(fc, "_BATCH_THREADS", pool)
+    release = threading.Event()
+    ran = []
+
+    def job(idx, _):
+        ran.append(idx)
+        release.wait(5)
+        return idx, True, {}
+
+    task = asyncio.ensure_future(fc._run_batch_in_threads(job, range(4)))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # Returned while job 0 still runs; the queued ones never start
+    release.set()
+    pool.shutdown(wait=True)
+    assert ran == [0]
+
+
+def test_parallel_page_render_matches_sequential(fc, monkeypatch):
+    monkeypatch.setattr(fc, "PARALLEL_MIN_STATEMENTS", 4)
+    # Registered at runtime, so unknown to the workers: rendered in-process
+    monkeypatch.setitem(fc.COMPONENT_REGISTRY, "zzlocal", lambda args, props: f"<p>{args}</p>")
+    pages = sorted(fc.Path(fc.__file__).parent.parent.glob("templates/real_estate_site/frontend/*.s"))
+    source = "\n".join(p.read_text(encoding="utf-8") for p in pages)
+    source += "\nzzlocal(runtime)\nc(t(a) zzlocal(nested))\n"
+    for include_imports in (True, False):
+        expected = fc.dsl_to_jsx(source, include_imports, "Big")
+        assert fc.dsl_to_jsx_parallel(source, include_imports, "Big") == expected
+    with pytest.raises(fc.ParseError, match="Unknown token"):
+        fc.dsl_to_jsx_parallel(source + "nosuchtoken\n")
@@ -0,0 +1,178 @@
+import importlib
+import sys
+import threading
+
+import httpx
+import pytest
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+def test_lru_evicts_least_recently_used_and_counts():
+    fc = _fc()
+    cache = fc._LRUCache(maxsize=2, ttl=60, max_bytes=1 << 20)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "b" is now least recently used
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+
+def test_lru_byte_budget_and_oversized_values():
+    fc = _fc()
+    value = "x" * 1000
+    entry = sys.getsizeof("k0") + sys.getsizeof(value)
+    cache = fc._LRUCache(maxsize=100, ttl=60, max_bytes=entry * 3)
+    for i in range(5):
+        cache.set(f"k{i}", value)
+    assert len(cache) == 3
+    assert cache.stats()["bytes"] <= entry * 3
+    cache.set("huge", "y" * (entry * 4))
+    assert cache.get("huge") is None
+
+
+def test_lru_ttl_expiry(monkeypatch):
+    fc = _fc()
+    now = [1000.0]
+    monkeypatch.setattr(fc, "monotonic", lambda: now[0])
+    cache = fc._LRUCache(maxsize=10, ttl=5, max_bytes=1 << 20)
+    cache.set("a", "1")
+    now[0] += 10
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
+
+
+def test_lru_concurrent_access_keeps_accounting_consistent():
+    fc = _fc()
+    cache = fc._LRUCache(maxsize=50, ttl=60, max_bytes=1 << 20)
+
+    def worker(n):
+        for i in range(2000):
+            key = f"{(i * 7 + n) % 120}"
+            if cache.get(key) is None:
+                cache.set(key, key * 10)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = cache.stats()
+    assert stats["size"] <= 50
+    assert stats["bytes"] == sum(
+        sys.getsizeof(k) + sys.getsizeof(v[1]) for k, v in cache._store.items()
+    )
+    assert stats["hits"] + stats["misses"] == 8 * 2000
+
+
+@pytest.mark.anyio
+async def test_fe_cache_stats_expose_counters(tmp_path):
+    app = importlib.reload(_fc()).app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        body = {"dsl_content": "t(Hello)", "include_imports": False}
+        await client.post("/api/fe-translate/to-s-direct", json=body)
+        await client.post("/api/fe-translate/to-s-direct", json=body)
+        s = (await client.get("/api/fe-cache/stats")).json()["dsl_to_jsx"]
+        assert s["hits"] == 1 and s["misses"] == 1
+        assert s["bytes"] > 0 and s["max_bytes"] > 0
+        assert s["hit_rate"] == 0.5
+
+
+def test_cache_keys_are_content_addressed():
+    fc = _fc()
+    key = fc.dsl_cache_key("t(Hello)", True, "Page")
+    assert key == fc.dsl_cache_key("t(Hello)", True, "Page")
+    assert key.startswith("dsl:")
+    assert key != fc.dsl_cache_key("t(Hello)", False, "Page")
+    assert key != fc.dsl_cache_key("t(Hello)", True, "Page2")
+    # Field boundaries are length-prefixed, so shifting text between fields
+    # must not collide
+    assert fc.dsl_cache_key("ab", True, "c") != fc.dsl_cache_key("a", True, "bc")
+    assert fc.jsx_cache_key("<p/>") != fc.jsx_cache_key("<p />")
+
+
+def test_cache_keys_stable_across_processes():
+    import os
+    import subprocess
+    from pathlib import Path
+
+    code = (
+        "from sevdo_frontend.frontend_compiler import dsl_cache_key;"
+        "print(dsl_cache_key('c(t(Hi) b(Go))', True, 'Page'))"
+    )
+    root = Path(__file__).resolve().parents[2]
+    keys = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, env=env,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        keys.add(out.strip().splitlines()[-1])
+    assert keys == {_fc().dsl_cache_key("c(t(Hi) b(Go))", True, "Page")}
+
+
+def test_registry_version_tracks_prefab_sources(monkeypatch):
+    fc = _fc()
+    before = fc.dsl_cache_key("t(Hi)", True, "Page")
+    monkeypatch.setattr(fc, "PREFAB_REGISTRY_VERSION", "other")
+    assert fc.dsl_cache_key("t(Hi)", True, "Page") != before
+
+
+def test_pure_prefab_renders_are_memoized(monkeypatch):
+    fc = _fc()
+    calls = []
+
+    def render(args, props):
+        calls.append(args)
+        return f"<nav>{args}{props.get('title', '')}</nav>"
+
+    monkeypatch.setitem(fc.COMPONENT_REGISTRY, "zz", render)
+    monkeypatch.setattr(fc, "PURE_COMPONENTS", {"zz"})
+    fc.PREFAB_MEMO.clear()
+    first = fc.dsl_to_jsx("zz(Home,Blog){title=Site} zz(Home,Blog){title=Site}")
+    assert first.count("<nav>Home,BlogSite</nav>") == 2
+    assert calls == ["Home,Blog"]
+    fc._jsx_for_token("zz", "Home,Blog", {"title": "Other"})
+    fc._jsx_for_token("zz", None, {})
+    fc._jsx_for_token("zz", "", {})
+    assert len(calls) == 4
+    # Props the memo cannot freeze bypass it
+    fc._jsx_for_token("zz", "x", {"items": ["a"]})
+    fc._jsx_for_token("zz", "x", {"items": ["a"]})
+    assert len(calls) == 6
+    assert fc.PREFAB_MEMO.stats()["hits"] >= 1
+
+    fc.PURE_COMPONENTS.discard("zz")
+    fc._jsx_for_token("zz", "Home,Blog", {"title": "Site"})
+    assert len(calls) == 7
+
+
+def test_register_component_invalidates_memo_and_cache_keys(monkeypatch):
+    fc = _fc()
+    monkeypatch.setattr(fc, "COMPONENT_REGISTRY", dict(fc.COMPONENT_REGISTRY))
+    monkeypatch.setattr(fc, "PURE_COMPONENTS", set(fc.PURE_COMPONENTS))
+    monkeypatch.setattr(fc, "_RUNTIME_COMPONENTS", {})
+    monkeypatch.setattr(fc, "PREFAB_REGISTRY_VERSION", fc.PREFAB_REGISTRY_VERSION)
+
+    def outer(args, props):
+        # A pure prefab whose output embeds another token's render
+        return "<section>" + fc._jsx_for_token("zzin", args, {}) + "</section>"
+
+    fc.register_component("zzin", lambda args, props: f"<b>{args}</b>")
+    fc.register_component("zzout", outer, pure=True)
+    key = fc.dsl_cache_key("zzout(Hi)", True, "Page")
+    assert "<section><b>Hi</b></section>" in fc.dsl_to_jsx("zzout(Hi)")
+
+    fc.register_component("zzin", lambda args, props: f"<i>{args}</i>")
+    assert "<section><i>Hi</i></section>" in fc.dsl_to_jsx("zzout(Hi)")
+    assert fc.dsl_cache_key("zzout(Hi)", True, "Page") != key
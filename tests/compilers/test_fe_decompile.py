@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from sevdo_frontend import frontend_compiler as fc
+from sevdo_frontend.jsx_scanner import scan_jsx
+
+
+def test_scanner_skips_expressions_and_keeps_spans():
+    src = (
+        "import React from 'react';\n<>\n"
+        '<button onClick={() => { if (a < b) { x("}<p>") } }} disabled>Go</button>\n'
+        '<img src="a.png" {...rest} />\n'
+        "<p>{items.map(i => <b>{i}</b>)}</p>\n</>\n"
+    )
+    (frag,) = scan_jsx(src)
+    button, img, p = frag.children
+    assert button.attrs["onClick"].startswith("{() =>") and button.attrs["disabled"] is None
+    assert src[button.inner_start:button.inner_end] == "Go"
+    assert img.attrs == {"src": "a.png"} and src[img.start:img.end].endswith("/>")
+    # JSX inside an expression child stays opaque
+    assert p.children == [] and p.has_text
+
+
+def test_builtin_tokens_round_trip_exactly():
+    dsl = (
+        "c(\n  t(Hello)\n  img(logo.png){alt=Logo}\n  n(Home,About)\n"
+        "  sel(a,b)\n  f(\n    t(Inside)\n  )\n){class=mt-2}\nt\n"
+    )
+    jsx = fc.dsl_to_jsx(dsl)
+    assert fc.nodes_to_dsl(fc.decompile_jsx(jsx)) == dsl
+    assert fc.jsx_to_dsl(jsx) == ["c", "t", "img", "n", "sel", "f", "t", "t"]
+
+
+def test_prefabs_are_recognised_by_fingerprint():
+    dsl = "mn(Home,Menu)\ncta{style=split}\nb(Go)\nh\n"
+    nodes = fc.decompile_jsx(fc.dsl_to_jsx(dsl))
+    assert [n.token for n in nodes] == ["mn", "cta", "b", "h"]
+    assert dict(nodes[1].props) == {"style": "split"}
+    assert nodes[2].args == "Go"
+    assert fc.dsl_to_jsx(fc.nodes_to_dsl(nodes)) == fc.dsl_to_jsx(dsl)
+    # Props beyond the probes: still the right token, by structure, flagged
+    custom = "mec(h(Basic)){price=49/month,features=[Gym, Pool],popular=true}"
+    inexact = []
+    assert [n.token for n in fc.decompile_jsx(fc.dsl_to_jsx(custom), inexact)] == ["mec"]
+    assert [n.token for n in inexact] == ["mec"]
+
+
+def test_prefab_nested_args_and_echoed_props_are_recovered():
+    dsl = "fl(h(Why us) t(Because))\ncta(h(Join)){style=split}\n"
+    inexact = []
+    nodes = fc.decompile_jsx(fc.dsl_to_jsx(dsl), inexact)
+    assert fc.nodes_to_dsl(nodes) == dsl and not inexact
+
+
+def test_template_corpus_round_trips_or_is_flagged():
+    root = Path(__file__).resolve().parents[2] / "templates"
+    statements = exact = 0
+    for page in sorted(root.glob("*/frontend/*.s")):
+        for node in fc.parse_dsl(page.read_text(encoding="utf-8")):
+            jsx = fc.dsl_to_jsx(fc.nodes_to_dsl([node]), include_imports=False)
+            inexact = []
+            dsl = fc.nodes_to_dsl(fc.decompile_jsx(jsx, inexact))
+            statements += 1
+            if not inexact:
+                exact += 1
+                assert fc.dsl_to_jsx(dsl, include_imports=False) == jsx, (page, dsl)
+    assert statements and exact >= 0.9 * statements
+
+
+def test_unknown_wrappers_are_looked_through():
+    jsx = fc.dsl_to_jsx("t(a)\nc(t(b))", include_imports=False)
+    wrapped = jsx.replace("<>", '<>\n<main id="app">').replace("</>", "</main>\n</>")
+    assert fc.jsx_to_dsl(wrapped) == ["t", "c", "t"]
+
+
+def test_deep_nesting_decompiles():
+    depth = 900
+    dsl = "c(" * depth + "t(x)" + ")" * depth
+    assert fc.jsx_to_dsl(fc.dsl_to_jsx(dsl)) == ["c"] * depth + ["t"]
+
+
+@pytest.mark.anyio
+async def test_from_s_returns_dsl_and_caches_it(tmp_path):
+    code = tmp_path / "page.jsx"
+    code.write_text(fc.dsl_to_jsx("t(a)\nt(b)\nc(t(c))\n"), encoding="utf-8")
+    fc.JSX_TO_DSL_CACHE.clear()
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        for _ in range(2):
+            resp = await client.post("/api/fe-translate/from-s", json={"code_path": str(code)})
+            assert resp.status_code == 200, resp.text
+            assert resp.json() == {
+                "tokens": ["t", "t", "c", "t"],
+                "dsl": "t(a)\nt(b)\nc(\n  t(c)\n)\n",
+                "exact": True,
+                "inexact": [],
+            }
+        assert fc.JSX_TO_DSL_CACHE.stats()["hits"] == 1
+
+        custom = tmp_path / "custom.jsx"
+        custom.write_text(fc.dsl_to_jsx("t(a)\nmec{price=9/month}\n"), encoding="utf-8")
+        for _ in range(2):
+            resp = await client.post("/api/fe-translate/from-s", json={"code_path": str(custom)})
+            body = resp.json()
+            assert body["tokens"] == ["t", "mec"]
+            assert body["exact"] is False and body["inexact"] == [1]
+
+        empty = tmp_path / "empty.jsx"
+        empty.write_text("export default function X() { return null; }\n", encoding="utf-8")
+        resp = await client.post(
+            "/api/fe-translate/from-s-batch",
+            json={"jobs": [{"code_path": str(code)}, {"code_path": str(empty)}]},
+        )
+        results = resp.json()["results"]
+        assert results[0]["tokens"] == ["t", "t", "c", "t"] and results[0]["exact"]
+        assert results[1]["error"]["code"] == "invalid_code_format"
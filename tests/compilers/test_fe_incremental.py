@@ -0,0 +1,89 @@
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+PAGE = "\n".join(
+    [
+        "// Landing page",
+        "n(Home,About)",
+        "t(Intro)",
+        "c(",
+        "  t(Inner)",
+        "  f(i(email,label=Email) b(Save){onClick=save})",
+        "){class=mt-4}",
+        "img(logo.png){alt=Logo}",
+        "sel(One,Two)",
+    ]
+)
+
+
+def test_incremental_matches_full_compile_across_edits():
+    fc = _fc()
+    compiler = fc.IncrementalCompiler(component_name="Page")
+    edits = [
+        PAGE,
+        PAGE.replace("t(Intro)", "t(Intro!)"),
+        PAGE.replace("t(Inner)", "t(Inner)\n  t(Added)"),
+        PAGE.replace("sel(One,Two)", ""),
+        PAGE + "\n# trailing comment\nt(Last) t(Same line)",
+        "",
+        PAGE,
+    ]
+    for source in edits:
+        assert compiler.compile(source) == fc.dsl_to_jsx(source, component_name="Page")
+
+
+def test_incremental_only_renders_changed_statements():
+    fc = _fc()
+    compiler = fc.IncrementalCompiler(include_imports=False)
+    compiler.compile(PAGE)
+    rendered = compiler.stats["rendered"]
+    compiler.compile(PAGE.replace("t(Intro)", "t(Intro, edited)"))
+    assert compiler.stats["incremental"] == 1
+    assert compiler.stats["rendered"] == rendered + 1
+
+
+def test_incremental_falls_back_when_edit_joins_previous_statement():
+    fc = _fc()
+    compiler = fc.IncrementalCompiler(include_imports=False)
+    compiler.compile("t(A)\nb(Go)\nt(B)")
+    # Props on their own line attach to the statement above
+    source = "t(A)\nb(Go)\n{onClick=go}\nt(B)"
+    assert compiler.compile(source) == fc.dsl_to_jsx(source, include_imports=False)
+    assert compiler.stats["full"] == 2
+
+
+def test_incremental_compiler_shared_between_threads():
+    fc = _fc()
+    compiler = fc.IncrementalCompiler(component_name="Page")
+    sources = [
+        PAGE,
+        PAGE.replace("t(Intro)", "t(Intro, longer now)"),
+        PAGE.replace("t(Inner)", "t(Inner)\n  t(Added)\n  t(More)"),
+        "t(Short)\n" + PAGE,
+    ]
+    expected = {s: fc.dsl_to_jsx(s, component_name="Page") for s in sources}
+    jobs = sources * 50
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(compiler.compile, jobs))
+    assert all(out == expected[src] for src, out in zip(jobs, results))
+
+
+def test_incremental_recompiles_after_register_component(monkeypatch):
+    fc = _fc()
+    monkeypatch.setattr(fc, "COMPONENT_REGISTRY", dict(fc.COMPONENT_REGISTRY))
+    monkeypatch.setattr(fc, "PURE_COMPONENTS", set(fc.PURE_COMPONENTS))
+    monkeypatch.setattr(fc, "_RUNTIME_COMPONENTS", {})
+    monkeypatch.setattr(fc, "PREFAB_REGISTRY_VERSION", fc.PREFAB_REGISTRY_VERSION)
+    compiler = fc.IncrementalCompiler(include_imports=False)
+    source = "t(hello)\nt(world)\n"
+    compiler.compile(source)
+
+    fc.register_component("t", lambda args, props: f"<em>{args}</em>")
+    source += "t(again)\n"
+    assert compiler.compile(source) == fc.dsl_to_jsx(source, include_imports=False)
+    assert "<em>hello</em>" in compiler.compile(source)
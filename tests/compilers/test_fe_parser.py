@@ -0,0 +1,92 @@
+import importlib
+
+import pytest
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+def _tree(nodes):
+    return [(n.token, n.args, n.props, _tree(n.children)) for n in nodes]
+
+
+def test_parse_nested_containers_and_props():
+    fc = _fc()
+    nodes = fc.parse_dsl(
+        "c(\n  h(Welcome)\n  c(t(Inner)){class=mt-4}\n  f(i(name,label=Name) b(Save){onClick=save})\n)"
+    )
+    assert _tree(nodes) == [
+        ("c", None, {}, [
+            ("h", "Welcome", {}, []),
+            ("c", None, {"class": "mt-4"}, [("t", "Inner", {}, [])]),
+            ("f", None, {}, [
+                ("i", "name,label=Name", {}, []),
+                ("b", "Save", {"onClick": "save"}, []),
+            ]),
+        ])
+    ]
+
+
+def test_parse_leaf_args_keep_nested_dsl_text():
+    fc = _fc()
+    nodes = fc.parse_dsl("ho(h(Title),t(Sub (beta)),b(Go)){variant=dark}")
+    assert _tree(nodes) == [
+        ("ho", "h(Title),t(Sub (beta)),b(Go)", {"variant": "dark"}, [])
+    ]
+
+
+def test_parse_comments_and_crlf():
+    fc = _fc()
+    src = "// header\r\nh(A)\r\n  # note\r\nt(line one\r\n// dropped\r\nline two)\r\nt(http://x)\r\n"
+    assert _tree(fc.parse_dsl(src)) == [
+        ("h", "A", {}, []),
+        ("t", "line one\nline two", {}, []),
+        ("t", "http://x", {}, []),
+    ]
+
+
+def test_parse_stops_at_unparsable_statement():
+    fc = _fc()
+    assert _tree(fc.parse_dsl("h(A)\n123\nt(B)")) == [("h", "A", {}, [])]
+    # Inside a container the rest of its body is skipped
+    assert _tree(fc.parse_dsl("c(h(A) 9 t(B)) t(C)")) == [
+        ("c", None, {}, [("h", "A", {}, [])]),
+        ("t", "C", {}, []),
+    ]
+
+
+@pytest.mark.parametrize("src", ["h(x", "c(h(x)", "b(x){a=1", "c(t(x) ?"])
+def test_parse_unbalanced_raises(src):
+    fc = _fc()
+    with pytest.raises(fc.ParseError):
+        fc.parse_dsl(src)
+
+
+def test_parse_deep_nesting():
+    fc = _fc()
+    depth = 300
+    nodes = fc.parse_dsl("c(" * depth + "t(x)" + ")" * depth)
+    for _ in range(depth):
+        assert nodes[0].token == "c"
+        nodes = nodes[0].children
+    assert _tree(nodes) == [("t", "x", {}, [])]
+
+
+def test_nodes_are_slotted_with_shared_empties_and_spans():
+    fc = _fc()
+    src = "h(A)  \nc(\n  t(x){a=1}\n)\nb"
+    h, c, b = fc.parse_dsl(src)
+    assert not hasattr(h, "__dict__")
+    assert h.props is b.props and h.children is b.children
+    assert [src[n.start:n.end] for n in (h, c, b)] == ["h(A)", "c(\n  t(x){a=1}\n)", "b"]
+    (t,) = c.children
+    assert src[t.start:t.end] == "t(x){a=1}"
+
+
+def test_unbalanced_error_reports_position():
+    fc = _fc()
+    with pytest.raises(fc.ParseError) as info:
+        fc.parse_dsl("t(ok)\n  c(h(x)")
+    assert info.value.pos == 9
+    assert "line 2, column 4" in str(info.value)
@@ -0,0 +1,68 @@
+import importlib
+import os
+import sys
+
+from sevdo_frontend import prefab_registry as pr
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+def test_manifest_reads_tokens_without_importing(tmp_path, monkeypatch):
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "alpha.py").write_text(
+        'raise RuntimeError("must not be imported")\n'
+        "def render_prefab(args, props):\n    return ''\n"
+        'COMPONENT_TOKEN = "old"\nCOMPONENT_TOKEN = "al"\nCOMPONENT_PURE = True\n'
+    )
+    (tmp_path / "helper.py").write_text("X = 1\n")
+    entries = {e.file: e for e in pr.prefab_manifest(tmp_path)}
+    assert set(entries) == {"alpha.py", "helper.py"}
+    assert entries["alpha.py"].token == "al" and entries["alpha.py"].pure
+    assert entries["alpha.py"].module == "sevdo_frontend.prefabs.alpha"
+    assert entries["helper.py"].token is None
+    assert (tmp_path / pr.MANIFEST_NAME).exists()
+
+    # A valid manifest is reused; only files whose mtime/size changed are rescanned
+    scanned = []
+    real_scan = pr._scan
+
+    def counting_scan(path, st):
+        scanned.append(path.name)
+        return real_scan(path, st)
+
+    monkeypatch.setattr(pr, "_scan", counting_scan)
+    pr.prefab_manifest(tmp_path)
+    assert scanned == []
+    (tmp_path / "helper.py").write_text(
+        "def render_prefab(args, props):\n    return ''\nCOMPONENT_TOKEN = 'hp'\n"
+    )
+    st = (tmp_path / "helper.py").stat()
+    os.utime(tmp_path / "helper.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    entries = {e.file: e for e in pr.prefab_manifest(tmp_path)}
+    assert scanned == ["helper.py"]
+    assert entries["helper.py"].token == "hp" and not entries["helper.py"].pure
+
+
+def test_prefabs_load_lazily_as_package_modules():
+    fc = _fc()
+    fc.load_prefabs()
+    assert isinstance(fc.COMPONENT_REGISTRY["qa"], fc._LazyPrefab)
+    for stem in ("qa", "mec", "prc"):
+        assert stem not in sys.modules
+    assert sys.modules["frontend_compiler"] is fc
+
+    jsx = fc.dsl_to_jsx("qa(x)", include_imports=False)
+    assert jsx.strip()
+    assert "sevdo_frontend.prefabs.qa" in sys.modules
+    assert not isinstance(fc.COMPONENT_REGISTRY["qa"], fc._LazyPrefab)
+
+
+def test_prefab_that_fails_to_import_falls_back_to_builtin(monkeypatch):
+    fc = _fc()
+    monkeypatch.setitem(
+        fc.COMPONENT_REGISTRY, "t", fc._LazyPrefab("t", "sevdo_frontend.prefabs.missing")
+    )
+    assert fc._jsx_for_token("t", "Hello", {}) == "<p>Hello</p>"
+    assert "t" not in fc.COMPONENT_REGISTRY
@@ -0,0 +1,89 @@
+import importlib
+import io
+
+import httpx
+import pytest
+
+PAGE = (
+    "c{class=mt-2}(h(Title) t(Welcome) f(i(email,label=Email) b(Go){onClick=go}))\n"
+    "n(Home,About)"
+)
+
+
+def _fc():
+    return importlib.import_module("sevdo_frontend.frontend_compiler")
+
+
+def test_streamed_chunks_match_dsl_to_jsx():
+    fc = _fc()
+    for include_imports in (True, False):
+        expected = fc.dsl_to_jsx(PAGE, include_imports, "Page")
+        assert "".join(fc.iter_jsx(PAGE, include_imports, "Page")) == expected
+        out = io.StringIO()
+        assert fc.write_jsx(PAGE, out, include_imports, "Page") == len(expected)
+        assert out.getvalue() == expected
+    assert fc.dsl_to_jsx("", False) == "<>\n\n</>\n"
+
+
+def test_render_is_not_limited_by_recursion_depth():
+    fc = _fc()
+    depth = 900
+    jsx = fc.dsl_to_jsx("c(" * depth + "t(x)" + ")" * depth, include_imports=False)
+    assert jsx.count("</div>") == depth
+    assert "  " * (depth + 1) + "<p>x</p>" in jsx
+
+
+def test_builtin_args_are_parsed_once_at_parse_time(monkeypatch):
+    fc = _fc()
+    assert set(fc.BUILTIN_RENDERERS) == fc.BUILTIN_TOKENS
+    nodes = fc.parse_dsl("n( Home, ,About )\nsel(a,b)\ni(email,label=Email)\nt")
+    assert [n.parsed for n in nodes] == [("Home", "About"), ("a", "b"), ("email", {"label": "Email"}), ""]
+    monkeypatch.setattr(fc, "COMPONENT_REGISTRY", {})
+    expected = [fc._jsx_for_token(n.token, n.args, n.props) for n in nodes]
+
+    def no_parse(args):
+        raise AssertionError("args parsed again at render time")
+
+    table = {
+        token: fc.BuiltinRenderer(no_parse, renderer.render)
+        for token, renderer in fc.BUILTIN_RENDERERS.items()
+    }
+    monkeypatch.setattr(fc, "BUILTIN_RENDERERS", table)
+    assert [fc._jsx_for_node(n) for n in nodes] == expected
+    assert expected[0] == (
+        '<nav className="flex gap-2">'
+        '<a className="px-3 py-2 hover:underline" href="#">Home</a>'
+        '<a className="px-3 py-2 hover:underline" href="#">About</a></nav>'
+    )
+
+
+@pytest.mark.anyio
+async def test_stream_endpoint_and_streamed_file_write(tmp_path):
+    fc = _fc()
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        body = {"dsl_content": PAGE, "component_name": "Page", "use_cache": False}
+        resp = await client.post("/api/fe-translate/to-s-stream", json=body)
+        assert resp.status_code == 200
+        assert resp.text == fc.dsl_to_jsx(PAGE, True, "Page")
+
+        bad = dict(body, dsl_content="c(t(ok) zz(nope))")
+        resp = await client.post("/api/fe-translate/to-s-stream", json=bad)
+        assert resp.status_code == 400
+        assert "Unknown token: zz" in resp.json()["detail"]["error"]
+
+        inp, out = tmp_path / "in.s", tmp_path / "out.jsx"
+        inp.write_text(PAGE, encoding="utf-8")
+        req = {
+            "input_path": str(inp),
+            "output_path": str(out),
+            "component_name": "Page",
+            "use_cache": False,
+            "return_code": False,
+        }
+        first = (await client.post("/api/fe-translate/to-s", json=req)).json()
+        second = (await client.post("/api/fe-translate/to-s", json=req)).json()
+        assert "code" not in first and first["changed"] and not second["changed"]
+        assert out.read_text(encoding="utf-8") == fc.dsl_to_jsx(PAGE, True, "Page")
+        assert first["bytes"] == second["bytes"] == len(out.read_text(encoding="utf-8"))
+        assert not [p for p in tmp_path.iterdir() if p.suffix == ".tmp"]
@@ -0,0 +1,84 @@
+import httpx
+import pytest
+
+from sevdo_frontend import frontend_compiler as fc
+
+PAGES = {
+    "home": "n(Home,About)\nt(Welcome)\nc(t(Shared block))\nt(Footer)\n",
+    "about-us": "n(Home,About)\nt(About us)\nc(t(Shared block))\nt(Footer)\n",
+    "contact": "n(Home,About)\nf(i(email,label=Email) b(Send))\nt(Footer)\n",
+}
+
+
+def test_template_shares_chrome_and_renders_each_statement_once():
+    build = fc.compile_template(PAGES)
+    assert build.layout == "Layout.jsx"
+    assert list(build.files) == ["Layout.jsx", "Home.jsx", "AboutUs.jsx", "Contact.jsx"]
+    assert build.shared == (1, 1)
+    assert build.statements == 11
+    # nav, footer, the shared container and the three page-specific lines
+    assert build.rendered == 6
+
+    layout = build.files["Layout.jsx"]
+    assert "export default function Layout({ children })" in layout
+    assert "<nav" in layout and "{children}" in layout and "Footer" in layout
+    page = build.files["AboutUs.jsx"]
+    assert "import Layout from './Layout';" in page
+    assert "export default function AboutUsPage()" in page
+    assert "<nav" not in page and "Footer" not in page
+
+
+def test_layout_plus_page_body_equals_single_page_compile():
+    build = fc.compile_template(PAGES, include_imports=False)
+    for name, source in PAGES.items():
+        body = build.files[fc._component_identifier(name) + ".jsx"]
+        inner = body[len("<>\n"): -len("\n</>\n")]
+        assembled = build.files["Layout.jsx"].replace("  {children}", inner)
+        assert assembled == fc.dsl_to_jsx(source, include_imports=False)
+
+
+def test_template_without_shared_statements_has_no_layout():
+    build = fc.compile_template({"a": "t(A)\n", "b": "t(B)\n"})
+    assert build.layout is None
+    assert build.files["A.jsx"] == fc.dsl_to_jsx("t(A)\n", component_name="APage")
+
+
+def test_template_errors_name_the_page():
+    with pytest.raises(fc.ParseError, match="^broken: "):
+        fc.compile_template({"ok": "t(A)\n", "broken": "nosuchtoken\n"})
+
+
+@pytest.mark.anyio
+async def test_to_s_template_writes_all_files(tmp_path):
+    src = tmp_path / "frontend"
+    out = tmp_path / "out"
+    src.mkdir()
+    out.mkdir()
+    for name, source in PAGES.items():
+        (src / f"{name}.s").write_text(source, encoding="utf-8")
+    transport = httpx.ASGITransport(app=fc.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        body = {"input_dir": str(src), "output_dir": str(out)}
+        resp = await client.post("/api/fe-translate/to-s-template", json=body)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert data["layout"] == "Layout.jsx"
+        assert data["shared"] == {"before": 1, "after": 1}
+        assert [f["changed"] for f in data["files"]] == [True] * 4
+        assert (out / "Contact.jsx").read_text(encoding="utf-8").startswith("import React")
+
+        resp = await client.post("/api/fe-translate/to-s-template", json=body)
+        assert [f["changed"] for f in resp.json()["files"]] == [False] * 4
+
+        (src / "broken.s").write_text("nosuchtoken\n", encoding="utf-8")
+        resp = await client.post("/api/fe-translate/to-s-template", json=body)
+        assert resp.status_code == 400
+        assert resp.json()["detail"]["code"] == "frontend_generation_failed"
+        assert not (out / "Broken.jsx").exists()
+
+        resp = await client.post(
+            "/api/fe-translate/to-s-template",
+            json={"input_dir": str(tmp_path / "missing"), "output_dir": str(out)},
+        )
+        assert resp.status_code == 404
+        assert resp.json()["detail"]["code"] == "input_dir_not_found"
@@ -0,0 +1,99 @@
+import threading
+
+import sevdo_common.output_writer as ow
+
+
+def test_unchanged_output_is_skipped_without_reading(tmp_path, monkeypatch):
+    out = tmp_path / "out.jsx"
+    assert ow.write_if_changed(str(out), "<div/>")
+    mtime = out.stat().st_mtime_ns
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("output was read back")
+
+    monkeypatch.setattr(ow, "_file_digest", no_reads)
+    assert not ow.write_if_changed(str(out), "<div/>")
+    assert out.stat().st_mtime_ns == mtime
+    assert ow.write_if_changed(str(out), "<span/>")
+    assert out.read_text(encoding="utf-8") == "<span/>"
+
+
+def test_unknown_or_externally_edited_files_are_compared_by_content(tmp_path):
+    out = tmp_path / "out.jsx"
+    out.write_text("<div/>", encoding="utf-8")
+    # Not in the manifest yet: same bytes, so nothing is rewritten
+    assert not ow.write_if_changed(str(out), "<div/>")
+    # Edited behind our back with the same size: the stale entry is ignored
+    out.write_text("<nav/>", encoding="utf-8")
+    assert ow.write_if_changed(str(out), "<div/>")
+    assert out.read_text(encoding="utf-8") == "<div/>"
+
+
+def test_manifest_is_shared_across_processes(tmp_path, monkeypatch):
+    out = tmp_path / "out.jsx"
+    ow.write_if_changed(str(out), "<div/>")
+    # A fresh process only has the sidecar to go on
+    monkeypatch.setattr(ow, "_MANIFESTS", {})
+    monkeypatch.setattr(ow, "_file_digest", lambda p: "unused")
+    assert not ow.write_if_changed(str(out), "<div/>")
+    assert (tmp_path / ow.MANIFEST_NAME).exists()
+
+
+def test_streamed_writes_match_plain_writes(tmp_path):
+    out = tmp_path / "out.jsx"
+    assert ow.write_chunks_if_changed(str(out), ["<div>", "é", "</div>"]) == (True, 12)
+    assert not ow.write_if_changed(str(out), "<div>é</div>")
+    assert ow.write_chunks_if_changed(str(out), ["<div>é</div>"]) == (False, 12)
+
+
+def test_concurrent_writers_never_interleave(tmp_path):
+    out = tmp_path / "out.jsx"
+    contents = [str(i) * 200_000 for i in range(8)]
+    barrier = threading.Barrier(len(contents))
+
+    def write(content):
+        barrier.wait()
+        for _ in range(5):
+            # Bypass the per-directory lock, as separate processes would
+            ow._replace_atomically(out, [content.encode("utf-8")])
+
+    threads = [threading.Thread(target=write, args=(c,)) for c in contents]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert out.read_text(encoding="utf-8") in contents
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.jsx"]
+
+
+def test_manifest_is_compacted(tmp_path):
+    out = tmp_path / "out.jsx"
+    for i in range(100):
+        ow.write_if_changed(str(out), f"<div>{i}</div>")
+    lines = (tmp_path / ow.MANIFEST_NAME).read_text(encoding="utf-8").splitlines()
+    assert len(lines) < 20
+    assert not ow.write_if_changed(str(out), "<div>99</div>")
+
+
+def test_symlink_target_and_mode_are_kept(tmp_path):
+    real = tmp_path / "real.jsx"
+    real.write_text("<div/>", encoding="utf-8")
+    real.chmod(0o640)
+    link = tmp_path / "link.jsx"
+    link.symlink_to(real)
+    assert ow.write_if_changed(str(link), "<nav/>")
+    assert ow.write_chunks_if_changed(str(link), ["<span/>"]) == (True, 7)
+    assert link.is_symlink() and real.read_text(encoding="utf-8") == "<span/>"
+    assert real.stat().st_mode & 0o777 == 0o640
+
+
+def test_manifests_are_shared_per_directory_and_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(ow, "_MANIFESTS", {})
+    monkeypatch.setattr(ow, "_MANIFESTS_MAX", 2)
+    (tmp_path / "out").mkdir()
+    monkeypatch.chdir(tmp_path)
+    assert ow._manifest_for(ow.Path("out")) is ow._manifest_for(ow.Path("./out/"))
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        ow.write_if_changed(str(tmp_path / name / "x.jsx"), "<div/>")
+    assert list(ow._MANIFESTS) == [tmp_path.resolve() / "b", tmp_path.resolve() / "c"]